@@ -0,0 +1,116 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import contextlib
+import hashlib
+from collections.abc import Callable, Hashable
+from threading import RLock
+from typing import Annotated
+
+from cachetools import LRUCache
+from fastapi import Depends, Request, Response, status
+
+from airflow import __version__ as airflow_version
+from airflow.configuration import conf
+
+
+class ResponseCache:
+    """
+    LRU cache of JSON response bodies that only depend on a key, bounded by their total size.
+
+    This is meant for responses computed from immutable inputs only, such as serialized Dag versions and the
+    request parameters: as the same key always gives the same response, the ETag of a response is derived
+    from its key, and a client sending it back in ``If-None-Match`` is answered with ``304 Not Modified``
+    without the response being computed or even looked up.
+
+    :param max_bytes: Total size of the response bodies kept; 0 disables caching, but ETags are still used.
+
+    :meta private:
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self._cache: LRUCache[Hashable, bytes] | None = (
+            LRUCache(maxsize=max_bytes, getsizeof=len) if max_bytes > 0 else None
+        )
+        # cachetools caches are not thread-safe, and sync routes run in a thread pool
+        self._lock = RLock()
+
+    @staticmethod
+    def etag(key: Hashable) -> str:
+        """Return the ETag of the response for the given key."""
+        # The version is part of it as the same key may give a different response once Airflow is upgraded
+        digest = hashlib.sha256(repr((airflow_version, key)).encode()).hexdigest()
+        return f'"{digest[:32]}"'
+
+    def get(self, key: Hashable) -> bytes | None:
+        if self._cache is None:
+            return None
+        with self._lock:
+            return self._cache.get(key)
+
+    def set(self, key: Hashable, body: bytes) -> None:
+        if self._cache is None:
+            return
+        # A body larger than the whole cache is served without being cached
+        with self._lock, contextlib.suppress(ValueError):
+            self._cache[key] = body
+
+    def clear(self) -> None:
+        if self._cache is None:
+            return
+        with self._lock:
+            self._cache.clear()
+
+    def respond(self, request: Request, key: Hashable, compute: Callable[[], bytes]) -> Response:
+        """
+        Respond with the JSON body for ``key``, computing it with ``compute`` if it isn't cached.
+
+        The response carries the ETag of the key, and ``Cache-Control: no-cache`` so clients revalidate it
+        on each use; if the request's ``If-None-Match`` already holds that ETag, the response is a 304.
+        """
+        etag = self.etag(key)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        body = self.get(key)
+        if body is None:
+            body = compute()
+            self.set(key, body)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, as proxies compressing the response may have made the ETag weak
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def create_response_cache() -> ResponseCache:
+    """Create the response cache of the API server, sized by ``[api] response_cache_size_mb``."""
+    return ResponseCache(max(conf.getint("api", "response_cache_size_mb", fallback=64), 0) * 1024 * 1024)
+
+
+def response_cache_from_app(request: Request) -> ResponseCache:
+    """FastAPI dependency resolver that returns the shared response cache from app.state."""
+    return request.app.state.response_cache
+
+
+ResponseCacheDep = Annotated[ResponseCache, Depends(response_cache_from_app)]
@@ -17,13 +17,15 @@
 
 from __future__ import annotations
 
+import itertools
 from collections.abc import Generator, Iterable
 from typing import TYPE_CHECKING, Annotated, Any
 from uuid import UUID
 
 import structlog
-from fastapi import Depends, HTTPException, Query, status
+from fastapi import Depends, HTTPException, Query, Request, Response, status
 from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy import exists, select
 from sqlalchemy.orm import Session, joinedload, load_only
 
@@ -44,6 +46,7 @@ from airflow.api_fastapi.common.parameters import (
     SortParam,
     datetime_range_filter_factory,
 )
+from airflow.api_fastapi.common.response_cache import ResponseCacheDep
 from airflow.api_fastapi.common.router import AirflowRouter
 from airflow.api_fastapi.core_api.datamodels.ui.common import (
     GridNodeResponse,
@@ -55,8 +58,8 @@ from airflow.api_fastapi.core_api.datamodels.ui.grid import (
 from airflow.api_fastapi.core_api.openapi.exceptions import create_openapi_http_exception_doc
 from airflow.api_fastapi.core_api.security import requires_access_dag
 from airflow.api_fastapi.core_api.services.ui.grid import (
+    GridAggregationPlan,
     GridNodeAgg,
-    _find_aggregates,
     _get_aggs_for_node,
     _merge_node_dicts,
 )
@@ -64,6 +67,7 @@ from airflow.api_fastapi.core_api.services.ui.task_group import (
     get_task_group_children_getter,
     task_group_to_dict_grid,
 )
+from airflow.configuration import conf
 from airflow.models.dag_version import DagVersion
 from airflow.models.dagrun import DagRun
 from airflow.models.deadline import Deadline
@@ -78,6 +82,12 @@ if TYPE_CHECKING:
 log = structlog.get_logger(logger_name=__name__)
 grid_router = AirflowRouter(prefix="/grid", tags=["Grid"])
 
+# How many runs the TI summary stream fetches the task instances of in a single query. The session is closed
+# between batches, so a slow client does not hold a database connection for the whole stream.
+TI_SUMMARIES_RUNS_PER_QUERY = 20
+
+_GRID_NODES_ADAPTER = TypeAdapter(list[GridNodeResponse])
+
 
 def _get_latest_serdag(dag_id, session):
     serdag = session.scalar(
@@ -128,11 +138,15 @@ def _get_serdag(
         Depends(requires_access_dag(method="GET", access_entity=DagAccessEntity.TASK_INSTANCE)),
         Depends(requires_access_dag(method="GET", access_entity=DagAccessEntity.RUN)),
     ],
+    response_model=list[GridNodeResponse],
     response_model_exclude_none=True,
 )
 def get_dag_structure(
+    request: Request,
     dag_id: str,
     session: SessionDep,
+    dag_bag: DagBagDep,
+    response_cache: ResponseCacheDep,
     offset: QueryOffset,
     limit: QueryLimit,
     order_by: Annotated[
@@ -148,26 +162,32 @@ def get_dag_structure(
     include_downstream: QueryIncludeDownstream = False,
     depth: int | None = None,
     root: str | None = None,
-) -> list[GridNodeResponse]:
+) -> Response:
     """Return dag structure for grid view."""
-    latest_serdag = _get_latest_serdag(dag_id, session)
-    latest_dag = latest_serdag.dag
-    latest_serdag_id = latest_serdag.id
-    session.expunge(latest_serdag)  # allow GC of serdag; only latest_dag is needed from here
-
-    # Apply filtering if root task is specified
-    if root:
-        latest_dag = latest_dag.partial_subset(
-            task_ids=root,
-            include_upstream=include_upstream,
-            include_downstream=include_downstream,
-            depth=depth,
+    # The structure merges the latest Dag version with the versions the selected runs ran, so it only
+    # depends on these versions and the filtering parameters, and is served from the response cache.
+    latest = session.execute(
+        select(SerializedDagModel.id, SerializedDagModel.dag_hash, SerializedDagModel.dag_version_id)
+        .where(SerializedDagModel.dag_id == dag_id)
+        .order_by(SerializedDagModel.id.desc())
+        .limit(1)
+    ).one_or_none()
+    if latest is None:
+        raise HTTPException(
+            status.HTTP_404_NOT_FOUND,
+            f"Dag with id {dag_id} was not found",
         )
 
     # Retrieve, sort the previous Dag Runs
     base_query = select(DagRun.id).where(DagRun.dag_id == dag_id)
     # This comparison is to fall back to Dag timetable when no order_by is provided
     if order_by.value == [order_by.get_primary_key_string()]:
+        latest_dag = dag_bag.get_dag(latest.dag_version_id, session=session)
+        if latest_dag is None:
+            raise HTTPException(
+                status.HTTP_404_NOT_FOUND,
+                f"Dag with id {dag_id} was not found",
+            )
         ordering = list(latest_dag.timetable.run_ordering)
         order_by = SortParam(
             allowed_attrs=ordering,
@@ -179,45 +199,78 @@ def get_dag_structure(
         offset=offset,
         filters=[run_after, run_type, state, triggering_user, triggering_user_prefix],
         limit=limit,
+        return_total_entries=False,
     )
     run_ids = list(session.scalars(dag_runs_select_filter))
 
-    task_group_sort = get_task_group_children_getter()
-    if not run_ids:
-        nodes = [task_group_to_dict_grid(x) for x in task_group_sort(latest_dag.task_group)]
-        return [GridNodeResponse(**n) for n in nodes]
+    # The serialized Dag of a version may be updated in place until it has task instances, so the versions
+    # are identified by their hash as well.
+    versions = [(latest.id, latest.dag_hash)]
+    if run_ids:
+        versions += session.execute(
+            select(SerializedDagModel.id, SerializedDagModel.dag_hash)
+            .where(
+                # Even though dag_id is filtered in base_query,
+                # adding this line here can improve the performance of this endpoint
+                SerializedDagModel.dag_id == dag_id,
+                SerializedDagModel.id != latest.id,
+                SerializedDagModel.dag_version_id.in_(
+                    select(TaskInstance.dag_version_id)
+                    .join(TaskInstance.dag_run)
+                    .where(
+                        DagRun.id.in_(run_ids),
+                    )
+                    .distinct()
+                ),
+            )
+            .order_by(SerializedDagModel.id.desc())
+        ).all()
+
+    key = (
+        "grid_structure",
+        tuple((id_, dag_hash) for id_, dag_hash in versions),
+        root,
+        include_upstream,
+        include_downstream,
+        depth,
+        conf.get("api", "grid_view_sorting_order"),
+    )
+    return response_cache.respond(
+        request,
+        key,
+        lambda: _GRID_NODES_ADAPTER.dump_json(
+            _merge_grid_structure(
+                session, [id_ for id_, _ in versions], root, include_upstream, include_downstream, depth
+            ),
+            exclude_none=True,
+        ),
+    )
+
 
-    # Process and merge the latest serdag first
+def _merge_grid_structure(
+    session: Session,
+    serdag_ids: list[UUID],
+    root: str | None,
+    include_upstream: bool,
+    include_downstream: bool,
+    depth: int | None,
+) -> list[GridNodeResponse]:
+    """Merge the grid nodes of the given serialized Dags, the latest one first."""
     merged_nodes: list[dict[str, Any]] = []
-    nodes = [task_group_to_dict_grid(x) for x in task_group_sort(latest_dag.task_group)]
-    _merge_node_dicts(merged_nodes, nodes)
-    del latest_dag
+    task_group_sort = get_task_group_children_getter()
 
     # Process serdags one by one and merge immediately to reduce memory usage.
     # Use yield_per() for streaming results and expunge each serdag after processing
     # to allow garbage collection and prevent memory buildup in the session identity map.
     serdags_query = (
         select(SerializedDagModel)
-        .where(
-            # Even though dag_id is filtered in base_query,
-            # adding this line here can improve the performance of this endpoint
-            SerializedDagModel.dag_id == dag_id,
-            SerializedDagModel.id != latest_serdag_id,
-            SerializedDagModel.dag_version_id.in_(
-                select(TaskInstance.dag_version_id)
-                .join(TaskInstance.dag_run)
-                .where(
-                    DagRun.id.in_(run_ids),
-                )
-                .distinct()
-            ),
-        )
+        .where(SerializedDagModel.id.in_(serdag_ids))
+        .order_by(SerializedDagModel.id.desc())
         .execution_options(yield_per=5)  # balance between peak memory usage and round trips
     )
-
     for serdag in session.scalars(serdags_query):
         filtered_dag = serdag.dag
-        # Apply the same filtering to historical Dag versions
+        # Apply filtering if root task is specified
         if root:
             filtered_dag = filtered_dag.partial_subset(
                 task_ids=root,
@@ -359,6 +412,7 @@ def _build_ti_summaries(
     session: Session,
     *,
     dag_bag: DBDagBag,
+    plans: dict[UUID | None, GridAggregationPlan | None] | None = None,
 ) -> dict[str, Any] | None:
     ti_details: dict[str, GridNodeAgg] = {}
     dag_version_id = None
@@ -377,23 +431,21 @@ def _build_ti_summaries(
     if not ti_details:
         return None
 
-    serdag = _get_serdag(dag_bag, dag_id, dag_version_id, session)
+    if plans is None:
+        plans = {}
+    if dag_version_id not in plans:
+        serdag = _get_serdag(dag_bag, dag_id, dag_version_id, session)
+        plans[dag_version_id] = GridAggregationPlan.from_task_group(serdag.task_group) if serdag else None
+    plan = plans[dag_version_id]
     if TYPE_CHECKING:
-        assert serdag
+        assert plan
 
     def get_node_summaries() -> Iterable[dict[str, Any]]:
-        yielded_task_ids: set[str] = set()
-        for node, _ in _find_aggregates(
-            node=serdag.task_group,
-            parent_node=None,
-            ti_details=ti_details,
-        ):
-            if node["type"] in {"task", "mapped_task"}:
-                yielded_task_ids.add(node["task_id"])
-                if node["type"] == "task":
-                    node["child_states"] = None
+        for node, _ in plan.aggregate(ti_details):
+            if node["type"] == "task":
+                node["child_states"] = None
             yield node
-        missing_task_ids = set(ti_details.keys()) - yielded_task_ids
+        missing_task_ids = set(ti_details.keys()) - plan.task_ids
         for task_id in sorted(missing_task_ids):
             detail = ti_details[task_id]
             agg = _get_aggs_for_node(detail)
@@ -452,25 +504,34 @@ def get_grid_ti_summaries_stream(
     """
     Stream TI summaries for multiple Dag runs as NDJSON (one JSON line per run).
 
-    Each line is a serialized ``GridTISummaries`` object emitted as soon as that
-    run's task instances have been processed, so the client can render columns
+    Each line is a serialized ``GridTISummaries`` object. Runs are fetched in batches of
+    ``TI_SUMMARIES_RUNS_PER_QUERY``, one query per batch, and the lines of a batch are
+    emitted as soon as it has been processed, so the client can render columns
     progressively without waiting for all runs to complete.
 
     The serialized Dag structure is served from the app-wide ``DBDagBag`` cache
     (keyed by ``dag_version_id``), which avoids repeated deserialization across
-    runs of the same version *and* across requests.
+    runs of the same version *and* across requests. The task group tree of each Dag
+    version is walked once per request, into a ``GridAggregationPlan`` applied to
+    every run of that version.
     """
 
     def _generate() -> Generator[str, None, None]:
-        # Each iteration opens and closes its own DB session so the connection is
-        # released between yields.  This prevents a slow client from holding a
-        # database connection open for the entire stream duration.
+        # The task instances of a batch of runs are fetched in one query, ordered by run, and summarized
+        # run by run. The rows are all fetched before summarizing, as building a summary may need to load
+        # a serialized Dag over the same connection. Each batch opens and closes its own DB session so the
+        # connection is released between yields.  This prevents a slow client from holding a database
+        # connection open for the entire stream duration.
         # See https://github.com/apache/airflow/issues/65010.
-
-        for run_id in run_ids or []:
+        plans: dict[UUID | None, GridAggregationPlan | None] = {}
+        requested = run_ids or []
+        for start in range(0, len(requested), TI_SUMMARIES_RUNS_PER_QUERY):
+            batch = requested[start : start + TI_SUMMARIES_RUNS_PER_QUERY]
+            summaries: dict[str, dict[str, Any] | None] = {}
             with create_session(scoped=False) as session:
                 tis = session.execute(
                     select(
+                        TaskInstance.run_id,
                         TaskInstance.task_id,
                         TaskInstance.state,
                         TaskInstance.dag_version_id,
@@ -480,19 +541,21 @@ def get_grid_ti_summaries_stream(
                     )
                     .outerjoin(DagVersion, TaskInstance.dag_version_id == DagVersion.id)
                     .where(TaskInstance.dag_id == dag_id)
-                    .where(TaskInstance.run_id == run_id)
-                    .order_by(TaskInstance.task_id)
-                    .execution_options(yield_per=1000)
-                )
-                summary = _build_ti_summaries(
-                    dag_id,
-                    run_id,
-                    tis,
-                    session,
-                    dag_bag=dag_bag,
-                )
-            if summary is None:
-                continue
-            yield GridTISummaries.model_validate(summary).model_dump_json() + "\n"
+                    .where(TaskInstance.run_id.in_(batch))
+                    .order_by(TaskInstance.run_id, TaskInstance.task_id)
+                ).all()
+                for run_id, run_tis in itertools.groupby(tis, key=lambda ti: ti.run_id):
+                    summaries[run_id] = _build_ti_summaries(
+                        dag_id,
+                        run_id,
+                        run_tis,
+                        session,
+                        dag_bag=dag_bag,
+                        plans=plans,
+                    )
+            for run_id in batch:
+                if (summary := summaries.get(run_id)) is None:
+                    continue
+                yield GridTISummaries.model_validate(summary).model_dump_json() + "\n"
 
     return StreamingResponse(content=_generate(), media_type="application/x-ndjson")
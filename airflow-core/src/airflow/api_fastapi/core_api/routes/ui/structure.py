@@ -16,13 +16,16 @@
 # under the License.
 from __future__ import annotations
 
-from fastapi import Depends, HTTPException, status
+from typing import TYPE_CHECKING
+
+from fastapi import Depends, HTTPException, Request, Response, status
 from sqlalchemy import select
 from sqlalchemy.orm import joinedload
 
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
 from airflow.api_fastapi.common.db.common import SessionDep
 from airflow.api_fastapi.common.parameters import QueryIncludeDownstream, QueryIncludeUpstream
+from airflow.api_fastapi.common.response_cache import ResponseCacheDep
 from airflow.api_fastapi.common.router import AirflowRouter
 from airflow.api_fastapi.core_api.datamodels.ui.structure import StructureDataResponse
 from airflow.api_fastapi.core_api.openapi.exceptions import create_openapi_http_exception_doc
@@ -37,6 +40,9 @@ from airflow.models.dag_version import DagVersion
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.utils.dag_edges import dag_edges
 
+if TYPE_CHECKING:
+    from airflow.serialization.definitions.dag import SerializedDAG
+
 structure_router = AirflowRouter(tags=["Structure"], prefix="/structure")
 
 
@@ -53,18 +59,21 @@ structure_router = AirflowRouter(tags=["Structure"], prefix="/structure")
         Depends(requires_access_dag("GET", DagAccessEntity.DEPENDENCIES)),
         Depends(requires_access_dag("GET", DagAccessEntity.TASK_INSTANCE)),
     ],
+    response_model=StructureDataResponse,
 )
 def structure_data(
+    request: Request,
     session: SessionDep,
     dag_id: str,
     readable_dags_filter: ReadableDagsFilterDep,
+    response_cache: ResponseCacheDep,
     include_upstream: QueryIncludeUpstream = False,
     include_downstream: QueryIncludeDownstream = False,
     depth: int | None = None,
     root: str | None = None,
     external_dependencies: bool = False,
     version_number: int | None = None,
-) -> StructureDataResponse:
+) -> StructureDataResponse | Response:
     """Get Structure Data."""
     if version_number is None:
         dag_version_model = DagVersion.get_latest_version(dag_id)
@@ -75,6 +84,38 @@ def structure_data(
             )
         version_number = dag_version_model.version_number
 
+    if not external_dependencies:
+        # Without external dependencies, the structure only depends on the Dag version and the parameters,
+        # so it is served from the response cache. The serialized Dag of a version may be updated in place
+        # until it has task instances, hence its hash being part of the key.
+        version = session.execute(
+            select(SerializedDagModel.id, SerializedDagModel.dag_hash)
+            .join(DagVersion)
+            .where(SerializedDagModel.dag_id == dag_id, DagVersion.version_number == version_number)
+        ).one_or_none()
+        if version is None:
+            raise HTTPException(
+                status.HTTP_404_NOT_FOUND,
+                f"Dag with id {dag_id} and version number {version_number} was not found",
+            )
+
+        def _compute() -> bytes:
+            serdag = session.scalar(select(SerializedDagModel).where(SerializedDagModel.id == version.id))
+            # Only external dependencies add edges to assets, so there are no output assets to bind here.
+            nodes, edges = _get_nodes_and_edges(serdag.dag, root, include_upstream, include_downstream, depth)
+            return StructureDataResponse(nodes=nodes, edges=edges).model_dump_json().encode()
+
+        key = (
+            "structure_data",
+            version.id,
+            version.dag_hash,
+            root,
+            include_upstream,
+            include_downstream,
+            depth,
+        )
+        return response_cache.respond(request, key, _compute)
+
     serialized_dag: SerializedDagModel | None = session.scalar(
         select(SerializedDagModel)
         .join(DagVersion)
@@ -86,100 +127,106 @@ def structure_data(
             status.HTTP_404_NOT_FOUND,
             f"Dag with id {dag_id} and version number {version_number} was not found",
         )
-    dag = serialized_dag.dag
-
-    if root:
-        dag = dag.partial_subset(
-            task_ids=root,
-            include_upstream=include_upstream,
-            include_downstream=include_downstream,
-            depth=depth,
-        )
-
-    nodes = [task_group_to_dict(child) for child in dag.task_group.topological_sort()]
-    edges = dag_edges(dag)
+    nodes, edges = _get_nodes_and_edges(serialized_dag.dag, root, include_upstream, include_downstream, depth)
 
     data = {
         "nodes": nodes,
         "edges": edges,
     }
 
-    if external_dependencies:
-        entry_node_ref = nodes[0] if nodes else None
-        exit_node_ref = nodes[-1] if nodes else None
+    entry_node_ref = nodes[0] if nodes else None
+    exit_node_ref = nodes[-1] if nodes else None
 
-        start_edges: list[dict] = []
-        end_edges: list[dict] = []
+    start_edges: list[dict] = []
+    end_edges: list[dict] = []
 
-        readable_dag_ids = readable_dags_filter.value
-        for dependency_dag_id, dependencies in sorted(SerializedDagModel.get_dag_dependencies().items()):
-            if readable_dag_ids is not None and dependency_dag_id not in readable_dag_ids:
+    readable_dag_ids = readable_dags_filter.value
+    for dependency_dag_id, dependencies in sorted(SerializedDagModel.get_dag_dependencies().items()):
+        if readable_dag_ids is not None and dependency_dag_id not in readable_dag_ids:
+            continue
+        for dependency in dependencies:
+            # Dependencies not related to `dag_id` are ignored
+            if dependency_dag_id != dag_id and dependency.target != dag_id:
+                continue
+            # When target is a real Dag ID (not a type label), hide it
+            # if the caller cannot read that Dag.
+            if (
+                readable_dag_ids is not None
+                and dependency.target != dependency.dependency_type
+                and dependency.target not in readable_dag_ids
+            ):
                 continue
-            for dependency in dependencies:
-                # Dependencies not related to `dag_id` are ignored
-                if dependency_dag_id != dag_id and dependency.target != dag_id:
-                    continue
-                # When target is a real Dag ID (not a type label), hide it
-                # if the caller cannot read that Dag.
-                if (
-                    readable_dag_ids is not None
-                    and dependency.target != dependency.dependency_type
-                    and dependency.target not in readable_dag_ids
-                ):
-                    continue
-
-                # upstream assets are handled by the `get_upstream_assets` function.
-                if dependency.target != dependency.dependency_type and dependency.dependency_type in [
-                    "asset-alias",
-                    "asset",
-                ]:
-                    continue
-
-                # Add edges
-                # start dependency
-                if (
-                    dependency.source == dependency.dependency_type or dependency.target == dag_id
-                ) and entry_node_ref:
-                    start_edges.append({"source_id": dependency.node_id, "target_id": entry_node_ref["id"]})
-
-                # end dependency
-                elif (
-                    dependency.target == dependency.dependency_type or dependency.source == dag_id
-                ) and exit_node_ref:
-                    end_edges.append(
-                        {
-                            "source_id": exit_node_ref["id"],
-                            "target_id": dependency.node_id,
-                            "resolved_from_alias": dependency.source.replace("asset-alias:", "", 1)
-                            if dependency.source.startswith("asset-alias:")
-                            else None,
-                        }
-                    )
-
-                # Add nodes
-                nodes.append(
+
+            # upstream assets are handled by the `get_upstream_assets` function.
+            if dependency.target != dependency.dependency_type and dependency.dependency_type in [
+                "asset-alias",
+                "asset",
+            ]:
+                continue
+
+            # Add edges
+            # start dependency
+            if (
+                dependency.source == dependency.dependency_type or dependency.target == dag_id
+            ) and entry_node_ref:
+                start_edges.append({"source_id": dependency.node_id, "target_id": entry_node_ref["id"]})
+
+            # end dependency
+            elif (
+                dependency.target == dependency.dependency_type or dependency.source == dag_id
+            ) and exit_node_ref:
+                end_edges.append(
                     {
-                        "id": dependency.node_id,
-                        "label": dependency.label,
-                        "type": dependency.dependency_type,
+                        "source_id": exit_node_ref["id"],
+                        "target_id": dependency.node_id,
+                        "resolved_from_alias": dependency.source.replace("asset-alias:", "", 1)
+                        if dependency.source.startswith("asset-alias:")
+                        else None,
                     }
                 )
 
-        if (asset_expression := serialized_dag.dag_model.asset_expression) and entry_node_ref:
-            try:
-                upstream_asset_nodes, upstream_asset_edges = get_upstream_assets(
-                    asset_expression, entry_node_ref["id"]
-                )
-            except TypeError as e:
-                raise HTTPException(
-                    status.HTTP_400_BAD_REQUEST,
-                    f"Malformed asset_expression in Dag {dag_id!r} version {version_number}: {e}",
-                ) from e
-            data["nodes"] += upstream_asset_nodes
-            data["edges"] += upstream_asset_edges
+            # Add nodes
+            nodes.append(
+                {
+                    "id": dependency.node_id,
+                    "label": dependency.label,
+                    "type": dependency.dependency_type,
+                }
+            )
 
-        data["edges"] += start_edges + end_edges
+    if (asset_expression := serialized_dag.dag_model.asset_expression) and entry_node_ref:
+        try:
+            upstream_asset_nodes, upstream_asset_edges = get_upstream_assets(
+                asset_expression, entry_node_ref["id"]
+            )
+        except TypeError as e:
+            raise HTTPException(
+                status.HTTP_400_BAD_REQUEST,
+                f"Malformed asset_expression in Dag {dag_id!r} version {version_number}: {e}",
+            ) from e
+        data["nodes"] += upstream_asset_nodes
+        data["edges"] += upstream_asset_edges
+
+    data["edges"] += start_edges + end_edges
 
     bind_output_assets_to_tasks(data["edges"], serialized_dag, version_number, session)
 
     return StructureDataResponse(**data)
+
+
+def _get_nodes_and_edges(
+    dag: SerializedDAG,
+    root: str | None,
+    include_upstream: bool,
+    include_downstream: bool,
+    depth: int | None,
+) -> tuple[list[dict], list[dict]]:
+    if root:
+        dag = dag.partial_subset(
+            task_ids=root,
+            include_upstream=include_upstream,
+            include_downstream=include_downstream,
+            depth=depth,
+        )
+    nodes = [task_group_to_dict(child) for child in dag.task_group.topological_sort()]
+    return nodes, dag_edges(dag)
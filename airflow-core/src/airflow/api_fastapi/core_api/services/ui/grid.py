@@ -27,7 +27,6 @@ import structlog
 
 from airflow.api_fastapi.common.parameters import state_priority
 from airflow.api_fastapi.core_api.services.ui.task_group import get_task_group_children_getter
-from airflow.models.taskmap import TaskMap
 from airflow.serialization.definitions.baseoperator import SerializedBaseOperator
 from airflow.serialization.definitions.mappedoperator import SerializedMappedOperator
 from airflow.serialization.definitions.taskgroup import SerializedTaskGroup
@@ -136,65 +135,82 @@ def _get_aggs_for_node(summary: GridNodeAgg) -> dict[str, Any]:
     }
 
 
-def _find_aggregates(
-    node: SerializedTaskGroup | SerializedBaseOperator | TaskMap,
-    parent_node: SerializedTaskGroup | SerializedBaseOperator | TaskMap | None,
-    ti_details: Mapping[str, GridNodeAgg],
-) -> Iterable[tuple[dict[str, Any], GridNodeAgg]]:
-    """Recursively fill the Task Group Map."""
-    node_id = node.node_id
-    parent_id = parent_node.node_id if parent_node else None
-    # Do not mutate ti_details by accidental key creation
-    summary = ti_details.get(node_id)
-    if summary is None:
-        summary = GridNodeAgg()
-
-    if node is None:
-        return
-    if isinstance(node, SerializedMappedOperator):
-        mapped_summary = summary.with_placeholder_state()
-        yield (
-            {
-                "task_id": node_id,
-                "task_display_name": node.task_display_name,
-                "type": "mapped_task",
-                "parent_id": parent_id,
-                **_get_aggs_for_node(mapped_summary),
-            },
-            mapped_summary,
-        )
-
-        return
-    if isinstance(node, SerializedTaskGroup):
-        children_summary = GridNodeAgg()
-        for child in get_task_group_children_getter()(node):
-            for child_node, child_summary in _find_aggregates(
-                node=child, parent_node=node, ti_details=ti_details
-            ):
-                if child_node["parent_id"] == node_id:
-                    children_summary.merge(child_summary)
-                yield child_node, child_summary
-        if node_id:
+@dataclass(frozen=True)
+class _PlanNode:
+    task_id: str
+    task_display_name: str
+    type: str
+    parent_id: str | None
+    children: tuple[int, ...] = ()
+    """Positions in the plan of the direct children of a group, whose summaries make up its own."""
+
+
+@dataclass(frozen=True)
+class GridAggregationPlan:
+    """
+    The nodes of a Dag's task group tree in the order the grid aggregates them, children before groups.
+
+    Walking (and sorting) the task group tree is the same for every run of a Dag version, so the plan is
+    built once per version and applied to the task instance summaries of each run.
+    """
+
+    nodes: tuple[_PlanNode, ...]
+
+    @property
+    def task_ids(self) -> frozenset[str]:
+        return frozenset(node.task_id for node in self.nodes if node.type in {"task", "mapped_task"})
+
+    @classmethod
+    def from_task_group(cls, task_group: SerializedTaskGroup) -> GridAggregationPlan:
+        """Build the plan of a task group tree."""
+        children_getter = get_task_group_children_getter()
+        nodes: list[_PlanNode] = []
+
+        def add(node: Any, parent_id: str | None) -> int | None:
+            node_id = node.node_id
+            if isinstance(node, SerializedMappedOperator):
+                nodes.append(_PlanNode(node_id, node.task_display_name, "mapped_task", parent_id))
+            elif isinstance(node, SerializedTaskGroup):
+                children = tuple(
+                    position
+                    for child in children_getter(node)
+                    if (position := add(child, node_id)) is not None
+                )
+                if not node_id:
+                    return None
+                nodes.append(_PlanNode(node_id, node_id, "group", parent_id, children))
+            elif isinstance(node, SerializedBaseOperator):
+                nodes.append(_PlanNode(node_id, node.task_display_name, "task", parent_id))
+            else:
+                return None
+            return len(nodes) - 1
+
+        add(task_group, None)
+        return cls(tuple(nodes))
+
+    def aggregate(
+        self, ti_details: Mapping[str, GridNodeAgg]
+    ) -> Iterable[tuple[dict[str, Any], GridNodeAgg]]:
+        """Yield the grid node of each node of the plan, with the summary of the task instances under it."""
+        summaries: list[GridNodeAgg] = []
+        for node in self.nodes:
+            if node.type == "group":
+                summary = GridNodeAgg()
+                for position in node.children:
+                    summary.merge(summaries[position])
+            else:
+                # Do not mutate ti_details by accidental key creation
+                summary = ti_details.get(node.task_id) or GridNodeAgg()
+                if node.type == "mapped_task":
+                    summary = summary.with_placeholder_state()
+            summaries.append(summary)
             yield (
                 {
-                    "task_id": node_id,
-                    "task_display_name": node_id,
-                    "type": "group",
-                    "parent_id": parent_id,
-                    **_get_aggs_for_node(children_summary),
+                    "task_id": node.task_id,
+                    "task_display_name": node.task_display_name,
+                    "type": node.type,
+                    "parent_id": node.parent_id,
+                    **_get_aggs_for_node(summary),
                 },
-                children_summary,
+                summary,
             )
-        return
-    if isinstance(node, SerializedBaseOperator):
-        yield (
-            {
-                "task_id": node_id,
-                "task_display_name": node.task_display_name,
-                "type": "task",
-                "parent_id": parent_id,
-                **_get_aggs_for_node(summary),
-            },
-            summary,
-        )
-        return
@@ -271,6 +271,39 @@ class TIHeartbeatInfo(StrictBaseModel):
     pid: int
 
 
+class TIBulkHeartbeatItem(TIHeartbeatInfo):
+    """The heartbeat of one TaskInstance, sent to the bulk heartbeat endpoint."""
+
+    id: uuid.UUID
+    token: str
+    """The token of the TaskInstance, the heartbeat is only accepted if it was issued for it."""
+
+
+class TIBulkHeartbeatPayload(StrictBaseModel):
+    """Schema for the bulk TaskInstance heartbeat endpoint."""
+
+    heartbeats: list[TIBulkHeartbeatItem]
+
+
+class TIBulkHeartbeatResult(BaseModel):
+    """
+    What became of the heartbeat of one TaskInstance sent to the bulk heartbeat endpoint.
+
+    ``status_code`` and ``detail`` are what the heartbeat endpoint of the TaskInstance would have responded.
+    """
+
+    status_code: int
+    detail: dict[str, Any] | str | None = None
+    refreshed_token: str | None = None
+    """A new token for the TaskInstance, set when the one it sent is about to expire."""
+
+
+class TIBulkHeartbeatResponse(BaseModel):
+    """Response of the bulk TaskInstance heartbeat endpoint."""
+
+    results: dict[uuid.UUID, TIBulkHeartbeatResult]
+
+
 # This model is not used in the API, but it is included in generated OpenAPI schema
 # for use in the client SDKs.
 class TaskInstance(BaseModel):
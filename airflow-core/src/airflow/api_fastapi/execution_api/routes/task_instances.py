@@ -28,7 +28,7 @@ from uuid import UUID
 import attrs
 import structlog
 from cadwyn import VersionedAPIRouter
-from fastapi import Body, HTTPException, Query, Response, Security, status
+from fastapi import Body, Depends, HTTPException, Query, Response, Security, status
 from opentelemetry import trace
 from opentelemetry.trace import StatusCode
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
@@ -43,7 +43,7 @@ from structlog.contextvars import bind_contextvars
 from airflow._shared.observability.traces import override_ids
 from airflow._shared.state import TaskScope
 from airflow._shared.timezones import timezone
-from airflow.api_fastapi.auth.tokens import JWTGenerator
+from airflow.api_fastapi.auth.tokens import JWTGenerator, JWTValidator
 from airflow.api_fastapi.common.dagbag import DagBagDep, get_latest_version_of_dag
 from airflow.api_fastapi.common.db.common import SessionDep
 from airflow.api_fastapi.common.types import UtcDateTime
@@ -56,6 +56,9 @@ from airflow.api_fastapi.execution_api.datamodels.taskinstance import (
     TaskBreadcrumbsResponse,
     TaskStatesResponse,
     TIAwaitingInputStatePayload,
+    TIBulkHeartbeatPayload,
+    TIBulkHeartbeatResponse,
+    TIBulkHeartbeatResult,
     TIDeferredStatePayload,
     TIEnterRunningPayload,
     TIHeartbeatInfo,
@@ -74,6 +77,7 @@ from airflow.api_fastapi.execution_api.security import (
     ExecutionAPIRoute,
     get_team_name_for_ti,
     require_auth,
+    token_is_expiring,
 )
 from airflow.configuration import conf
 from airflow.exceptions import TaskNotFound
@@ -840,7 +844,11 @@ def ti_heartbeat(
         return
 
     log.debug("Heartbeat fast path missed; falling back to diagnostic checks")
+    _ti_heartbeat_slow_path(task_instance_id, ti_payload, session)
 
+
+def _ti_heartbeat_slow_path(task_instance_id: UUID, ti_payload: TIHeartbeatInfo, session: SessionDep) -> None:
+    """Update the heartbeat of a TaskInstance after checking it is running where it says it is."""
     old = select(TI.state, TI.hostname, TI.pid).where(TI.id == task_instance_id).with_for_update()
 
     try:
@@ -910,6 +918,96 @@ def ti_heartbeat(
     log.debug("Heartbeat updated", state=previous_state)
 
 
+async def _validate_heartbeat_tokens(
+    payload: TIBulkHeartbeatPayload, services=DepContainer
+) -> dict[UUID, dict[str, Any] | None]:
+    """Validate the token of each heartbeat of a bulk heartbeat, returning its claims, or None if invalid."""
+    validator: JWTValidator = await services.aget(JWTValidator)
+    claims: dict[UUID, dict[str, Any] | None] = {}
+    for heartbeat in payload.heartbeats:
+        try:
+            claims[heartbeat.id] = await validator.avalidated_claims(heartbeat.token, {})
+        except Exception:
+            log.warning("Failed to validate the token of a bulk heartbeat", ti_id=str(heartbeat.id))
+            claims[heartbeat.id] = None
+    return claims
+
+
+@router.put(
+    "/heartbeats",
+    status_code=status.HTTP_200_OK,
+    responses=create_openapi_http_exception_doc(
+        [(HTTP_422_UNPROCESSABLE_CONTENT, "Invalid payload for the bulk heartbeat")]
+    ),
+)
+def ti_bulk_heartbeat(
+    payload: TIBulkHeartbeatPayload,
+    claims: Annotated[dict[UUID, dict[str, Any] | None], Depends(_validate_heartbeat_tokens)],
+    session: SessionDep,
+    services=DepContainer,
+) -> TIBulkHeartbeatResponse:
+    """
+    Update the heartbeats of several TaskInstances at once.
+
+    This lets a worker send the heartbeats of all the tasks it runs in one request. Each heartbeat carries the
+    token of its TaskInstance, and is only accepted if the token was issued for it. The heartbeats of the
+    TaskInstances still running where they say they are are updated with a single statement; the others go
+    through the same checks as the heartbeat endpoint of a single TaskInstance, and their result holds the
+    status code and detail that endpoint would have responded with.
+    """
+    generator: JWTGenerator = services.get(JWTGenerator)
+
+    heartbeats = {heartbeat.id: heartbeat for heartbeat in payload.heartbeats}
+
+    results: dict[UUID, TIBulkHeartbeatResult] = {}
+    for ti_id, ti_claims in claims.items():
+        if ti_claims is None:
+            results[ti_id] = TIBulkHeartbeatResult(
+                status_code=status.HTTP_403_FORBIDDEN, detail="Invalid auth token"
+            )
+            del heartbeats[ti_id]
+        elif ti_claims.get("sub") != str(ti_id) or ti_claims.get("scope", "execution") != "execution":
+            results[ti_id] = TIBulkHeartbeatResult(
+                status_code=status.HTTP_403_FORBIDDEN, detail="Token subject does not match task instance ID"
+            )
+            del heartbeats[ti_id]
+    if not heartbeats:
+        return TIBulkHeartbeatResponse(results=results)
+
+    running_here = and_(
+        tuple_(TI.id, TI.hostname, TI.pid).in_([(hb.id, hb.hostname, hb.pid) for hb in heartbeats.values()]),
+        TI.state == TaskInstanceState.RUNNING,
+    )
+    updated = cast(
+        "CursorResult[Any]",
+        session.execute(
+            update(TI)
+            .where(running_here)
+            .values(last_heartbeat_at=timezone.utcnow())
+            .execution_options(synchronize_session=False)
+        ),
+    ).rowcount
+    if updated == len(heartbeats):
+        missed: set[UUID] = set()
+    else:
+        missed = set(heartbeats) - set(session.scalars(select(TI.id).where(running_here)))
+    log.debug("Bulk heartbeat updated", heartbeats=len(heartbeats), missed=len(missed))
+
+    for ti_id, heartbeat in heartbeats.items():
+        result = TIBulkHeartbeatResult(status_code=status.HTTP_204_NO_CONTENT)
+        if ti_id in missed:
+            try:
+                _ti_heartbeat_slow_path(
+                    ti_id, TIHeartbeatInfo(hostname=heartbeat.hostname, pid=heartbeat.pid), session
+                )
+            except HTTPException as e:
+                result = TIBulkHeartbeatResult(status_code=e.status_code, detail=e.detail)
+        if result.status_code == status.HTTP_204_NO_CONTENT and token_is_expiring(claims[ti_id]):
+            result.refreshed_token = generator.generate(claims[ti_id])
+        results[ti_id] = result
+    return TIBulkHeartbeatResponse(results=results)
+
+
 @ti_id_router.put(
     "/{task_instance_id}/rtif",
     status_code=status.HTTP_201_CREATED,
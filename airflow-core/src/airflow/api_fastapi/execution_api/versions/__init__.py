@@ -48,6 +48,7 @@ from airflow.api_fastapi.execution_api.versions.v2026_06_16 import (
 )
 from airflow.api_fastapi.execution_api.versions.v2026_06_30 import (
     AddAwaitingInputStatePayload,
+    AddBulkHeartbeatEndpoint,
     AddConnectionTestEndpoint,
     AddTaskInstanceQueueField,
     AddVariableKeysEndpoint,
@@ -61,6 +62,7 @@ bundle = VersionBundle(
         AddConnectionTestEndpoint,
         AddAwaitingInputStatePayload,
         AddTaskInstanceQueueField,
+        AddBulkHeartbeatEndpoint,
     ),
     Version(
         "2026-06-16",
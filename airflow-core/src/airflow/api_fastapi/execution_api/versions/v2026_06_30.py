@@ -64,3 +64,13 @@ class AddAwaitingInputStatePayload(VersionChange):
         schema(TIAwaitingInputStatePayload).field("next_kwargs").didnt_exist,
         schema(TIAwaitingInputStatePayload).field("rendered_map_index").didnt_exist,
     )
+
+
+class AddBulkHeartbeatEndpoint(VersionChange):
+    """Add PUT /task-instances/heartbeats endpoint for sending the heartbeats of several task instances."""
+
+    description = __doc__
+
+    instructions_to_migrate_to_previous_version = (
+        endpoint("/task-instances/heartbeats", ["PUT"]).didnt_exist,
+    )
@@ -17,12 +17,13 @@
 # under the License.
 from __future__ import annotations
 
+from collections import defaultdict
 from collections.abc import Collection, Iterable
 from contextlib import contextmanager
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import structlog
-from sqlalchemy import exc, or_, select
+from sqlalchemy import exc, select, tuple_
 from sqlalchemy.orm import joinedload
 
 from airflow._shared.observability.metrics import stats
@@ -117,6 +118,15 @@ def _lock_asset_model(
         yield
 
 
+class AssetChange(NamedTuple):
+    """A change of an asset to register, see :meth:`AssetManager.register_asset_changes`."""
+
+    asset: SerializedAsset | AssetModel | SerializedAssetUniqueKey
+    extra: dict[str, Any] | None = None
+    source_alias_names: Collection[str] = ()
+    partition_key: str | None = None
+
+
 class AssetManager(LoggingMixin):
     """
     A pluggable class that manages operations for assets.
@@ -155,23 +165,28 @@ class AssetManager(LoggingMixin):
         return [_add_one(a) for a in asset_aliases]
 
     @classmethod
-    def _add_asset_alias_association(
+    def _add_asset_alias_associations(
         cls,
-        alias_names: Collection[str],
-        asset_model: AssetModel,
+        alias_names_by_asset: Iterable[tuple[AssetModel, Collection[str]]],
         *,
         session: Session,
     ) -> None:
-        already_related = {m.name for m in asset_model.aliases}
-        existing_aliases = {
+        alias_names_by_asset = [(am, names) for am, names in alias_names_by_asset if names]
+        if not alias_names_by_asset:
+            return
+        aliases = {
             m.name: m
-            for m in session.scalars(select(AssetAliasModel).where(AssetAliasModel.name.in_(alias_names)))
+            for m in session.scalars(
+                select(AssetAliasModel).where(
+                    AssetAliasModel.name.in_({name for _, names in alias_names_by_asset for name in names})
+                )
+            )
         }
-        asset_model.aliases.extend(
-            existing_aliases.get(name, AssetAliasModel(name=name))
-            for name in alias_names
-            if name not in already_related
-        )
+        for asset_model, alias_names in alias_names_by_asset:
+            already_related = {m.name for m in asset_model.aliases}
+            for name in alias_names:
+                if name not in already_related:
+                    asset_model.aliases.append(aliases.setdefault(name, AssetAliasModel(name=name)))
 
     @classmethod
     def _filter_dags_by_team(
@@ -184,6 +199,7 @@ class AssetManager(LoggingMixin):
         session: Session,
         allow_consumer_teams: list[str] | None = None,
         allow_global_consumers: bool = True,
+        dag_id_to_team: dict[str, str | None] | None = None,
     ) -> set[DagModel]:
         """
         Filter consuming DAGs based on team membership when multi_team is enabled.
@@ -199,6 +215,7 @@ class AssetManager(LoggingMixin):
         :param session: SQLAlchemy session.
         :param allow_consumer_teams: list of team names allowed to consume. None means no team-based filtering. Empty list means allowing only the team the Dag is in (if any).
         :param allow_global_consumers: whether teamless consumers are allowed.
+        :param dag_id_to_team: team names of the consuming DAGs, if already known.
         """
         if not conf.getboolean("core", "multi_team"):
             return dags_to_queue
@@ -210,8 +227,9 @@ class AssetManager(LoggingMixin):
 
         is_teamless_source = len(source_teams) == 0
 
-        dag_ids = [dag.dag_id for dag in dags_to_queue]
-        dag_id_to_team = DagModel.get_dag_id_to_team_name_mapping(dag_ids, session=session)
+        if dag_id_to_team is None:
+            dag_ids = [dag.dag_id for dag in dags_to_queue]
+            dag_id_to_team = DagModel.get_dag_id_to_team_name_mapping(dag_ids, session=session)
 
         # Build per-consumer allow_producer_teams and allow_global_producers from the schedule reference rows.
         dag_id_to_allow_teams: dict[str, list[str]] = {
@@ -304,143 +322,271 @@ class AssetManager(LoggingMixin):
         :param api_allow_global_consumers: Whether teamless consumers are allowed for an
             API-triggered event. Only used when source_is_api=True. Defaults to True.
         """
-        from airflow.models.dag import DagModel
-
-        asset_model: AssetModel | None = session.scalar(
-            select(AssetModel)
-            .where(AssetModel.name == asset.name, AssetModel.uri == asset.uri)
-            .options(
-                joinedload(AssetModel.active),
-                joinedload(AssetModel.aliases),
-                joinedload(AssetModel.scheduled_dags).joinedload(DagScheduleAssetReference.dag),
-            )
+        [asset_event] = cls._register_asset_changes_bulk(
+            task_instance=task_instance,
+            changes=[AssetChange(asset, extra, source_alias_names, partition_key)],
+            session=session,
+            source_is_api=source_is_api,
+            api_user_teams=api_user_teams,
+            api_allow_consumer_teams=api_allow_consumer_teams,
+            api_allow_global_consumers=api_allow_global_consumers,
         )
-        if not asset_model:
-            cls.logger().warning("AssetModel %s not found; cannot create asset event.", asset)
-            return None
+        return asset_event
 
-        if not asset_model.active:
-            cls.logger().warning("Emitting event for inactive AssetModel %s", asset)
+    @classmethod
+    def register_asset_changes(
+        cls,
+        *,
+        task_instance: TaskInstance | None = None,
+        changes: Collection[AssetChange],
+        session: Session,
+        source_is_api: bool = False,
+        api_user_teams: set[str] | None = None,
+        api_allow_consumer_teams: list[str] | None = None,
+        api_allow_global_consumers: bool = True,
+    ) -> list[AssetEvent | None]:
+        """
+        Register several asset related changes at once, as :meth:`register_asset_change` does for one.
 
-        cls._add_asset_alias_association(
-            alias_names=source_alias_names, asset_model=asset_model, session=session
-        )
+        The assets, the Dags consuming them and the events are looked up and written with a constant number
+        of queries, however many changes there are.
 
-        event_kwargs = {
-            "asset_id": asset_model.id,
-            "extra": extra or {},
-            "partition_key": partition_key,
-        }
-        if task_instance:
-            event_kwargs.update(
-                source_task_id=task_instance.task_id,
-                source_dag_id=task_instance.dag_id,
-                source_run_id=task_instance.run_id,
-                source_map_index=task_instance.map_index,
-            )
+        :return: The asset event of each change, in the same order; None when the asset was not found.
+        """
+        if cls.register_asset_change.__func__ is not AssetManager.register_asset_change.__func__:  # type: ignore[attr-defined]
+            # Keep honouring a custom asset manager overriding how a single change is registered
+            return [
+                cls.register_asset_change(
+                    task_instance=task_instance,
+                    asset=change.asset,
+                    extra=change.extra,
+                    source_alias_names=change.source_alias_names,
+                    partition_key=change.partition_key,
+                    session=session,
+                    source_is_api=source_is_api,
+                    api_user_teams=api_user_teams,
+                    api_allow_consumer_teams=api_allow_consumer_teams,
+                    api_allow_global_consumers=api_allow_global_consumers,
+                )
+                for change in changes
+            ]
+        return cls._register_asset_changes_bulk(
+            task_instance=task_instance,
+            changes=changes,
+            session=session,
+            source_is_api=source_is_api,
+            api_user_teams=api_user_teams,
+            api_allow_consumer_teams=api_allow_consumer_teams,
+            api_allow_global_consumers=api_allow_global_consumers,
+        )
 
-        asset_event = AssetEvent(**event_kwargs)
-        session.add(asset_event)
-        session.flush()  # Ensure the event is written earlier than ADRQ entries below.
+    @classmethod
+    def _register_asset_changes_bulk(
+        cls,
+        *,
+        task_instance: TaskInstance | None,
+        changes: Collection[AssetChange],
+        session: Session,
+        source_is_api: bool,
+        api_user_teams: set[str] | None,
+        api_allow_consumer_teams: list[str] | None,
+        api_allow_global_consumers: bool,
+    ) -> list[AssetEvent | None]:
+        from airflow.models.dag import DagModel
 
-        dags_to_queue_from_asset = {ref.dag for ref in asset_model.scheduled_dags if not ref.dag.is_paused}
+        if not changes:
+            return []
 
-        dags_to_queue_from_asset_alias = set()
-        if source_alias_names:
-            asset_alias_models: Iterable[AssetAliasModel] = session.scalars(
-                select(AssetAliasModel)
-                .where(AssetAliasModel.name.in_(source_alias_names))
+        asset_models: dict[tuple[str, str], AssetModel] = {
+            (m.name, m.uri): m
+            for m in session.scalars(
+                select(AssetModel)
+                .where(
+                    tuple_(AssetModel.name, AssetModel.uri).in_(
+                        {(c.asset.name, c.asset.uri) for c in changes}
+                    )
+                )
                 .options(
-                    joinedload(AssetAliasModel.scheduled_dags).joinedload(DagScheduleAssetAliasReference.dag)
+                    joinedload(AssetModel.active),
+                    joinedload(AssetModel.aliases),
+                    joinedload(AssetModel.scheduled_dags).joinedload(DagScheduleAssetReference.dag),
                 )
             ).unique()
+        }
+
+        # The changes whose asset was found, along with the model of the asset
+        found: list[tuple[int, AssetChange, AssetModel]] = []
+        for i, change in enumerate(changes):
+            if (asset_model := asset_models.get((change.asset.name, change.asset.uri))) is None:
+                cls.logger().warning("AssetModel %s not found; cannot create asset event.", change.asset)
+                continue
+            if not asset_model.active:
+                cls.logger().warning("Emitting event for inactive AssetModel %s", change.asset)
+            found.append((i, change, asset_model))
+        if not found:
+            return [None] * len(changes)
+
+        cls._add_asset_alias_associations(
+            ((asset_model, change.source_alias_names) for _, change, asset_model in found), session=session
+        )
+
+        source_kwargs = {}
+        if task_instance:
+            source_kwargs = {
+                "source_task_id": task_instance.task_id,
+                "source_dag_id": task_instance.dag_id,
+                "source_run_id": task_instance.run_id,
+                "source_map_index": task_instance.map_index,
+            }
+        asset_events: list[AssetEvent | None] = [None] * len(changes)
+        for i, change, asset_model in found:
+            asset_events[i] = AssetEvent(
+                asset_id=asset_model.id,
+                extra=change.extra or {},
+                partition_key=change.partition_key,
+                **source_kwargs,
+            )
+        session.add_all(event for event in asset_events if event is not None)
+        session.flush()  # Ensure the events are written earlier than ADRQ entries below.
+
+        alias_names = {name for _, change, _ in found for name in change.source_alias_names}
+        asset_alias_models: dict[str, AssetAliasModel] = {}
+        if alias_names:
+            asset_alias_models = {
+                m.name: m
+                for m in session.scalars(
+                    select(AssetAliasModel)
+                    .where(AssetAliasModel.name.in_(alias_names))
+                    .options(
+                        joinedload(AssetAliasModel.scheduled_dags).joinedload(
+                            DagScheduleAssetAliasReference.dag
+                        )
+                    )
+                ).unique()
+            }
+
+        # Dags scheduled on asset references, by the name or URI they reference
+        dags_by_ref: dict[tuple[str, str], set[DagModel]] = defaultdict(set)
+        for dag, name in session.execute(
+            select(DagModel, DagScheduleAssetNameReference.name)
+            .join(DagModel.schedule_asset_name_references)
+            .where(
+                DagScheduleAssetNameReference.name.in_({m.name for _, _, m in found}),
+                DagModel.is_paused.is_(False),
+            )
+        ):
+            dags_by_ref["name", name].add(dag)
+        for dag, uri in session.execute(
+            select(DagModel, DagScheduleAssetUriReference.uri)
+            .join(DagModel.schedule_asset_uri_references)
+            .where(
+                DagScheduleAssetUriReference.uri.in_({m.uri for _, _, m in found}),
+                DagModel.is_paused.is_(False),
+            )
+        ):
+            dags_by_ref["uri", uri].add(dag)
 
-            for asset_alias_model in asset_alias_models:
+        dags_to_queue_by_change: dict[int, set[DagModel]] = {}
+        for i, change, asset_model in found:
+            asset_event = asset_events[i]
+            if TYPE_CHECKING:
+                assert asset_event is not None
+            dags_to_queue = {ref.dag for ref in asset_model.scheduled_dags if not ref.dag.is_paused}
+            change_alias_models = [
+                asset_alias_models[name] for name in change.source_alias_names if name in asset_alias_models
+            ]
+            for asset_alias_model in change_alias_models:
                 asset_alias_model.asset_events.append(asset_event)
                 session.add(asset_alias_model)
-
-                dags_to_queue_from_asset_alias |= {
+                dags_to_queue |= {
                     alias_ref.dag
                     for alias_ref in asset_alias_model.scheduled_dags
                     if not alias_ref.dag.is_paused
                 }
-        else:
-            asset_alias_models = []
-
-        dags_to_queue_from_asset_ref = set(
-            session.scalars(
-                select(DagModel)
-                .join(DagModel.schedule_asset_name_references, isouter=True)
-                .join(DagModel.schedule_asset_uri_references, isouter=True)
-                .where(
-                    or_(
-                        DagScheduleAssetNameReference.name == asset.name,
-                        DagScheduleAssetUriReference.uri == asset.uri,
-                    ),
-                    DagModel.is_paused.is_(False),
+            dags_to_queue |= dags_by_ref["name", change.asset.name] | dags_by_ref["uri", change.asset.uri]
+            dags_to_queue_by_change[i] = dags_to_queue
+
+            asset = asset_model.to_serialized()
+            cls.notify_asset_changed(asset=asset)
+            cls.nofity_asset_event_emitted(
+                asset_event=ListenerAssetEvent(
+                    asset=asset,
+                    extra=asset_event.extra,
+                    source_dag_id=asset_event.source_dag_id,
+                    source_task_id=asset_event.source_task_id,
+                    source_run_id=asset_event.source_run_id,
+                    source_map_index=asset_event.source_map_index,
+                    source_aliases=[aam.to_serialized() for aam in change_alias_models],
+                    partition_key=change.partition_key,
                 )
             )
-        )
-
-        asset = asset_model.to_serialized()
-        cls.notify_asset_changed(asset=asset)
-        cls.nofity_asset_event_emitted(
-            asset_event=ListenerAssetEvent(
-                asset=asset,
-                extra=asset_event.extra,
-                source_dag_id=asset_event.source_dag_id,
-                source_task_id=asset_event.source_task_id,
-                source_run_id=asset_event.source_run_id,
-                source_map_index=asset_event.source_map_index,
-                source_aliases=[aam.to_serialized() for aam in asset_alias_models],
-                partition_key=partition_key,
-            )
-        )
-
-        stats.incr("asset.updates")
-
-        dags_to_queue = (
-            dags_to_queue_from_asset | dags_to_queue_from_asset_alias | dags_to_queue_from_asset_ref
-        )
+            stats.incr("asset.updates")
 
         if conf.getboolean("core", "multi_team"):
             if task_instance:
                 team_name = DagModel.get_team_name(task_instance.dag_id, session=session)
                 resolved_source_teams = {team_name} if team_name else set()
-                # Resolve consumer-team filtering from the outlet reference
-                outlet_ref = session.scalar(
-                    select(TaskOutletAssetReference).where(
-                        TaskOutletAssetReference.dag_id == task_instance.dag_id,
-                        TaskOutletAssetReference.task_id == task_instance.task_id,
-                        TaskOutletAssetReference.asset_id == asset_model.id,
+                # Resolve consumer-team filtering from the outlet references
+                outlet_refs = {
+                    ref.asset_id: ref
+                    for ref in session.scalars(
+                        select(TaskOutletAssetReference).where(
+                            TaskOutletAssetReference.dag_id == task_instance.dag_id,
+                            TaskOutletAssetReference.task_id == task_instance.task_id,
+                            TaskOutletAssetReference.asset_id.in_({m.id for _, _, m in found}),
+                        )
                     )
-                )
-                resolved_consumer_teams = outlet_ref.allow_consumer_teams if outlet_ref else None
-                resolved_global_consumers = outlet_ref.allow_global_consumers if outlet_ref else True
+                }
             else:
                 resolved_source_teams = api_user_teams or set()
-                resolved_consumer_teams = api_allow_consumer_teams
-                resolved_global_consumers = api_allow_global_consumers
-            dags_to_queue = cls._filter_dags_by_team(
-                dags_to_queue=dags_to_queue,
-                source_teams=resolved_source_teams,
-                asset_model=asset_model,
-                source_is_api=source_is_api,
+            dag_id_to_team = DagModel.get_dag_id_to_team_name_mapping(
+                list({dag.dag_id for dags in dags_to_queue_by_change.values() for dag in dags}),
                 session=session,
-                allow_consumer_teams=resolved_consumer_teams,
-                allow_global_consumers=resolved_global_consumers,
             )
+            for i, _, asset_model in found:
+                if task_instance:
+                    outlet_ref = outlet_refs.get(asset_model.id)
+                    resolved_consumer_teams = outlet_ref.allow_consumer_teams if outlet_ref else None
+                    resolved_global_consumers = outlet_ref.allow_global_consumers if outlet_ref else True
+                else:
+                    resolved_consumer_teams = api_allow_consumer_teams
+                    resolved_global_consumers = api_allow_global_consumers
+                dags_to_queue_by_change[i] = cls._filter_dags_by_team(
+                    dags_to_queue=dags_to_queue_by_change[i],
+                    source_teams=resolved_source_teams,
+                    asset_model=asset_model,
+                    source_is_api=source_is_api,
+                    session=session,
+                    allow_consumer_teams=resolved_consumer_teams,
+                    allow_global_consumers=resolved_global_consumers,
+                    dag_id_to_team=dag_id_to_team,
+                )
 
-        log.debug("asset event added", asset_event=asset_event, dags_to_queue=dags_to_queue)
-        cls._queue_dagruns(
-            asset_id=asset_model.id,
-            dags_to_queue=dags_to_queue,
-            partition_key=partition_key,
-            event=asset_event,
-            task_instance=task_instance,
-            session=session,
-        )
-        return asset_event
+        # Dags queued by a non-partitioned event, as (asset id, dag id) pairs
+        queue_items: set[tuple[int, str]] = set()
+        for i, change, asset_model in found:
+            asset_event = asset_events[i]
+            if TYPE_CHECKING:
+                assert asset_event is not None
+            dags_to_queue = dags_to_queue_by_change[i]
+            log.debug("asset event added", asset_event=asset_event, dags_to_queue=dags_to_queue)
+            if not dags_to_queue:
+                continue
+            partition_dags = [x for x in dags_to_queue if x.timetable_partitioned is True]
+            cls._queue_partitioned_dags(
+                asset_id=asset_model.id,
+                partition_dags=partition_dags,
+                event=asset_event,
+                partition_key=change.partition_key,
+                task_instance=task_instance,
+                session=session,
+            )
+            if change.partition_key is None:
+                queue_items.update(
+                    (asset_model.id, dag.dag_id) for dag in dags_to_queue.difference(partition_dags)
+                )
+        cls._queue_dagruns(queue_items, session=session)
+        return asset_events
 
     @staticmethod
     def notify_asset_created(asset: SerializedAsset):
@@ -475,32 +621,10 @@ class AssetManager(LoggingMixin):
             log.exception("error calling listener")
 
     @classmethod
-    def _queue_dagruns(
-        cls,
-        *,
-        asset_id: int,
-        dags_to_queue: set[DagModel],
-        partition_key: str | None,
-        event: AssetEvent,
-        task_instance: TaskInstance | None,
-        session: Session,
-    ) -> None:
-        log.debug("Dags to queue", dags_to_queue=dags_to_queue)
-        if not dags_to_queue:
-            return None
-
-        partition_dags = [x for x in dags_to_queue if x.timetable_partitioned is True]
-        cls._queue_partitioned_dags(
-            asset_id=asset_id,
-            partition_dags=partition_dags,
-            event=event,
-            partition_key=partition_key,
-            task_instance=task_instance,
-            session=session,
-        )
-
-        non_partitioned_dags = dags_to_queue.difference(partition_dags)  # don't double process
-        if not non_partitioned_dags or partition_key is not None:
+    def _queue_dagruns(cls, queue_items: Collection[tuple[int, str]], *, session: Session) -> None:
+        """Queue runs of the non-partition-aware Dags, given as (asset id, dag id) pairs."""
+        log.debug("Dags to queue", queue_items=queue_items)
+        if not queue_items:
             return None
 
         # Possible race condition: if multiple dags or multiple (usually
@@ -512,8 +636,8 @@ class AssetManager(LoggingMixin):
         # so that the adding of these rows happens in the same transaction
         # where `ti.state` is changed.
         if get_dialect_name(session) == "postgresql":
-            return cls._queue_dagruns_nonpartitioned_postgres(asset_id, non_partitioned_dags, session)
-        return cls._queue_dagruns_nonpartitioned_slow_path(asset_id, non_partitioned_dags, session)
+            return cls._queue_dagruns_nonpartitioned_postgres(queue_items, session)
+        return cls._queue_dagruns_nonpartitioned_slow_path(queue_items, session)
 
     @classmethod
     def _queue_partitioned_dags(
@@ -717,31 +841,46 @@ class AssetManager(LoggingMixin):
 
     @classmethod
     def _queue_dagruns_nonpartitioned_slow_path(
-        cls, asset_id: int, dags_to_queue: set[DagModel], session: Session
+        cls, queue_items: Collection[tuple[int, str]], session: Session
     ) -> None:
-        def _queue_dagrun_if_needed(dag: DagModel) -> str | None:
-            item = AssetDagRunQueue(target_dag_id=dag.dag_id, asset_id=asset_id)
-            # Don't error whole transaction when a single RunQueue item conflicts.
-            # https://docs.sqlalchemy.org/en/14/orm/session_transaction.html#using-savepoint
-            try:
-                with session.begin_nested():
-                    session.merge(item)
-            except exc.IntegrityError:
-                cls.logger().debug("Skipping record %s", item, exc_info=True)
-            return dag.dag_id
-
-        queued_results = (_queue_dagrun_if_needed(dag) for dag in dags_to_queue)
-        if queued_dag_ids := [r for r in queued_results if r is not None]:
-            cls.logger().debug("consuming dag ids %s", queued_dag_ids)
+        existing = set(
+            session.execute(
+                select(AssetDagRunQueue.asset_id, AssetDagRunQueue.target_dag_id).where(
+                    tuple_(AssetDagRunQueue.asset_id, AssetDagRunQueue.target_dag_id).in_(queue_items)
+                )
+            ).tuples()
+        )
+        items = [
+            AssetDagRunQueue(asset_id=asset_id, target_dag_id=dag_id)
+            for asset_id, dag_id in sorted(set(queue_items) - existing)
+        ]
+        if not items:
+            return
+        # Don't error whole transaction when a RunQueue item conflicts.
+        # https://docs.sqlalchemy.org/en/14/orm/session_transaction.html#using-savepoint
+        try:
+            with session.begin_nested():
+                session.add_all(items)
+        except exc.IntegrityError:
+            # Queued concurrently; fall back to queueing the items one at a time.
+            for item in items:
+                try:
+                    with session.begin_nested():
+                        session.merge(
+                            AssetDagRunQueue(asset_id=item.asset_id, target_dag_id=item.target_dag_id)
+                        )
+                except exc.IntegrityError:
+                    cls.logger().debug("Skipping record %s", item, exc_info=True)
+        cls.logger().debug("consuming dag ids %s", sorted({item.target_dag_id for item in items}))
 
     @classmethod
     def _queue_dagruns_nonpartitioned_postgres(
-        cls, asset_id: int, dags_to_queue: set[DagModel], session: Session
+        cls, queue_items: Collection[tuple[int, str]], session: Session
     ) -> None:
         from sqlalchemy.dialects.postgresql import insert
 
-        values = [{"target_dag_id": dag.dag_id} for dag in dags_to_queue]
-        stmt = insert(AssetDagRunQueue).values(asset_id=asset_id).on_conflict_do_nothing()
+        values = [{"asset_id": asset_id, "target_dag_id": dag_id} for asset_id, dag_id in queue_items]
+        stmt = insert(AssetDagRunQueue).on_conflict_do_nothing()
         session.execute(stmt, values)
 
 
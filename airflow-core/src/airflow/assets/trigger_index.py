@@ -0,0 +1,243 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+import structlog
+from sqlalchemy import delete, func, select
+
+from airflow.assets.evaluation import AssetEvaluator
+from airflow.models.asset import AssetDagRunQueue, AssetModel
+from airflow.serialization.definitions.assets import SerializedAssetUniqueKey
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable
+
+    from sqlalchemy.orm import Session
+    from sqlalchemy.sql import ColumnElement
+
+    from airflow.serialization.definitions.assets import SerializedAssetBase
+
+log = structlog.getLogger(__name__)
+
+# Queue rows are fetched again when created up to this long before the newest one already seen, so rows
+# committed by a transaction that started before that one was committed are not missed. ``created_at`` is
+# set by the host queuing the row: rows behind by more than this, because of clock skew between hosts or a
+# longer transaction, are only found by the next full synchronization.
+QUEUE_LOOKBACK = timedelta(minutes=1)
+
+
+class AssetTriggerIndex:
+    """
+    Index of the asset events queued for asset-triggered Dags, to find the Dags due to run.
+
+    A fresh index (or one whose last full synchronization is older than ``resync_interval`` seconds) reads the
+    whole ``AssetDagRunQueue`` table, and evaluates the asset condition of every Dag with queued events, as
+    ``DagModel.dags_needing_dagruns`` used to do on each scheduler loop. Afterwards, only the rows queued since
+    the newest row already seen are read, and only the conditions of the Dags these rows target, or of the
+    Dags found due in the previous pass, are evaluated again -- against their queued rows re-read from the
+    database, as they may have been consumed by another scheduler in the meantime. The conditions are kept
+    along with the hash of the serialized Dag they come from, so a Dag is only deserialized again when a new
+    version of it is serialized.
+
+    The periodic full synchronization bounds how long the index can miss a change that is not a new queue
+    row, such as an asset alias now resolving to an asset with queued events.
+
+    :param resync_interval: How many seconds a full synchronization lasts; 0 synchronizes fully each time.
+
+    :meta private:
+    """
+
+    def __init__(self, resync_interval: float = 0) -> None:
+        self.resync_interval = resync_interval
+        self._last_full_sync: float | None = None
+        self._watermark: datetime | None = None
+        # Queue rows seen per Dag, as (asset id, created at) pairs
+        self._queued: dict[str, set[tuple[int, datetime]]] = {}
+        # Asset condition per Dag, with the hash of the serialized Dag they come from
+        self._conditions: dict[str, tuple[str, SerializedAssetBase]] = {}
+        # Dags evaluated again on each pass: those found due, and those not serialized yet
+        self._due: set[str] = set()
+        self._unserialized: set[str] = set()
+
+    def triggered_dates(self, session: Session) -> dict[str, datetime]:
+        """
+        Return the Dags whose asset condition is met by their queued asset events, and when they were met.
+
+        Queue rows targeting Dags that are no longer asset-triggered are deleted.
+        """
+        full = self._last_full_sync is None or time.monotonic() - self._last_full_sync >= self.resync_interval
+        if full:
+            self._last_full_sync = time.monotonic()
+            self._queued.clear()
+            self._due.clear()
+            self._unserialized.clear()
+            rows = self._fetch_queue(session)
+            candidates = {row.target_dag_id for row in rows}
+        else:
+            if self._watermark is None:
+                rows = self._fetch_queue(session)
+            else:
+                rows = self._fetch_queue(
+                    session, AssetDagRunQueue.created_at >= self._watermark - QUEUE_LOOKBACK
+                )
+            # Rows seen in a previous pass are fetched again while within the lookback; they change nothing.
+            candidates = {
+                row.target_dag_id
+                for row in rows
+                if (row.asset_id, row.created_at) not in self._queued.get(row.target_dag_id, ())
+            }
+            candidates |= self._due | self._unserialized
+            if candidates:
+                rows = self._fetch_queue(session, AssetDagRunQueue.target_dag_id.in_(candidates))
+            else:
+                rows = []
+        if rows:
+            newest = max(row.created_at for row in rows)
+            self._watermark = newest if self._watermark is None else max(self._watermark, newest)
+
+        statuses_by_dag: dict[str, dict[SerializedAssetUniqueKey, bool]] = defaultdict(dict)
+        created_at_by_dag: dict[str, list[datetime]] = defaultdict(list)
+        not_asset_triggered: set[str] = set()
+        for row in rows:
+            if row.asset_expression is None:
+                # The dag referenced does not actually depend on an asset! This
+                # could happen if the dag DID depend on an asset at some point,
+                # but no longer does. Delete the stale adrq.
+                not_asset_triggered.add(row.target_dag_id)
+                continue
+            statuses_by_dag[row.target_dag_id][SerializedAssetUniqueKey(name=row.name, uri=row.uri)] = True
+            created_at_by_dag[row.target_dag_id].append(row.created_at)
+        if not_asset_triggered:
+            session.execute(
+                delete(AssetDagRunQueue)
+                .where(AssetDagRunQueue.target_dag_id.in_(not_asset_triggered))
+                .execution_options(synchronize_session="fetch")
+            )
+
+        # Forget the Dags whose queued events were all consumed since they were last evaluated
+        for dag_id in candidates - statuses_by_dag.keys():
+            self._queued.pop(dag_id, None)
+            self._conditions.pop(dag_id, None)
+            self._due.discard(dag_id)
+            self._unserialized.discard(dag_id)
+        queued_by_dag: dict[str, set[tuple[int, datetime]]] = defaultdict(set)
+        for row in rows:
+            if row.target_dag_id in statuses_by_dag:
+                queued_by_dag[row.target_dag_id].add((row.asset_id, row.created_at))
+        self._queued.update(queued_by_dag)
+        if full:
+            for dag_id in self._conditions.keys() - statuses_by_dag.keys():
+                del self._conditions[dag_id]
+
+        if statuses_by_dag:
+            log.info(
+                "Asset-triggered Dags with queued events: %s",
+                {dag_id: len(statuses) for dag_id, statuses in statuses_by_dag.items()},
+            )
+
+        conditions = self._get_conditions(statuses_by_dag.keys(), session)
+        self._unserialized = (self._unserialized | statuses_by_dag.keys()) - conditions.keys()
+        if missing_from_serialized := statuses_by_dag.keys() - conditions.keys():
+            log.info(
+                "Dags have queued asset events (ADRQ), but are not found in the serialized_dag table."
+                " — skipping Dag run creation: %s",
+                sorted(missing_from_serialized),
+            )
+
+        evaluator = AssetEvaluator(session)
+        triggered_date_by_dag: dict[str, datetime] = {}
+        for dag_id, condition in conditions.items():
+            if _dag_ready(evaluator, dag_id, condition, statuses_by_dag[dag_id]):
+                self._due.add(dag_id)
+                triggered_date_by_dag[dag_id] = max(created_at_by_dag[dag_id])
+            else:
+                log.debug("Asset condition not met for dag '%s'", dag_id)
+                self._due.discard(dag_id)
+        return triggered_date_by_dag
+
+    def _fetch_queue(self, session: Session, *where: ColumnElement[bool]) -> Iterable:
+        from airflow.models.dag import DagModel
+
+        return session.execute(
+            select(
+                AssetDagRunQueue.target_dag_id,
+                AssetDagRunQueue.asset_id,
+                AssetDagRunQueue.created_at,
+                AssetModel.name,
+                AssetModel.uri,
+                DagModel.asset_expression,
+            )
+            .join(AssetModel, AssetModel.id == AssetDagRunQueue.asset_id)
+            .join(DagModel, DagModel.dag_id == AssetDagRunQueue.target_dag_id)
+            .where(*where)
+        ).all()
+
+    def _get_conditions(self, dag_ids: Collection[str], session: Session) -> dict[str, SerializedAssetBase]:
+        """Return the asset conditions of the latest serialized version of the Dags, when they have one."""
+        from airflow.models.serialized_dag import SerializedDagModel
+
+        if not dag_ids:
+            return {}
+        stale = set(dag_ids)
+        if cached := [dag_id for dag_id in dag_ids if dag_id in self._conditions]:
+            latest = (
+                select(SerializedDagModel.dag_id, func.max(SerializedDagModel.created_at).label("created_at"))
+                .where(SerializedDagModel.dag_id.in_(cached))
+                .group_by(SerializedDagModel.dag_id)
+                .subquery()
+            )
+            for dag_id, dag_hash in session.execute(
+                select(SerializedDagModel.dag_id, SerializedDagModel.dag_hash).join(
+                    latest,
+                    (SerializedDagModel.dag_id == latest.c.dag_id)
+                    & (SerializedDagModel.created_at == latest.c.created_at),
+                )
+            ):
+                if self._conditions[dag_id][0] == dag_hash:
+                    stale.discard(dag_id)
+        if stale:
+            for dag_id in stale:
+                self._conditions.pop(dag_id, None)
+            for ser_dag in SerializedDagModel.get_latest_serialized_dags(
+                dag_ids=list(stale), session=session
+            ):
+                self._conditions[ser_dag.dag_id] = (ser_dag.dag_hash, ser_dag.dag.timetable.asset_condition)
+        return {dag_id: self._conditions[dag_id][1] for dag_id in dag_ids if dag_id in self._conditions}
+
+
+def _dag_ready(
+    evaluator: AssetEvaluator,
+    dag_id: str,
+    condition: SerializedAssetBase,
+    statuses: dict[SerializedAssetUniqueKey, bool],
+) -> bool:
+    try:
+        return evaluator.run(condition, statuses)
+    except AttributeError:
+        # if dag was serialized before 2.9 and we *just* upgraded,
+        # we may be dealing with old version.  In that case,
+        # just wait for the dag to be reserialized.
+        log.warning("Dag '%s' has old serialization; skipping run creation.", dag_id)
+        return False
+    except Exception:
+        log.exception("Dag '%s' failed to be evaluated; assuming not ready", dag_id)
+        return False
@@ -56,7 +56,11 @@ from airflow.dag_processing.bundles.base import (
 )
 from airflow.dag_processing.bundles.manager import DagBundlesManager
 from airflow.dag_processing.collection import update_dag_parsing_results_in_db
-from airflow.dag_processing.processor import DagFileParsingResult, DagFileProcessorProcess
+from airflow.dag_processing.processor import (
+    DagFileParsingResult,
+    DagFileProcessorProcess,
+    pre_import_configured_modules,
+)
 from airflow.exceptions import AirflowException
 from airflow.models.asset import remove_references_to_deleted_dags
 from airflow.models.dag import DagModel
@@ -70,6 +74,7 @@ from airflow.sdk import SecretCache
 from airflow.sdk.log import init_log_file, logging_processors
 from airflow.typing_compat import assert_never
 from airflow.utils.file import list_py_file_paths, might_contain_dag
+from airflow.utils.hashlib_wrapper import md5
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.net import get_hostname
 from airflow.utils.process_utils import (
@@ -120,6 +125,8 @@ class DagFileStat:
     last_duration: float | None = None
     run_count: int = 0
     last_num_of_db_queries: int = 0
+    content_fingerprint: str | None = None
+    dependencies: tuple[str, ...] = ()
 
 
 @dataclass(frozen=True)
@@ -233,6 +240,9 @@ class DagFileProcessorManager(LoggingMixin):
     _file_process_interval: float = attrs.field(
         factory=_config_int_factory("dag_processor", "min_file_process_interval")
     )
+    _unchanged_file_process_interval: float = attrs.field(
+        factory=_config_int_factory("dag_processor", "unchanged_file_process_interval")
+    )
     stale_dag_threshold: float = attrs.field(
         factory=_config_int_factory("dag_processor", "stale_dag_threshold")
     )
@@ -335,6 +345,7 @@ class DagFileProcessorManager(LoggingMixin):
         self.log.info("Process each file at most once every %s seconds", self._file_process_interval)
         self.prepare_bundles()
         self._symlink_latest_log_directory()
+        pre_import_configured_modules(self.log)
         # To prevent COW in forked process parsing dag file
         gc.freeze()
 
@@ -1201,8 +1212,56 @@ class DagFileProcessorManager(LoggingMixin):
                 )
                 return
 
+        if (
+            self._unchanged_file_process_interval > self._file_process_interval
+            and proc.parsing_result is not None
+            and not proc.parsing_result.import_errors
+            and not proc.requested_runtime_data
+        ):
+            next_stat.dependencies = tuple(proc.parsing_result.dependencies or ())
+            next_stat.content_fingerprint = self._get_content_fingerprint(
+                file, next_stat.dependencies, not_modified_after=finish_time.timestamp() - run_duration
+            )
+
         self._file_stats[file] = next_stat
 
+    def _get_content_fingerprint(
+        self,
+        file: DagFileInfo,
+        dependencies: Iterable[str],
+        *,
+        not_modified_after: float | None = None,
+    ) -> str | None:
+        """
+        Hash the content of a dag file and of the bundle modules it imports, along with the bundle version.
+
+        :param file: The dag file.
+        :param dependencies: Paths of the bundle modules imported by the dag file.
+        :param not_modified_after: If any of the files was modified after this timestamp, None is returned
+            since its content may not be the one the file was parsed with.
+        :return: The fingerprint, or None if one of the files could not be read.
+        """
+        digest = md5(os.fsencode(self._bundle_versions.get(file.bundle_name) or ""))
+        for path in (os.fspath(file.absolute_path), *dependencies):
+            try:
+                with open(path, "rb") as f:
+                    if not_modified_after is not None and os.fstat(f.fileno()).st_mtime > not_modified_after:
+                        return None
+                    content = f.read()
+            except OSError:
+                return None
+            digest.update(os.fsencode(path))
+            digest.update(md5(content).digest())
+        return digest.hexdigest()
+
+    def _is_unchanged_since_last_parse(self, now: datetime, file: DagFileInfo, stat: DagFileStat) -> bool:
+        """Whether ``file`` was parsed within ``unchanged_file_process_interval`` and is unchanged since."""
+        if not stat.content_fingerprint or not stat.last_finish_time:
+            return False
+        if (now - stat.last_finish_time).total_seconds() >= self._unchanged_file_process_interval:
+            return False
+        return self._get_content_fingerprint(file, stat.dependencies) == stat.content_fingerprint
+
     def persist_parsing_result(
         self,
         *,
@@ -1457,6 +1516,7 @@ class DagFileProcessorManager(LoggingMixin):
 
         # Sort the file paths by the parsing order mode
         recently_processed = set()
+        unchanged_keys = set()
         files = []
 
         for bundle_files in known_files.values():
@@ -1466,6 +1526,12 @@ class DagFileProcessorManager(LoggingMixin):
                 last_time = stat.last_finish_time if stat else None
                 if last_time and (now - last_time).total_seconds() < self._file_process_interval:
                     recently_processed.add(file)
+                elif stat and self._is_unchanged_since_last_parse(now, file, stat):
+                    unchanged_keys.add(file.presence_key)
+
+        if unchanged_keys:
+            self.log.debug("Skipping %d files unchanged since they were last parsed", len(unchanged_keys))
+            stats.incr("dag_processing.unchanged_files_skipped", len(unchanged_keys))
 
         changed_recently: set[DagFileInfo] = set()
         if self._file_parsing_sort_mode == "modified_time":
@@ -1482,7 +1548,7 @@ class DagFileProcessorManager(LoggingMixin):
             for presence_key, stat in file_stats_by_presence_key.items()
             if stat.run_count == self.max_runs
         }
-        to_exclude = in_progress_keys.union(at_run_limit_keys)
+        to_exclude = in_progress_keys.union(at_run_limit_keys, unchanged_keys)
 
         # exclude recently processed unless changed recently
         to_exclude |= {file.presence_key for file in recently_processed - changed_recently}
@@ -20,6 +20,7 @@ import contextlib
 import importlib
 import logging
 import os
+import sys
 import traceback
 from collections.abc import Callable, Sequence
 from pathlib import Path
@@ -138,6 +139,8 @@ class DagFileParsingResult(BaseModel):
     serialized_dags: list[LazyDeserializedDAG]
     warnings: list | None = None
     import_errors: dict[str, str] | None = None
+    dependencies: list[str] | None = None
+    """Files of the modules the dag file imported from its bundle, not including the dag file itself."""
     type: Literal["DagFileParsingResult"] = "DagFileParsingResult"
 
 
@@ -180,6 +183,50 @@ ToDagProcessor = Annotated[
 ]
 
 
+# Airflow modules imported by each dag file, along with the (mtime, size) of the file they were read from.
+_airflow_imports_cache: dict[str, tuple[tuple[int, int], list[str]]] = {}
+
+
+def _get_airflow_imports(file_path: str) -> list[str]:
+    """
+    Return the Airflow modules imported by the given file.
+
+    The file is only parsed again when its modification time or size changed since it was last read, so
+    unchanged files don't have their AST walked by the manager before every parse.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return list(iter_airflow_imports(file_path))
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _airflow_imports_cache.get(file_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    modules = list(iter_airflow_imports(file_path))
+    _airflow_imports_cache[file_path] = (key, modules)
+    return modules
+
+
+def pre_import_configured_modules(log: FilteringBoundLogger | logging.Logger) -> None:
+    """
+    Import the modules listed in ``[dag_processor] parsing_pre_import_module_list``.
+
+    This is called once by the manager before it starts parsing, so that every parsing process forked from
+    it starts with these modules (typically heavy provider or third-party modules used by most dags)
+    already imported instead of importing them again for each file.
+    """
+    if not conf.getboolean("dag_processor", "parsing_pre_import_modules", fallback=True):
+        return
+
+    for module in conf.getlist("dag_processor", "parsing_pre_import_module_list", fallback=[]):
+        if not module:
+            continue
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            log.warning("Error when trying to pre-import module '%s': %s", module, e)
+
+
 def _pre_import_airflow_modules(file_path: str, log: FilteringBoundLogger) -> None:
     """
     Pre-import Airflow modules found in the given file.
@@ -194,7 +241,7 @@ def _pre_import_airflow_modules(file_path: str, log: FilteringBoundLogger) -> No
     if not conf.getboolean("dag_processor", "parsing_pre_import_modules", fallback=True):
         return
 
-    for module in iter_airflow_imports(file_path):
+    for module in _get_airflow_imports(file_path):
         try:
             importlib.import_module(module)
         except Exception as e:
@@ -260,10 +307,22 @@ def _parse_file(msg: DagFileParseRequest, log: FilteringBoundLogger) -> DagFileP
         serialized_dags=serialized_dags,
         import_errors=bag.import_errors,
         warnings=stability_check_result.get_formatted_warnings(bag.dag_ids),
+        dependencies=_get_bundle_module_files(msg.bundle_path, msg.file),
     )
     return result
 
 
+def _get_bundle_module_files(bundle_path: Path, dag_file: str) -> list[str]:
+    """Return the files of the modules imported from ``bundle_path``, other than ``dag_file``."""
+    prefix = os.path.join(os.fspath(bundle_path), "")
+    files = set()
+    for module in list(sys.modules.values()):
+        module_file = getattr(module, "__file__", None)
+        if isinstance(module_file, str) and module_file.startswith(prefix) and module_file != dag_file:
+            files.add(module_file)
+    return sorted(files)
+
+
 def _serialize_dags(
     bag: DagBag,
     log: FilteringBoundLogger,
@@ -557,6 +616,9 @@ class DagFileProcessorProcess(WatchedSubprocess):
     bundle_name: str
     dag_file_rel_path: str
 
+    requested_runtime_data: bool = False
+    """Whether the dag file asked for Variables, Connections or other runtime data while being processed."""
+
     @classmethod
     def start(  # type: ignore[override]
         cls,
@@ -631,6 +693,9 @@ class DagFileProcessorProcess(WatchedSubprocess):
 
         resp: BaseModel | None = None
         dump_opts: dict[str, bool] = {}
+        if not isinstance(msg, (DagFileParsingResult, MaskSecret)):
+            self.requested_runtime_data = True
+
         if isinstance(msg, DagFileParsingResult):
             self.parsing_result = msg
         elif isinstance(msg, GetConnection):
@@ -18,6 +18,7 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
 import sys
 from collections import defaultdict, deque
@@ -123,6 +124,104 @@ class RunningRetryAttemptType:
         return True
 
 
+class QueuedTasks(dict[TaskInstanceKey, workloads.ExecuteTask]):
+    """
+    The task workloads queued in an executor by task instance key, kept in the order they are run in.
+
+    This is the ``dict`` it always was, which also keeps a heap of its keys by the ``priority_weight`` of
+    their workload, then insertion order, so that the next few workloads to run can be found without
+    sorting the whole queue. Removing or replacing a workload leaves a stale entry in the heap which is
+    skipped over; the heap is rebuilt once these make up half of it.
+    """
+
+    def __init__(self, queued: dict[TaskInstanceKey, workloads.ExecuteTask] | None = None) -> None:
+        super().__init__()
+        # The live heap entry of each key, as (priority_weight, insertion sequence, key)
+        self._entries: dict[TaskInstanceKey, tuple[int, int, TaskInstanceKey]] = {}
+        self._heap: list[tuple[int, int, TaskInstanceKey]] = []
+        self._next_seq = 0
+        if queued:
+            self.update(queued)
+
+    def __setitem__(self, key: TaskInstanceKey, workload: workloads.ExecuteTask) -> None:
+        super().__setitem__(key, workload)
+        if (old := self._entries.get(key)) is None:
+            seq = self._next_seq
+            self._next_seq += 1
+        else:
+            # Like in a dict, replacing the workload of a key doesn't move it behind the keys added after it
+            seq = old[1]
+            if old[0] == workload.ti.priority_weight:
+                return
+        entry = (workload.ti.priority_weight, seq, key)
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+        self._maybe_compact()
+
+    def __delitem__(self, key: TaskInstanceKey) -> None:
+        super().__delitem__(key)
+        del self._entries[key]
+        self._maybe_compact()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def pop(self, key, *args):
+        if key in self:
+            workload = self[key]
+            del self[key]
+            return workload
+        return super().pop(key, *args)
+
+    def popitem(self) -> tuple[TaskInstanceKey, workloads.ExecuteTask]:
+        key, workload = super().popitem()
+        del self._entries[key]
+        self._maybe_compact()
+        return key, workload
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs) -> None:
+        for key, workload in dict(*args, **kwargs).items():
+            self[key] = workload
+
+    def clear(self) -> None:
+        super().clear()
+        self._entries.clear()
+        self._heap.clear()
+
+    def _maybe_compact(self) -> None:
+        if len(self._heap) > 2 * len(self._entries) + 16:
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+
+    def by_priority(self, limit: int | None = None) -> list[tuple[TaskInstanceKey, workloads.ExecuteTask]]:
+        """
+        Return the queued workloads in the order they are run in, lowest ``priority_weight`` first.
+
+        :param limit: Return only this many of the first workloads. Only the part of the heap holding
+            them is visited, rather than the whole queue.
+        """
+        result: list[tuple[TaskInstanceKey, workloads.ExecuteTask]] = []
+        heap = self._heap
+        # Walk the heap in order without popping from it: the next entry in order is always the smallest
+        # child of the entries visited so far.
+        candidates = [(heap[0], 0)] if heap else []
+        while candidates and (limit is None or len(result) < limit):
+            entry, index = heapq.heappop(candidates)
+            key = entry[2]
+            if self._entries.get(key) is entry:
+                result.append((key, self[key]))
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap):
+                    heapq.heappush(candidates, (heap[child], child))
+        return result
+
+
 class ExecutorConf:
     """
     This class is used to fetch configuration for an executor for a particular team_name.
@@ -150,6 +249,9 @@ class ExecutorConf:
     def getint(self, *args, **kwargs):
         return conf.getint(*args, **kwargs, team_name=self.team_name)
 
+    def getfloat(self, *args, **kwargs) -> float:
+        return conf.getfloat(*args, **kwargs, team_name=self.team_name)
+
     def getsection(self, section: str) -> dict[str, str | int | float | bool] | None:
         return conf.getsection(section, team_name=self.team_name)
 
@@ -221,7 +323,7 @@ class BaseExecutor(LoggingMixin):
 
         self.parallelism: int = parallelism
         self.team_name: str | None = team_name
-        self.queued_tasks: dict[TaskInstanceKey, workloads.ExecuteTask] = {}
+        self.queued_tasks: dict[TaskInstanceKey, workloads.ExecuteTask] = QueuedTasks()
         self.queued_callbacks: dict[CallbackKey, workloads.ExecuteCallback] = {}
         self.queued_connection_tests: dict[ConnectionTestKey, workloads.TestConnection] = {}
         self.running: set[WorkloadKey] = set()
@@ -304,10 +406,9 @@ class BaseExecutor(LoggingMixin):
                 workloads_to_schedule.append((key, workload))
 
         if open_slots > len(workloads_to_schedule) and self.queued_tasks:
-            for task_key, task_workload in self.order_queued_tasks_by_priority():
-                if len(workloads_to_schedule) >= open_slots:
-                    break
-                workloads_to_schedule.append((task_key, task_workload))
+            workloads_to_schedule.extend(
+                self.order_queued_tasks_by_priority(limit=open_slots - len(workloads_to_schedule))
+            )
 
         return workloads_to_schedule
 
@@ -424,21 +525,27 @@ class BaseExecutor(LoggingMixin):
             tags={"status": "running", "executor_class_name": name},
         )
 
-    def order_queued_tasks_by_priority(self) -> list[tuple[TaskInstanceKey, workloads.ExecuteTask]]:
+    def order_queued_tasks_by_priority(
+        self, limit: int | None = None
+    ) -> list[tuple[TaskInstanceKey, workloads.ExecuteTask]]:
         """
         Orders the queued tasks by priority.
 
+        :param limit: Only return this many of the first tasks.
         :return: List of workloads from the queued_tasks according to the priority.
         """
         if not self.queued_tasks:
             return []
 
-        # V3 + new executor that supports workloads
+        if isinstance(self.queued_tasks, QueuedTasks):
+            return self.queued_tasks.by_priority(limit)
+
+        # Executors may have replaced queued_tasks with a plain dict
         return sorted(
             self.queued_tasks.items(),
             key=lambda x: x[1].ti.priority_weight,
             reverse=False,
-        )
+        )[:limit]
 
     def trigger_tasks(self, open_slots: int) -> None:
         """
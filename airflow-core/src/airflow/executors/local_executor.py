@@ -26,6 +26,8 @@ LocalExecutor.
 from __future__ import annotations
 
 import ctypes
+import gc
+import importlib
 import multiprocessing
 import multiprocessing.sharedctypes
 import os
@@ -48,6 +50,7 @@ else:
 if TYPE_CHECKING:
     from airflow.executors.workloads import ExecutorWorkload
     from airflow.executors.workloads.types import WorkloadResultType
+    from airflow.sdk.execution_time.supervisor import HeartbeatAgent, HeartbeatChannel
 
 
 def _get_executor_process_title_prefix(team_name: str | None) -> str:
@@ -60,12 +63,42 @@ def _get_executor_process_title_prefix(team_name: str | None) -> str:
     return f"airflow worker -- LocalExecutor{team_suffix}:"
 
 
+# Imported by every task process, wherever its dag comes from
+_TASK_RUNTIME_MODULES = (
+    "airflow.sdk.execution_time.task_runner",
+    "airflow.dag_processing.dagbag",
+)
+
+
+def _pre_import_task_modules(team_conf, log) -> None:
+    """
+    Import the modules task processes need in the worker, before it starts forking them.
+
+    Each task process is forked from the worker that picked the task up, so whatever the worker has
+    imported is already there when the task starts: it doesn't have to import the Task SDK runtime, or the
+    providers and shared modules its dag uses, again. The objects the worker holds are then moved out of
+    reach of the garbage collector, so task processes don't copy the memory they are in by touching it.
+    """
+    if not team_conf.getboolean("core", "local_executor_pre_import_modules", fallback=True):
+        return
+
+    configured = team_conf.get("core", "local_executor_pre_import_module_list", fallback="") or ""
+    modules = [*_TASK_RUNTIME_MODULES, *(m.strip() for m in configured.split(",") if m.strip())]
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            log.warning("Error when trying to pre-import module '%s': %s", module, e)
+    gc.freeze()
+
+
 def _run_worker(
     logger_name: str,
     input: SimpleQueue[ExecutorWorkload | None],
     output: Queue[WorkloadResultType],
     unread_messages: multiprocessing.sharedctypes.Synchronized[int],
     team_conf,
+    heartbeat_channel: HeartbeatChannel | None = None,
 ):
     import signal
 
@@ -74,6 +107,12 @@ def _run_worker(
 
     log = structlog.get_logger(logger_name)
     log.info("Worker starting up pid=%d", os.getpid())
+    _pre_import_task_modules(team_conf, log)
+
+    if heartbeat_channel is not None:
+        from airflow.sdk.execution_time.supervisor import use_heartbeat_channel
+
+        use_heartbeat_channel(heartbeat_channel)
 
     while True:
         setproctitle(f"{_get_executor_process_title_prefix(team_conf.team_name)} <idle>", log)
@@ -132,6 +171,8 @@ class LocalExecutor(BaseExecutor):
     result_queue: SimpleQueue[WorkloadResultType]
     workers: dict[int, multiprocessing.Process]
     _unread_messages: multiprocessing.sharedctypes.Synchronized[int]
+    _heartbeat_agent: HeartbeatAgent | None = None
+    _heartbeat_channels: dict[int, HeartbeatChannel]
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -160,6 +201,18 @@ class LocalExecutor(BaseExecutor):
 
         self._unread_messages = multiprocessing.Value(ctypes.c_uint)
 
+        # Send the heartbeats of the tasks of all the workers together, rather than one request per task
+        self._heartbeat_agent = None
+        self._heartbeat_channels = {}
+        interval = self.conf.getfloat("core", "local_executor_heartbeat_coalesce_interval", fallback=0)
+        if interval > 0:
+            from airflow.sdk.execution_time.supervisor import HeartbeatAgent
+
+            self._heartbeat_agent = HeartbeatAgent(
+                server=get_execution_api_server_url(self.conf), interval=interval
+            )
+            self._heartbeat_agent.start()
+
         if self.is_mp_using_fork:
             # This creates the maximum number of worker processes (parallelism) at once
             # to minimize gc freeze/unfreeze cycles when using fork in multiprocessing
@@ -172,6 +225,8 @@ class LocalExecutor(BaseExecutor):
             if not proc.is_alive():
                 to_remove.add(pid)
                 proc.close()
+                if self._heartbeat_agent is not None and (channel := self._heartbeat_channels.pop(pid, None)):
+                    self._heartbeat_agent.disconnect(channel)
 
         if to_remove:
             self.workers = {pid: proc for pid, proc in self.workers.items() if pid not in to_remove}
@@ -198,6 +253,7 @@ class LocalExecutor(BaseExecutor):
                 self._spawn_worker()
 
     def _spawn_worker(self):
+        heartbeat_channel = self._heartbeat_agent.connect() if self._heartbeat_agent else None
         p = multiprocessing.Process(
             target=_run_worker,
             kwargs={
@@ -206,12 +262,15 @@ class LocalExecutor(BaseExecutor):
                 "output": self.result_queue,
                 "unread_messages": self._unread_messages,
                 "team_conf": self.conf,
+                "heartbeat_channel": heartbeat_channel,
             },
         )
         p.start()
         if TYPE_CHECKING:
             assert p.pid  # Since we've called start
         self.workers[p.pid] = p
+        if heartbeat_channel is not None:
+            self._heartbeat_channels[p.pid] = heartbeat_channel
 
     def _spawn_workers_with_gc_freeze(self, spawn_number):
         """
@@ -224,8 +283,6 @@ class LocalExecutor(BaseExecutor):
 
         Ref: https://docs.python.org/3/library/gc.html#gc.freeze
         """
-        import gc
-
         gc.freeze()
         try:
             for _ in range(spawn_number):
@@ -267,6 +324,11 @@ class LocalExecutor(BaseExecutor):
         # Process any extra results before closing
         self._read_results()
 
+        if self._heartbeat_agent is not None:
+            self._heartbeat_agent.stop()
+            self._heartbeat_agent = None
+            self._heartbeat_channels = {}
+
         self.activity_queue.close()
         self.result_queue.close()
 
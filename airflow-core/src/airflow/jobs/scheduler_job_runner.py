@@ -52,6 +52,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.exc import DBAPIError, OperationalError
 from sqlalchemy.orm import joinedload, lazyload, load_only, make_transient, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.sql import expression
 
 from airflow import settings
@@ -59,12 +60,13 @@ from airflow._shared.observability.metrics import stats
 from airflow._shared.timezones import timezone
 from airflow.api_fastapi.execution_api.datamodels.taskinstance import DagRun as DRDataModel, TIRunContext
 from airflow.assets.evaluation import AssetEvaluator
+from airflow.assets.trigger_index import AssetTriggerIndex
 from airflow.callbacks.callback_requests import (
     DagCallbackRequest,
     EmailRequest,
     TaskCallbackRequest,
 )
-from airflow.configuration import conf
+from airflow.configuration import AIRFLOW_HOME, conf
 from airflow.dag_processing.bundles.base import BundleUsageTrackingManager
 from airflow.exceptions import DagNotFound
 from airflow.executors import workloads
@@ -117,8 +119,10 @@ from airflow.timetables.base import Timetable, compute_rollup_fingerprint
 from airflow.timetables.simple import AssetTriggeredTimetable
 from airflow.triggers.base import TriggerEvent
 from airflow.utils.event_scheduler import EventScheduler
+from airflow.utils.helpers import chunks
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.retries import MAX_DB_RETRIES, retry_db_transaction, run_with_db_retries
+from airflow.utils.scheduler_loop_profiler import SchedulerLoopProfiler
 from airflow.utils.session import NEW_SESSION, create_session, provide_session
 from airflow.utils.sqlalchemy import (
     get_dialect_name,
@@ -229,17 +233,60 @@ class ConcurrencyMap:
     It contains a map from (dag_id, task_id) to # of task instances, a map from (dag_id, task_id)
     to # of task instances in the given state list and a map from (dag_id, run_id, task_id)
     to # of task instances in the given state list in each DAG run.
+
+    The maps can either be rebuilt from the database on every use with :meth:`load`, or kept
+    around and maintained incrementally from the transitions the scheduler itself performs
+    (:meth:`add_queued` and :meth:`release`), with a periodic :meth:`load` to reconcile them
+    against transitions made elsewhere.
     """
 
     def __init__(self):
         self.dag_run_active_tasks_map: Counter[tuple[str, str]] = Counter()
         self.task_concurrency_map: Counter[tuple[str, str]] = Counter()
         self.task_dagrun_concurrency_map: Counter[tuple[str, str, str]] = Counter()
+        self.loaded_at: datetime | None = None
+
+    def is_stale(self, max_age: float) -> bool:
+        """Whether the maps were never loaded, or were last loaded more than ``max_age`` seconds ago."""
+        if self.loaded_at is None:
+            return True
+        return (timezone.utcnow() - self.loaded_at).total_seconds() >= max_age
+
+    def add_queued(self, ti: TI) -> None:
+        """Account for a task instance the scheduler has just moved to the queued state."""
+        self.dag_run_active_tasks_map[ti.dag_id, ti.run_id] += 1
+        self.task_concurrency_map[ti.dag_id, ti.task_id] += 1
+        self.task_dagrun_concurrency_map[ti.dag_id, ti.run_id, ti.task_id] += 1
+
+    def release(self, ti: TI, job_id: int | None) -> None:
+        """
+        Release the slots held by a task instance that has left the active states.
+
+        Only task instances queued by ``job_id`` are released: those are either counted by the last
+        :meth:`load` or added by :meth:`add_queued`. A task instance that already finished before the
+        last load was never counted, so it is skipped as well. Anything this misses errs on the side of
+        over-counting, which only delays scheduling until the next reconciliation.
+        """
+        if self.loaded_at is None or ti.queued_by_job_id != job_id:
+            return
+        if ti.end_date is not None and ti.end_date < self.loaded_at:
+            return
+        for counter, key in (
+            (self.dag_run_active_tasks_map, (ti.dag_id, ti.run_id)),
+            (self.task_concurrency_map, (ti.dag_id, ti.task_id)),
+            (self.task_dagrun_concurrency_map, (ti.dag_id, ti.run_id, ti.task_id)),
+        ):
+            if counter[key] > 1:
+                counter[key] -= 1
+            else:
+                del counter[key]
 
     def load(self, session: Session) -> None:
         self.dag_run_active_tasks_map.clear()
         self.task_concurrency_map.clear()
         self.task_dagrun_concurrency_map.clear()
+        # Taken before the query so that anything finishing while it runs is still released.
+        self.loaded_at = timezone.utcnow()
         query = session.execute(
             select(TI.dag_id, TI.task_id, TI.run_id, TI.state, func.count("*"))
             .where(TI.state.in_(ACTIVE_STATES))
@@ -335,6 +382,21 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         self._parallelism = conf.getint("core", "parallelism")
         self._multi_team = conf.getboolean("core", "multi_team")
         self._max_partition_dag_runs_per_loop = MAX_PARTITION_DAG_RUNS_PER_LOOP
+        self._concurrency_map_reconcile_interval = conf.getfloat(
+            "scheduler", "concurrency_map_reconcile_interval", fallback=0.0
+        )
+        self._concurrency_map = ConcurrencyMap()
+        self._asset_trigger_index = AssetTriggerIndex(
+            resync_interval=conf.getfloat("scheduler", "asset_trigger_index_resync_interval", fallback=0.0)
+        )
+        self._limit_candidates_per_pool = conf.getboolean(
+            "scheduler", "limit_candidates_per_pool", fallback=False
+        )
+        self._bulk_scheduling_decisions = conf.getboolean(
+            "scheduler", "bulk_scheduling_decisions", fallback=False
+        )
+        # Task instances of the dag runs being scheduled by ``_schedule_all_dag_runs``, keyed by dag run id.
+        self._prefetched_tis: dict[int, list[TI]] = {}
         self._dag_id_to_team_name: dict[str, str | None] = {}
 
         self.executors: list[BaseExecutor] = executors if executors else ExecutorLoader.init_executors()
@@ -348,7 +410,16 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         if log:
             self._log = log
 
-        self.scheduler_dag_bag = DBDagBag(load_op_links=False)
+        self.scheduler_dag_bag = DBDagBag(
+            load_op_links=False,
+            max_cache_bytes=conf.getint("scheduler", "dag_cache_size_mb", fallback=0) * 1024 * 1024,
+        )
+
+        self._loop_profiler = SchedulerLoopProfiler(
+            enabled=conf.getboolean("profiling", "scheduler_loop_phase_metrics", fallback=False),
+            sampling_duration=conf.getfloat("profiling", "scheduler_sampling_profile_duration", fallback=0),
+            output_dir=AIRFLOW_HOME,
+        )
 
     @provide_session
     def heartbeat_callback(self, *, session: Session = NEW_SESSION) -> None:
@@ -515,6 +586,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             self.log.info("\n\t".join(map(repr, callstack)))
             self.log.info("-" * 80)
 
+        self._loop_profiler.dump()
+
     def _executable_task_instances_to_queued(self, max_tis: int, session: Session) -> list[TI]:
         """
         Find TIs that are ready for execution based on conditions.
@@ -569,8 +642,15 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         starved_pools = {pool_name for pool_name, stats in pools.items() if stats["open"] <= 0}
 
         # dag_id to # of running tasks and (dag_id, task_id) to # of running tasks.
-        concurrency_map = ConcurrencyMap()
-        concurrency_map.load(session=session)
+        if self._concurrency_map_reconcile_interval > 0:
+            # Incrementally maintained between reconciliations, see ConcurrencyMap.
+            concurrency_map = self._concurrency_map
+            if concurrency_map.is_stale(self._concurrency_map_reconcile_interval):
+                self.log.debug("Reconciling the concurrency map with the database")
+                concurrency_map.load(session=session)
+        else:
+            concurrency_map = ConcurrencyMap()
+            concurrency_map.load(session=session)
 
         # Number of tasks that cannot be scheduled because of no open slot in pool
         num_starving_tasks_total = 0
@@ -583,6 +663,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         pool_num_starving_tasks: dict[str, int] = Counter()
 
         for loop_count in itertools.count(start=1):
+            rejected_for_pool_slots = False
             num_starved_pools = len(starved_pools)
             num_starved_dags = len(starved_dags)
             num_starved_tasks = len(starved_tasks)
@@ -635,6 +716,10 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     tuple_(TI.dag_id, TI.run_id, TI.task_id).not_in(starved_tasks_task_dagrun_concurrency)
                 )
 
+            if executable_tis:
+                # Only when candidates are limited per pool do we come back for more after accepting some.
+                query = query.where(TI.id.not_in([ti.id for ti in executable_tis]))
+
             # Create a subquery with row numbers partitioned by dag_id and run_id.
             # Different dags can have the same run_id but
             # the dag_id combined with the run_id uniquely identify a run.
@@ -654,6 +739,38 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 )
             ).subquery()
 
+            if self._limit_candidates_per_pool:
+                # Number the candidates left within max_active_tasks per pool as well, so that a few
+                # nearly full pools cannot fill the whole batch with task instances that will be rejected
+                # for lack of slots. Every task instance takes at least one slot, so the open slots of a
+                # pool bound how many of its candidates are worth examining.
+                ranked_query = (
+                    select(
+                        ranked_query,
+                        func.row_number()
+                        .over(
+                            partition_by=ranked_query.c.pool,
+                            order_by=[
+                                -ranked_query.c.priority_weight_for_ordering,
+                                ranked_query.c.logical_date_for_ordering,
+                                ranked_query.c.map_index_for_ordering,
+                            ],
+                        )
+                        .label("pool_row_num"),
+                        case(
+                            {
+                                pool_name: int(min(max(0, pool_stats["open"]), max_tis))
+                                for pool_name, pool_stats in pools.items()
+                            },
+                            value=ranked_query.c.pool,
+                            # Unknown pools still come through, so that they get reported below.
+                            else_=max_tis,
+                        ).label("pool_open_slots"),
+                    )
+                    .where(ranked_query.c.row_num <= ranked_query.c.dr_max_active_tasks)
+                    .subquery()
+                )
+
             # Select only rows where row_number <= max_active_tasks.
             query = (
                 select(TI)
@@ -674,8 +791,10 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 )
                 .options(selectinload(TI.dag_model))
             )
+            if self._limit_candidates_per_pool:
+                query = query.where(ranked_query.c.pool_row_num <= ranked_query.c.pool_open_slots)
 
-            query = query.limit(max_tis)
+            query = query.limit(max_tis - len(executable_tis))
 
             timer = stats.timer("scheduler.critical_section_query_duration")
             timer.start()
@@ -771,6 +890,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     pool_num_starving_tasks[pool_name] += 1
                     num_starving_tasks_total += 1
                     starved_tasks.add((task_instance.dag_id, task_instance.task_id))
+                    rejected_for_pool_slots = True
                     continue
 
                 if task_instance.pool_slots > open_slots:
@@ -785,6 +905,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     pool_num_starving_tasks[pool_name] += 1
                     num_starving_tasks_total += 1
                     starved_tasks.add((task_instance.dag_id, task_instance.task_id))
+                    rejected_for_pool_slots = True
                     # Though we can execute tasks with lower priority if there's enough room
                     continue
 
@@ -906,15 +1027,19 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
                 executable_tis.append(task_instance)
                 open_slots -= task_instance.pool_slots
-                concurrency_map.dag_run_active_tasks_map[dag_run_key] += 1
-                concurrency_map.task_concurrency_map[(task_instance.dag_id, task_instance.task_id)] += 1
-                concurrency_map.task_dagrun_concurrency_map[
-                    (task_instance.dag_id, task_instance.run_id, task_instance.task_id)
-                ] += 1
+                concurrency_map.add_queued(task_instance)
 
                 pool_stats["open"] = open_slots
 
-            is_done = executable_tis or len(task_instances_to_examine) < max_tis
+            if self._limit_candidates_per_pool:
+                # A short batch no longer means that there are no candidates left, only that the pools
+                # have no room for more, and a candidate that didn't fit in its pool took the place of one
+                # that might have: keep looking as long as this iteration found new filters to apply.
+                is_done = bool(executable_tis) and (
+                    not rejected_for_pool_slots or len(executable_tis) >= max_tis
+                )
+            else:
+                is_done = executable_tis or len(task_instances_to_examine) < max_tis
             # Check this to avoid accidental infinite loops
             found_new_filters = (
                 len(starved_pools) > num_starved_pools
@@ -926,11 +1051,19 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             if is_done or not found_new_filters:
                 break
 
-            self.log.info(
-                "Found no task instances to queue on query iteration %s "
-                "but there could be more candidate task instances to check.",
-                loop_count,
-            )
+            if executable_tis:
+                self.log.info(
+                    "Found %s task instances to queue by query iteration %s "
+                    "but there could be more candidate task instances to check.",
+                    len(executable_tis),
+                    loop_count,
+                )
+            else:
+                self.log.info(
+                    "Found no task instances to queue on query iteration %s "
+                    "but there could be more candidate task instances to check.",
+                    loop_count,
+                )
 
         starving_pool_team_mapping = (
             Pool.get_name_to_team_name_mapping(list(pool_num_starving_tasks.keys()), session=session)
@@ -1228,11 +1361,17 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             job_id=self.job.id,
             scheduler_dag_bag=self.scheduler_dag_bag,
             session=session,
+            concurrency_map=self._concurrency_map if self._concurrency_map_reconcile_interval > 0 else None,
         )
 
     @classmethod
     def process_executor_events(
-        cls, executor: BaseExecutor, job_id: int | None, scheduler_dag_bag: DBDagBag, session: Session
+        cls,
+        executor: BaseExecutor,
+        job_id: int | None,
+        scheduler_dag_bag: DBDagBag,
+        session: Session,
+        concurrency_map: ConcurrencyMap | None = None,
     ) -> int:
         """
         Process task completion events from the executor and update task instance states.
@@ -1255,6 +1394,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         :param job_id: The scheduler job ID, used to detect task requeuing by other schedulers
         :param scheduler_dag_bag: Serialized DAG bag for retrieving task definitions
         :param session: Database session for task instance updates
+        :param concurrency_map: Incrementally maintained concurrency map to release finished
+            task instances from, if any
 
         :return: Number of events processed from the executor event buffer
 
@@ -1347,6 +1488,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         # multi-schedulers
         locked_query = with_row_locks(query, of=TI, session=session, skip_locked=True)
         tis: Iterator[TI] = session.scalars(locked_query)
+        finished_tis: list[TI] = []
         for ti in tis:
             try_number = ti_primary_key_to_try_number_map[ti.key.primary]
             buffer_key = ti.key.with_try_number(try_number)
@@ -1368,6 +1510,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 cls.logger().info("Setting external_executor_id for %s to %s", ti, info)
                 continue
 
+            finished_tis.append(ti)
+
             msg = (
                 "TaskInstance Finished: dag_id=%s, task_id=%s, run_id=%s, map_index=%s, ti_id=%s, "
                 "run_start_date=%s, run_end_date=%s, "
@@ -1548,6 +1692,11 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 # Update task state - emails are handled by DAG processor now
                 ti.handle_failure(error=msg, session=session)
 
+        if concurrency_map is not None:
+            for ti in finished_tis:
+                if ti.state not in ACTIVE_STATES:
+                    concurrency_map.release(ti, job_id)
+
         return len(event_buffer)
 
     def _execute(self) -> int | None:
@@ -1579,6 +1728,12 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 export_legacy_names=conf.getboolean("metrics", "legacy_names_on"),
             )
 
+            if conf.getboolean("scheduler", "prewarm_dag_cache", fallback=False):
+                with create_session() as session:
+                    count = self.scheduler_dag_bag.prewarm(session=session)
+                self.log.info("Pre-warmed the DAG cache with %d DAG(s)", count)
+
+            self._loop_profiler.install(settings.engine)
             self._run_scheduler_loop()
 
             if settings.Session is not None:
@@ -1593,6 +1748,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 except Exception:
                     self.log.exception("Exception when executing Executor.end on %s", executor)
 
+            self._loop_profiler.uninstall()
+
             # Under normal execution, this doesn't matter, but by resetting signals it lets us run more things
             # in the same process under testing without leaking global state
             reset_signals.close()
@@ -1735,7 +1892,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             # are picked up each iteration without requiring a scheduler restart.
             self._dag_id_to_team_name = {}
             with stats.timer("scheduler.scheduler_loop_duration") as timer:
-                with create_session() as session:
+                with self._loop_profiler.phase("do_scheduling"), create_session() as session:
                     # This will schedule for as many executors as possible.
                     num_queued_tis = self._do_scheduling(session)
                     # Don't keep any objects alive -- we've possibly just looked at 500+ ORM objects!
@@ -1744,28 +1901,30 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 # Heartbeat all executors, even if they're not receiving new tasks this loop. It will be
                 # either a no-op, or they will check-in on currently running tasks and send out new
                 # events to be processed below.
-                for executor in self.executors:
-                    with stats.timer(
-                        "scheduler.executor_heartbeat_duration",
-                        tags={"executor": type(executor).__name__},
-                    ):
-                        executor.heartbeat()
+                with self._loop_profiler.phase("executor_heartbeat"):
+                    for executor in self.executors:
+                        with stats.timer(
+                            "scheduler.executor_heartbeat_duration",
+                            tags={"executor": type(executor).__name__},
+                        ):
+                            executor.heartbeat()
 
-                with create_session() as session:
+                with self._loop_profiler.phase("process_executor_events"), create_session() as session:
                     num_finished_events = 0
                     for executor in self.executors:
                         num_finished_events += self._process_executor_events(
                             executor=executor, session=session
                         )
 
-                for executor in self.executors:
-                    try:
-                        with create_session() as session:
-                            self._process_task_event_logs(executor._task_event_logs, session)
-                    except Exception:
-                        self.log.exception("Something went wrong when trying to save task event logs.")
+                with self._loop_profiler.phase("task_event_logs"):
+                    for executor in self.executors:
+                        try:
+                            with create_session() as session:
+                                self._process_task_event_logs(executor._task_event_logs, session)
+                        except Exception:
+                            self.log.exception("Something went wrong when trying to save task event logs.")
 
-                with create_session() as session:
+                with self._loop_profiler.phase("deadlines_and_callbacks"), create_session() as session:
                     # Lock expired, unhandled deadlines with FOR UPDATE SKIP LOCKED so
                     # concurrent HA scheduler replicas don't both process the same row
                     # and create duplicate callbacks.
@@ -1792,12 +1951,14 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     self._enqueue_connection_tests(session=session)
 
                 # Heartbeat the scheduler periodically
-                perform_heartbeat(
-                    job=self.job, heartbeat_callback=self.heartbeat_callback, only_if_necessary=True
-                )
+                with self._loop_profiler.phase("job_heartbeat"):
+                    perform_heartbeat(
+                        job=self.job, heartbeat_callback=self.heartbeat_callback, only_if_necessary=True
+                    )
 
                 # Run any pending timed events
-                next_event = timers.run(blocking=False)
+                with self._loop_profiler.phase("timed_events"):
+                    next_event = timers.run(blocking=False)
                 self.log.debug("Next timed event is in %f", next_event)
 
             self.log.debug("Ran scheduling loop in %.2f ms", timer.duration)
@@ -1857,14 +2018,17 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         # Put a check in place to make sure we don't commit unexpectedly
         with prohibit_commit(session) as guard:
             if self._scheduler_use_job_schedule:
-                self._create_dagruns_for_dags(guard, session)
+                with self._loop_profiler.phase("create_dagruns"):
+                    self._create_dagruns_for_dags(guard, session)
 
-            self._start_queued_dagruns(session)
+            with self._loop_profiler.phase("start_queued_dagruns"):
+                self._start_queued_dagruns(session)
             guard.commit()
 
             # Bulk fetch the currently active dag runs for the dags we are
             # examining, rather than making one query per DagRun
-            dag_runs = DagRun.get_running_dag_runs_to_examine(session=session)
+            with self._loop_profiler.phase("get_dag_runs_to_examine"):
+                dag_runs = DagRun.get_running_dag_runs_to_examine(session=session)
 
             if self._multi_team and dag_runs:
                 unique_dag_ids = {dr.dag_id for dr in dag_runs}
@@ -1873,7 +2037,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     if team := dr_team_mapping.get(dr.dag_id):
                         dr._team_name = team
 
-            callback_tuples = self._schedule_all_dag_runs(guard, dag_runs, session)
+            with self._loop_profiler.phase("schedule_dag_runs"):
+                callback_tuples = self._schedule_all_dag_runs(guard, dag_runs, session)
 
         # Send the callbacks after we commit to ensure the context is up to date when it gets run
         # cache saves time during scheduling of many dag_runs for same dag
@@ -1905,7 +2070,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     timer.start()
 
                     # Find any TIs in state SCHEDULED, try to QUEUE them (send it to the executors)
-                    num_queued_tis = self._critical_section_enqueue_task_instances(session=session)
+                    with self._loop_profiler.phase("critical_section"):
+                        num_queued_tis = self._critical_section_enqueue_task_instances(session=session)
 
                     # Make sure we only sent this metric if we obtained the lock, otherwise we'll skew the
                     # metric, way down
@@ -2265,7 +2431,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         """Find Dag Models needing DagRuns and Create Dag Runs with retries in case of OperationalError."""
         partition_dag_ids: set[str] = self._create_dagruns_for_partitioned_asset_dags(session)
 
-        query, triggered_date_by_dag = DagModel.dags_needing_dagruns(session)
+        query, triggered_date_by_dag = DagModel.dags_needing_dagruns(
+            session, asset_trigger_index=self._asset_trigger_index
+        )
         all_dags_needing_dag_runs = set(query.all())
         asset_triggered_dags = [d for d in all_dags_needing_dag_runs if d.dag_id in triggered_date_by_dag]
         non_asset_dags = {
@@ -2698,17 +2866,56 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
     ) -> list[tuple[DagRun, DagCallbackRequest | None]]:
         """Make scheduling decisions for all `dag_runs`."""
         callback_tuples = []
-        for run in dag_runs:
-            try:
-                callback = self._schedule_dag_run(run, session=session)
-                callback_tuples.append((run, callback))
-            except DBAPIError:
-                raise  # let @retry_db_transaction handle DB errors
-            except Exception:
-                self.log.exception("Error scheduling DAG run %s of %s", run.run_id, run.dag_id)
+        if self._bulk_scheduling_decisions:
+            dag_runs = list(dag_runs)
+            self._prefetched_tis = self._prefetch_scheduling_state(dag_runs, session=session)
+        try:
+            for run in dag_runs:
+                try:
+                    callback = self._schedule_dag_run(run, session=session)
+                    callback_tuples.append((run, callback))
+                except DBAPIError:
+                    raise  # let @retry_db_transaction handle DB errors
+                except Exception:
+                    self.log.exception("Error scheduling DAG run %s of %s", run.run_id, run.dag_id)
+        finally:
+            self._prefetched_tis = {}
         guard.commit()
         return callback_tuples
 
+    def _prefetch_scheduling_state(self, dag_runs: list[DagRun], session: Session) -> dict[int, list[TI]]:
+        """
+        Load what scheduling decisions need for all ``dag_runs`` up front, in one query per table.
+
+        The DAG models are attached to the dag runs, which keeps them in the session's identity map for as
+        long as the runs are scheduled, so the per-run ``DagModel`` lookups don't hit the database. The
+        task instances are returned grouped by dag run id and get handed to :meth:`DagRun.update_state`
+        instead of being fetched run by run.
+        """
+        if not dag_runs:
+            return {}
+        dag_models = {
+            dm.dag_id: dm
+            for dm in session.scalars(select(DM).where(DM.dag_id.in_({dr.dag_id for dr in dag_runs})))
+        }
+        for dr in dag_runs:
+            set_committed_value(dr, "dag_model", dag_models.get(dr.dag_id))
+
+        runs_by_key = {(dr.dag_id, dr.run_id): dr for dr in dag_runs}
+        prefetched: dict[int, list[TI]] = {dr.id: [] for dr in dag_runs}
+        for chunk in chunks(list(runs_by_key), self.job.max_tis_per_query or len(runs_by_key)):
+            tis = session.scalars(
+                select(TI)
+                .where(tuple_(TI.dag_id, TI.run_id).in_(chunk))
+                .order_by(TI.dag_id, TI.run_id, TI.task_id, TI.map_index)
+            )
+            for ti in tis:
+                dag_run = runs_by_key[(ti.dag_id, ti.run_id)]
+                # The dag run is already loaded, so attach it rather than joining it in for every row.
+                set_committed_value(ti, "dag_run", dag_run)
+                prefetched[dag_run.id].append(ti)
+        return prefetched
+
     def _schedule_dag_run(
         self,
         dag_run: DagRun,
@@ -2806,7 +3013,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         dag_run.scheduled_by_job_id = self.job.id
 
         # TODO[HA]: Rename update_state -> schedule_dag_run, ?? something else?
-        schedulable_tis, callback_to_run = dag_run.update_state(session=session, execute_callbacks=False)
+        schedulable_tis, callback_to_run = dag_run.update_state(
+            session=session, execute_callbacks=False, tis=self._prefetched_tis.get(dag_run.id)
+        )
 
         if dag_run.state in State.finished_dr_states and dag_run.run_type in (
             DagRunType.SCHEDULED,
@@ -2867,6 +3076,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         )
         # Expire task_instances relationship so next access fetches fresh data from DB
         session.expire(dag_run, ["task_instances"])
+        # verify_integrity may create task instances, so any prefetched ones are no longer complete.
+        self._prefetched_tis.pop(dag_run.id, None)
         # Verify integrity also takes care of session.flush
         dag_run.verify_integrity(dag_version_id=latest_dag_version.id, session=session)
 
@@ -26,10 +26,10 @@ import signal
 import sys
 import threading
 import time
-from collections import deque
-from collections.abc import Callable, Generator, Hashable, Iterable, Iterator
+from collections import Counter, deque
+from collections.abc import Callable, Coroutine, Generator, Hashable, Iterable, Iterator
 from contextlib import contextmanager, suppress
-from datetime import datetime
+from datetime import datetime, timedelta
 from socket import socket
 from traceback import format_exception
 from typing import TYPE_CHECKING, Annotated, Any, BinaryIO, ClassVar, Literal, TextIO, TypedDict
@@ -132,6 +132,10 @@ _USER_ACTION_CANCEL_MSG = "__airflow_user_action__"
 
 _ON_CANCEL_TIMEOUT: int = conf.getint("triggerer", "on_kill_timeout", fallback=30)
 
+# Seconds between two loads of the triggers assigned to a triggerer from the DB. This is also the longest
+# a runner goes without syncing with its supervisor, which is when it is handed the triggers to start.
+_TRIGGER_LOAD_INTERVAL = 1.0
+
 
 def _make_trigger_span(
     ti: TaskInstanceDTO | None, trigger_id: int, name: str
@@ -229,7 +233,8 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
         else:
             self.log.warning("Forcing exit due to second exit signal %s", signum)
             if self.trigger_runner:
-                self.trigger_runner.kill(signal.SIGKILL)
+                for runner in (self.trigger_runner, *self.trigger_runner.peers):
+                    runner.kill(signal.SIGKILL)
             sys.exit(os.EX_SOFTWARE)
 
     def _execute(self) -> int | None:
@@ -247,15 +252,35 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
             export_legacy_names=conf.getboolean("metrics", "legacy_names_on"),
         )
         self.trigger_runner = None
+        peer_threads: list[threading.Thread] = []
         try:
-            # Kick off runner sub-process without DB access
+            # Kick off runner sub-processes without DB access. All of them are forked before any thread is
+            # started, the first one assigns triggers to this job and splits them between all runners.
+            num_runners = conf.getint("triggerer", "runner_processes", fallback=1)
             self.trigger_runner = TriggerRunnerSupervisor.start(
                 job=self.job,
                 capacity=self.capacity,
                 logger=log,
                 queues=self.queues,
                 team_name=self.team_name,
+                num_partitions=num_runners,
             )
+            for partition in range(1, num_runners):
+                self.trigger_runner.peers.append(
+                    TriggerRunnerSupervisor.start(
+                        job=self.job,
+                        capacity=self.capacity,
+                        logger=log,
+                        queues=self.queues,
+                        team_name=self.team_name,
+                        partition=partition,
+                        num_partitions=num_runners,
+                    )
+                )
+            for peer in self.trigger_runner.peers:
+                thread = threading.Thread(target=peer.run_as_peer, name=f"trigger-runner-{peer.partition}")
+                thread.start()
+                peer_threads.append(thread)
             # Run the main DB comms loop in this process
             self.trigger_runner.run()
             return self.trigger_runner._exit_code
@@ -264,11 +289,16 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
             raise
         finally:
             self.log.info("Waiting for triggers to clean up")
-            # Tell the subprocess to stop and then wait for it.
+            # Tell the subprocesses to stop and then wait for them.
             # If the user interrupts/terms again, _graceful_exit will allow them
             # to force-kill here. trigger_runner may be None if start() raised.
             if self.trigger_runner is not None:
-                self.trigger_runner.kill(escalation_delay=10, force=True)
+                for peer in self.trigger_runner.peers:
+                    peer.stop = True
+                for thread in peer_threads:
+                    thread.join()
+                for runner in (self.trigger_runner, *self.trigger_runner.peers):
+                    runner.kill(escalation_delay=10, force=True)
             self.log.info("Exited trigger loop")
             if _prev_ctx is None:
                 os.environ.pop("_AIRFLOW_PROCESS_CONTEXT", None)
@@ -447,7 +477,15 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
     queues: set[str] | None = None
     team_name: str | None = None
 
+    partition: int = 0
+    """Which share of the job's triggers this runner runs; the runner of partition 0 manages the job."""
+    num_partitions: int = 1
+    peers: list[TriggerRunnerSupervisor] = attrs.field(factory=list)
+    """Runners of the other partitions, driven from their own threads."""
+
     health_check_threshold = conf.getint("triggerer", "triggerer_health_check_threshold")
+    assignment_mode = conf.get("triggerer", "trigger_assignment_mode", fallback="capacity")
+    max_trigger_moves_per_loop = conf.getint("triggerer", "max_trigger_moves_per_loop", fallback=10)
     runner_health_check_threshold = conf.getfloat("triggerer", "runner_health_check_threshold")
 
     runner: TriggerRunner | None = None
@@ -461,6 +499,12 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
     _last_runner_comms: float = attrs.field(init=False, default=math.inf)
     _runner_comms_silence_logged: bool = attrs.field(init=False, default=False)
 
+    # When the triggers assigned to this triggerer were last loaded from the DB
+    _last_trigger_load: float = attrs.field(init=False, default=-math.inf)
+
+    # The exception the loop of a peer runner failed with, for the runner of partition 0 to raise
+    _peer_error: BaseException | None = attrs.field(init=False, default=None)
+
     decoder: ClassVar[TypeAdapter[ToTriggerSupervisor]] = TypeAdapter(ToTriggerSupervisor)
 
     # Maps trigger IDs that we think are running in the sub process
@@ -607,11 +651,22 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
         """Run synchronously and handle all database reads/writes."""
         with self.run_context():
             while not self.should_stop():
-                if not self.is_alive():
+                for peer in self.peers:
+                    if peer._peer_error is not None:
+                        log.error("Trigger runner of partition %s has failed! Exiting.", peer.partition)
+                        raise peer._peer_error
+                if not self.is_alive() or not all(peer.is_alive() for peer in self.peers):
                     log.error("Trigger runner process has died! Exiting.")
                     break
                 self.run_once()
 
+    def run_as_peer(self) -> None:
+        """Run the loop of a peer runner in its own thread, keeping the error it fails with, if any."""
+        try:
+            self.run()
+        except BaseException as e:
+            self._peer_error = e
+
     @contextmanager
     def run_context(self) -> Iterator[None]:
         """Wrap the run loop. Subclasses can override to install setup/teardown."""
@@ -623,17 +678,22 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
     def run_once(self) -> None:
         """Perform a single iteration of the run loop."""
-        self.load_triggers()
+        # The runner syncs with us as soon as its triggers fire, so the loop can come round many times a
+        # second; only go to the DB for new assignments once a second, like when it is idle.
+        if (now := time.monotonic()) - self._last_trigger_load >= _TRIGGER_LOAD_INTERVAL:
+            self.load_triggers()
+            self._last_trigger_load = now
 
-        # Wait for up to 1 second for activity
-        self._service_subprocess(1)
+        # Wait for activity, at most until the triggers have to be loaded again
+        self._service_subprocess(self._last_trigger_load + _TRIGGER_LOAD_INTERVAL - time.monotonic())
 
         self.handle_events()
         self.handle_failed_triggers()
-        self.clean_unused()
-        self.heartbeat()
+        if self.partition == 0:
+            self.clean_unused()
+            self.heartbeat()
 
-        self.emit_metrics()
+            self.emit_metrics()
 
     def heartbeat(self):
         if self.job is None:
@@ -641,7 +701,7 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                 "TriggerRunnerSupervisor.heartbeat() requires a Job; "
                 "subclasses without a metadata-DB Job must override this method."
             )
-        elapsed = time.monotonic() - self._last_runner_comms
+        elapsed = time.monotonic() - min(r._last_runner_comms for r in (self, *self.peers))
         if self.runner_health_check_threshold > 0 and elapsed > self.runner_health_check_threshold:
             if not self._runner_comms_silence_logged:
                 log.error(
@@ -666,15 +726,34 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                 "TriggerRunnerSupervisor.load_triggers() requires a Job; "
                 "subclasses without a metadata-DB Job must override this method."
             )
-        Trigger.assign_unassigned(
-            self.job.id,
-            self.capacity,
-            self.health_check_threshold,
-            queues=self.queues,
-            team_name=self.team_name,
-        )
+        # The runners of the other partitions only pick their share of the triggers assigned to the job
+        if self.partition == 0:
+            self._assign_triggers(self.job.id)
         ids = Trigger.ids_for_triggerer(self.job.id, queues=self.queues, team_name=self.team_name)
-        self.update_triggers(set(ids))
+        self.update_triggers({i for i in ids if i % self.num_partitions == self.partition})
+
+    def _assign_triggers(self, job_id: int) -> None:
+        if self.assignment_mode == "consistent_hash":
+            claimed, released = Trigger.assign_consistent_hash(
+                job_id,
+                self.capacity,
+                self.health_check_threshold,
+                self.max_trigger_moves_per_loop,
+                queues=self.queues,
+                team_name=self.team_name,
+            )
+            if claimed:
+                stats.incr("triggers.claimed", claimed)
+            if released:
+                stats.incr("triggers.released", released)
+        else:
+            Trigger.assign_unassigned(
+                job_id,
+                self.capacity,
+                self.health_check_threshold,
+                queues=self.queues,
+                team_name=self.team_name,
+            )
 
     def handle_events(self):
         """Dispatch outbound events to the Trigger model which pushes them to the relevant task instances."""
@@ -731,13 +810,14 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
     def emit_metrics(self):
         tags = self.metric_tags()
+        running = len(self.running_triggers) + sum(len(peer.running_triggers) for peer in self.peers)
         stats.gauge(
             "triggers.running",
-            len(self.running_triggers),
+            running,
             tags=tags,
         )
 
-        capacity_left = self.capacity - len(self.running_triggers)
+        capacity_left = self.capacity - running
         stats.gauge(
             "triggerer.capacity_left",
             capacity_left,
@@ -967,6 +1047,43 @@ class TriggerDetails(TypedDict):
     events: int
 
 
+class _TimedTriggerCoroutine(Coroutine):
+    """
+    Wrap the coroutine of a trigger to measure how long each of its steps holds the event loop.
+
+    The event loop drives a task by calling ``send``/``throw`` on its coroutine until the next ``await``
+    that suspends, so timing those calls gives the time the trigger itself spent on the loop.
+    """
+
+    __slots__ = ("_coro", "_name", "_classpath", "_runner")
+
+    def __init__(self, coro: Coroutine, *, name: str, classpath: str, runner: TriggerRunner):
+        self._coro = coro
+        self._name = name
+        self._classpath = classpath
+        self._runner = runner
+
+    def send(self, value):
+        start = time.perf_counter()
+        try:
+            return self._coro.send(value)
+        finally:
+            self._runner.record_trigger_step(self._name, self._classpath, time.perf_counter() - start)
+
+    def throw(self, *args):
+        start = time.perf_counter()
+        try:
+            return self._coro.throw(*args)
+        finally:
+            self._runner.record_trigger_step(self._name, self._classpath, time.perf_counter() - start)
+
+    def close(self):
+        return self._coro.close()
+
+    def __await__(self):
+        return self._coro.__await__()
+
+
 @attrs.define(kw_only=True)
 class TriggerCommsDecoder(CommsDecoder[ToTriggerRunner, ToTriggerSupervisor]):
     _async_writer: asyncio.StreamWriter = attrs.field(alias="async_writer")
@@ -1080,7 +1197,8 @@ class TriggerRunner:
 
     # Should-we-stop flag
     stop: bool = False
-    _stop_event: anyio.Event | None = None
+    # Set to wake the main loop up early: when stopping, or when a trigger fired an event or exited
+    _wakeup: asyncio.Event | None = None
 
     # TODO: connect this to the parent process
     log: FilteringBoundLogger = structlog.get_logger()
@@ -1096,7 +1214,7 @@ class TriggerRunner:
         self.events = deque()
         self.failed_triggers = deque()
         self.job_id = None
-        self._stop_event = None
+        self._wakeup = None
         self._shared_streams = SharedStreamManager(
             log=self.log,
             max_subscriber_queue=conf.getint("triggerer", "shared_stream_subscriber_queue_size"),
@@ -1104,12 +1222,23 @@ class TriggerRunner:
         self.blocked_main_thread_warning_threshold = conf.getfloat(
             "triggerer", "blocked_main_thread_warning_threshold"
         )
+        self.state_sync_batch_delay = conf.getfloat("triggerer", "state_sync_batch_delay", fallback=0.01)
+        self.slowest_triggers_report_size = conf.getint(
+            "triggerer", "slowest_triggers_report_size", fallback=10
+        )
+        # Time spent on the event loop since the last report, by trigger name and by trigger class
+        self.trigger_loop_time: Counter[str] = Counter()
+        self.trigger_class_loop_time: Counter[str] = Counter()
 
     def _handle_signal(self, signum, frame) -> None:
         """Handle termination signals gracefully."""
         self.stop = True
-        if self._stop_event is not None:
-            self._stop_event.set()
+        self.request_sync()
+
+    def request_sync(self) -> None:
+        """Wake the main loop up, so that it syncs the state of the triggers with the supervisor now."""
+        if self._wakeup is not None:
+            self._wakeup.set()
 
     def run(self):
         """Sync entrypoint - just run arun in an async loop."""
@@ -1137,7 +1266,7 @@ class TriggerRunner:
         await self.init_comms()
 
         watchdog = asyncio.create_task(self.block_watchdog())
-        stop_event = self._stop_event = anyio.Event()
+        self._wakeup = asyncio.Event()
 
         last_status = time.monotonic()
         try:
@@ -1157,15 +1286,14 @@ class TriggerRunner:
                 await self.sync_state_to_supervisor(finished_ids)
                 await self.create_triggers()
                 await self.cancel_triggers()
-                # Sleep for a bit, or exit early if stop is requested.
-                with anyio.move_on_after(1):
-                    await stop_event.wait()
+                await self.wait_for_state_change()
                 # Every minute, log status
                 if (now := time.monotonic()) - last_status >= 60:
                     watchers = len([trigger for trigger in self.triggers.values() if trigger["is_watcher"]])
                     triggers = len(self.triggers) - watchers
                     self.log.info("%i triggers currently running", triggers)
                     self.log.info("%i watchers currently running", watchers)
+                    self.report_trigger_loop_time(now - last_status)
                     last_status = now
 
         except Exception:
@@ -1187,6 +1315,25 @@ class TriggerRunner:
         # Wait for supporting tasks to complete
         await watchdog
 
+    async def wait_for_state_change(self) -> None:
+        """
+        Wait until there is something to sync with the supervisor, or the sync interval passes.
+
+        Triggers firing an event or exiting wake the loop up straight away, so that deferred tasks resume
+        without waiting for the next sync. After waking up the loop waits ``state_sync_batch_delay`` more,
+        so a burst of events is sent in one sync rather than in one sync each.
+        """
+        if self._wakeup is None:
+            raise RuntimeError("wait_for_state_change() must be called from arun()")
+        if not (self.events or self.failed_triggers):
+            with anyio.move_on_after(_TRIGGER_LOAD_INTERVAL):
+                await self._wakeup.wait()
+            if not self._wakeup.is_set():
+                return
+        if not self.stop:
+            await asyncio.sleep(self.state_sync_batch_delay)
+        self._wakeup.clear()
+
     async def init_comms(self):
         """
         Set up the communications pipe between this process and the supervisor.
@@ -1286,11 +1433,16 @@ class TriggerRunner:
             trigger_instance.triggerer_job_id = self.job_id
             trigger_instance.timeout_after = workload.timeout_after
 
+            coro = _TimedTriggerCoroutine(
+                self.run_trigger(trigger_id, trigger_instance, workload.timeout_after, context),
+                name=trigger_name,
+                classpath=workload.classpath,
+                runner=self,
+            )
+            task = asyncio.create_task(coro, name=trigger_name)
+            task.add_done_callback(lambda _: self.request_sync())
             self.triggers[trigger_id] = {
-                "task": asyncio.create_task(
-                    self.run_trigger(trigger_id, trigger_instance, workload.timeout_after, context),
-                    name=trigger_name,
-                ),
+                "task": task,
                 "is_watcher": isinstance(trigger_instance, BaseEventTrigger),
                 "name": trigger_name,
                 "events": 0,
@@ -1441,8 +1593,8 @@ class TriggerRunner:
         there are badly-written triggers taking longer than that and blocking
         the event loop.
 
-        Unfortunately, we can't tell what trigger is blocking things, but
-        we can at least detect the top-level problem.
+        This also catches blocking code outside of triggers; the triggers
+        responsible for blocking are logged by :meth:`record_trigger_step`.
         """
         while not self.stop:
             last_run = time.monotonic()
@@ -1461,6 +1613,35 @@ class TriggerRunner:
                 )
                 stats.incr("triggers.blocked_main_thread")
 
+    def record_trigger_step(self, name: str, classpath: str, duration: float) -> None:
+        """Account for one step of a trigger's coroutine run on the event loop."""
+        self.trigger_loop_time[name] += duration
+        self.trigger_class_loop_time[classpath] += duration
+        if duration > self.blocked_main_thread_warning_threshold:
+            self.log.warning(
+                "Trigger %s blocked the triggerer's async thread for %.2f seconds, exceeding the "
+                "configured warning threshold of %.2f seconds. It should await instead of blocking.",
+                name,
+                duration,
+                self.blocked_main_thread_warning_threshold,
+            )
+
+    def report_trigger_loop_time(self, interval: float) -> None:
+        """Emit the time triggers spent on the event loop since the last report, and log the slowest ones."""
+        for classpath, seconds in self.trigger_class_loop_time.items():
+            stats.timing("triggers.loop_time", timedelta(seconds=seconds), tags={"classpath": classpath})
+        if self.slowest_triggers_report_size > 0 and self.trigger_loop_time:
+            lines = [f"{'loop ms':>10} {'share':>7}  trigger"]
+            for name, seconds in self.trigger_loop_time.most_common(self.slowest_triggers_report_size):
+                lines.append(f"{seconds * 1000:>10.1f} {seconds / interval:>7.2%}  {name}")
+            self.log.info(
+                "Triggers that spent the most time on the event loop in the last %.0f seconds:\n%s",
+                interval,
+                "\n".join(lines),
+            )
+        self.trigger_loop_time.clear()
+        self.trigger_class_loop_time.clear()
+
     async def run_trigger(
         self,
         trigger_id: int,
@@ -1527,6 +1708,7 @@ class TriggerRunner:
                     )
                     self.triggers[trigger_id]["events"] += 1
                     self.events.append((trigger_id, event))
+                    self.request_sync()
                 span.set_status(Status(StatusCode.OK))
             except asyncio.CancelledError as e:
                 # A trigger can be cancelled for two reasons:
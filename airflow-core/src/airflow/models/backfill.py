@@ -59,6 +59,9 @@ if TYPE_CHECKING:
 
 log = structlog.get_logger(__name__)
 
+#: Number of Dag runs of a backfill created per transaction.
+BACKFILL_DAG_RUN_BATCH_SIZE = 500
+
 
 class AlreadyRunningBackfill(AirflowException):
     """
@@ -722,25 +725,119 @@ def _create_runs_non_partitioned(
     run_on_latest_version: bool,
     session: Session,
 ) -> None:
+    from airflow.models.dagrun import DagRun
+
     for info in dagrun_info_list:
         if info.partition_key or not info.logical_date:
             raise RuntimeError("Expected all Dag run infos to have logical date and no partition key.")
 
-    for backfill_sort_ordinal, info in enumerate(dagrun_info_list, start=1):
-        _create_backfill_dag_run_non_partitioned(
+    reprocess_behavior = ReprocessBehavior(br.reprocess_behavior)
+    logical_dates = [info.logical_date for info in dagrun_info_list]
+    existing_dates = set(
+        session.scalars(
+            select(DagRun.logical_date).where(
+                DagRun.dag_id == dag.dag_id,
+                DagRun.logical_date.between(min(logical_dates), max(logical_dates)),
+            )
+        )
+    )
+
+    # Runs are created a batch at a time, each in its own transaction, so creating a long backfill does
+    # not hold a single transaction open, and the scheduler can start on the first runs in the meantime.
+    total = len(dagrun_info_list)
+    for batch_start in range(0, total, BACKFILL_DAG_RUN_BATCH_SIZE):
+        batch = list(
+            enumerate(
+                dagrun_info_list[batch_start : batch_start + BACKFILL_DAG_RUN_BATCH_SIZE],
+                start=batch_start + 1,
+            )
+        )
+        created_in_bulk = _create_backfill_dag_runs_in_bulk(
             dag=dag,
-            info=info,
-            backfill_id=br.id,
-            dag_run_conf=br.dag_run_conf,
-            reprocess_behavior=ReprocessBehavior(br.reprocess_behavior),
-            backfill_sort_ordinal=backfill_sort_ordinal,
-            triggering_user_name=br.triggering_user_name,
-            run_on_latest_version=run_on_latest_version,
+            br=br,
+            infos=[(ordinal, info) for ordinal, info in batch if info.logical_date not in existing_dates],
             session=session,
         )
+        for backfill_sort_ordinal, info in batch:
+            if created_in_bulk and info.logical_date not in existing_dates:
+                continue
+            _create_backfill_dag_run_non_partitioned(
+                dag=dag,
+                info=info,
+                backfill_id=br.id,
+                dag_run_conf=br.dag_run_conf,
+                reprocess_behavior=reprocess_behavior,
+                backfill_sort_ordinal=backfill_sort_ordinal,
+                triggering_user_name=br.triggering_user_name,
+                run_on_latest_version=run_on_latest_version,
+                session=session,
+            )
+        session.commit()
         log.info(
-            "Created backfill Dag run.",
+            "Created backfill Dag runs.",
             dag_id=dag.dag_id,
             backfill_id=br.id,
-            info=info,
+            created=batch_start + len(batch),
+            total=total,
         )
+
+
+def _create_backfill_dag_runs_in_bulk(
+    *,
+    dag: SerializedDAG,
+    br: Backfill,
+    infos: list[tuple[int, DagRunInfo]],
+    session: Session,
+) -> bool:
+    """
+    Create the Dag runs of a backfill for logical dates without any run yet, along with their task instances.
+
+    :param infos: The Dag run infos to create a run for, with their sort ordinal in the backfill.
+    :return: Whether the runs were created. They are not if some run was created concurrently.
+    """
+    from airflow.models.dagrun import DagRun
+
+    if not infos:
+        return False
+    try:
+        with session.begin_nested():
+            runs = dag.create_dagruns(
+                runs=[
+                    (
+                        DagRun.generate_run_id(
+                            run_type=DagRunType.BACKFILL_JOB,
+                            logical_date=info.logical_date,
+                            run_after=info.run_after,
+                        ),
+                        info,
+                    )
+                    for _, info in infos
+                ],
+                conf=br.dag_run_conf,
+                run_type=DagRunType.BACKFILL_JOB,
+                triggered_by=DagRunTriggeredByType.BACKFILL,
+                triggering_user_name=br.triggering_user_name,
+                state=DagRunState.QUEUED,
+                start_date=timezone.utcnow(),
+                backfill_id=br.id,
+                session=session,
+            )
+    except IntegrityError:
+        log.info(
+            "Some backfill Dag runs were created concurrently; creating them one at a time.",
+            dag_id=dag.dag_id,
+            backfill_id=br.id,
+        )
+        return False
+
+    session.add_all(
+        BackfillDagRun(
+            backfill_id=br.id,
+            dag_run_id=run.id,
+            sort_ordinal=backfill_sort_ordinal,
+            logical_date=info.logical_date,
+            partition_key=info.partition_key,
+        )
+        for run, (backfill_sort_ordinal, info) in zip(runs, infos)
+    )
+    return True
@@ -48,7 +48,6 @@ from sqlalchemy.orm import (
     Mapped,
     Session,
     backref,
-    joinedload,
     load_only,
     mapped_column,
     relationship,
@@ -57,15 +56,14 @@ from sqlalchemy.sql import expression
 
 from airflow import settings
 from airflow._shared.timezones import timezone
-from airflow.assets.evaluation import AssetEvaluator
+from airflow.assets.trigger_index import AssetTriggerIndex
 from airflow.configuration import conf as airflow_conf
 from airflow.exceptions import AirflowException
-from airflow.models.asset import AssetDagRunQueue, AssetModel
+from airflow.models.asset import AssetModel
 from airflow.models.base import Base, StringID
 from airflow.models.dagbundle import DagBundleModel
 from airflow.models.dagrun import DagRun
 from airflow.models.team import Team
-from airflow.serialization.definitions.assets import SerializedAssetUniqueKey
 from airflow.serialization.encoders import DAT, encode_deadline_alert
 from airflow.serialization.enums import Encoding
 from airflow.timetables.base import DataInterval, PartitionMapperInfo, Timetable
@@ -77,8 +75,6 @@ from airflow.utils.state import DagRunState
 from airflow.utils.types import DagRunType
 
 if TYPE_CHECKING:
-    from typing import TypeAlias
-
     from dateutil.relativedelta import relativedelta
 
     from airflow.sdk import Context
@@ -90,14 +86,13 @@ if TYPE_CHECKING:
     from airflow.serialization.definitions.dag import SerializedDAG
     from airflow.serialization.serialized_objects import LazyDeserializedDAG
 
-    UKey: TypeAlias = SerializedAssetUniqueKey
     DagStateChangeCallback = Callable[[Context], None]
     ScheduleInterval = None | str | timedelta | relativedelta
 
     ScheduleArg = (
         ScheduleInterval
         | Timetable
-        | "SerializedAssetBase"
+        | SerializedAssetBase
         | Collection["SerializedAsset" | "SerializedAssetAlias"]
     )
 
@@ -680,7 +675,9 @@ class DagModel(Base):
         return any_deactivated
 
     @classmethod
-    def dags_needing_dagruns(cls, session: Session) -> tuple[Any, dict[str, datetime]]:
+    def dags_needing_dagruns(
+        cls, session: Session, asset_trigger_index: AssetTriggerIndex | None = None
+    ) -> tuple[Any, dict[str, datetime]]:
         """
         Return (and lock) a list of Dag objects that are due to create a new DagRun.
 
@@ -692,77 +689,14 @@ class DagModel(Base):
         ``SerializedDagModel`` row are omitted from ``triggered_date_by_dag`` until serialization exists;
         ADRQs are **not** deleted here so the scheduler can re-evaluate on a later run.
 
+        :param asset_trigger_index: Index of the queued asset events kept across calls, so only the events
+            queued since the previous call are processed. Without one, all queued events are.
+
         :meta private:
         """
-        from airflow.models.serialized_dag import SerializedDagModel
-
-        evaluator = AssetEvaluator(session)
-
-        def dag_ready(dag_id: str, cond: SerializedAssetBase, statuses: dict[UKey, bool]) -> bool:
-            try:
-                return evaluator.run(cond, statuses)
-            except AttributeError:
-                # if dag was serialized before 2.9 and we *just* upgraded,
-                # we may be dealing with old version.  In that case,
-                # just wait for the dag to be reserialized.
-                log.warning("Dag '%s' has old serialization; skipping run creation.", dag_id)
-                return False
-            except Exception:
-                log.exception("Dag '%s' failed to be evaluated; assuming not ready", dag_id)
-                return False
-
-        # this loads all the ADRQ records.... may need to limit num dags
-        adrq_by_dag: dict[str, list[AssetDagRunQueue]] = defaultdict(list)
-        for adrq in session.scalars(
-            select(AssetDagRunQueue).options(
-                joinedload(AssetDagRunQueue.dag_model),
-                joinedload(AssetDagRunQueue.asset),
-            )
-        ):
-            if adrq.dag_model.asset_expression is None:
-                # The dag referenced does not actually depend on an asset! This
-                # could happen if the dag DID depend on an asset at some point,
-                # but no longer does. Delete the stale adrq.
-                session.delete(adrq)
-            else:
-                adrq_by_dag[adrq.target_dag_id].append(adrq)
-
-        if adrq_by_dag:
-            log.info(
-                "Asset-triggered Dags with queued events: %s",
-                {dag_id: len(adrqs) for dag_id, adrqs in adrq_by_dag.items()},
-            )
-
-        dag_statuses: dict[str, dict[UKey, bool]] = {
-            dag_id: {SerializedAssetUniqueKey.from_asset(adrq.asset): True for adrq in adrqs}
-            for dag_id, adrqs in adrq_by_dag.items()
-        }
-        ser_dags = SerializedDagModel.get_latest_serialized_dags(dag_ids=list(dag_statuses), session=session)
-        ser_dag_ids = {ser_dag.dag_id for ser_dag in ser_dags}
-        if missing_from_serialized := set(adrq_by_dag.keys()) - ser_dag_ids:
-            log.info(
-                "Dags have queued asset events (ADRQ), but are not found in the serialized_dag table."
-                " — skipping Dag run creation: %s",
-                sorted(missing_from_serialized),
-            )
-            for dag_id in missing_from_serialized:
-                del adrq_by_dag[dag_id]
-                del dag_statuses[dag_id]
-        for ser_dag in ser_dags:
-            dag_id = ser_dag.dag_id
-            statuses = dag_statuses[dag_id]
-            ready = dag_ready(dag_id, cond=ser_dag.dag.timetable.asset_condition, statuses=statuses)
-            if not ready:
-                log.debug("Asset condition not met for dag '%s'", dag_id)
-                del adrq_by_dag[dag_id]
-                del dag_statuses[dag_id]
-        del dag_statuses
-
-        # triggered dates for asset triggered dags
-        triggered_date_by_dag: dict[str, datetime] = {
-            dag_id: max(adrq.created_at for adrq in adrqs) for dag_id, adrqs in adrq_by_dag.items()
-        }
-        del adrq_by_dag
+        if asset_trigger_index is None:
+            asset_trigger_index = AssetTriggerIndex()
+        triggered_date_by_dag = asset_trigger_index.triggered_dates(session)
 
         asset_triggered_dag_ids = set(triggered_date_by_dag.keys())
         if asset_triggered_dag_ids:
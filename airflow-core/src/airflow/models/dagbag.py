@@ -18,14 +18,16 @@
 from __future__ import annotations
 
 import hashlib
-from collections.abc import MutableMapping
+import logging
+import sys
+from collections.abc import Iterable, MutableMapping
 from contextlib import nullcontext
 from threading import RLock
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from cachetools import LRUCache, TTLCache
-from sqlalchemy import String, select
+from sqlalchemy import String, and_, func, select
 from sqlalchemy.orm import Mapped, joinedload, mapped_column
 
 from airflow._shared.observability.metrics import stats
@@ -41,14 +43,52 @@ if TYPE_CHECKING:
     from airflow.models.serialized_dag import SerializedDagModel
     from airflow.serialization.definitions.dag import SerializedDAG
 
+log = logging.getLogger(__name__)
+
+
+def _attribute_values(obj: Any) -> Iterable[Any]:
+    if (attributes := getattr(obj, "__dict__", None)) is not None:
+        return attributes.values()
+    return (getattr(obj, name, None) for cls in type(obj).__mro__ for name in getattr(cls, "__slots__", ()))
+
+
+def estimate_dag_size(dag: SerializedDAG) -> int:
+    """
+    Roughly estimate how many bytes a deserialized DAG holds in memory.
+
+    This adds up the size of the DAG, of each of its tasks, and of their attribute values, without
+    following references any deeper. It undercounts, but scales with the number of tasks and the size of
+    their arguments, which is what matters to weigh DAGs against each other in a cache.
+    """
+    size = 0
+    for obj in (dag, *dag.task_dict.values()):
+        size += sys.getsizeof(obj)
+        size += sum(sys.getsizeof(value) for value in _attribute_values(obj))
+    return size
+
+
+class _SizeBoundedDagCache(LRUCache):
+    """LRU cache of deserialized DAGs bounded by their estimated size in bytes rather than their count."""
+
+    def __init__(self, max_bytes: int) -> None:
+        super().__init__(maxsize=max_bytes, getsizeof=estimate_dag_size)
+        self.evictions = 0
+
+    def popitem(self):
+        item = super().popitem()
+        self.evictions += 1
+        stats.incr("scheduler.dag_bag.cache_evict")
+        return item
+
 
 class DBDagBag:
     """
     Internal class for retrieving dags from the database.
 
-    Optionally supports LRU+TTL caching when cache_size is provided.
-    The scheduler uses this without caching, while the API server can
-    enable caching via configuration.
+    Optionally supports LRU+TTL caching when cache_size is provided, which the
+    API server enables via configuration. The scheduler instead passes
+    max_cache_bytes, which bounds the cache by the estimated in-memory size of
+    the cached DAGs (if not 0) and reports ``scheduler.dag_bag.*`` metrics.
 
     :meta private:
     """
@@ -58,6 +98,7 @@ class DBDagBag:
         load_op_links: bool = True,
         cache_size: int | None = None,
         cache_ttl: int | None = None,
+        max_cache_bytes: int | None = None,
     ) -> None:
         """
         Initialize DBDagBag.
@@ -65,10 +106,13 @@ class DBDagBag:
         :param load_op_links: Should the extra operator link be loaded when de-serializing the DAG?
         :param cache_size: Size of LRU cache. If None or 0, uses unbounded dict (no eviction).
         :param cache_ttl: Time-to-live for cache entries in seconds. If None or 0, no TTL (LRU only).
+        :param max_cache_bytes: Estimated memory the cached DAGs may take up, evicting the least recently
+            used DAGs beyond that; 0 means no limit. Ignored if cache_size is given.
         """
         self.load_op_links = load_op_links
         self._dags: MutableMapping[UUID | str, SerializedDAG] = {}
         self._use_cache = False
+        self._report_scheduler_metrics = max_cache_bytes is not None and not (cache_size and cache_size > 0)
 
         # Initialize bounded cache if cache_size is provided and > 0
         if cache_size and cache_size > 0:
@@ -77,11 +121,15 @@ class DBDagBag:
             else:
                 self._dags = LRUCache(maxsize=cache_size)
             self._use_cache = True
+        elif max_cache_bytes:
+            self._dags = _SizeBoundedDagCache(max_cache_bytes)
 
         # Lock required for bounded caches: cachetools caches are NOT thread-safe
         # (LRU reordering and TTL cleanup mutate internal linked lists).
         # nullcontext for unbounded dict avoids lock overhead in the scheduler path.
-        self._lock: RLock | nullcontext = RLock() if self._use_cache else nullcontext()
+        self._lock: RLock | nullcontext = (
+            RLock() if self._use_cache or isinstance(self._dags, LRUCache) else nullcontext()
+        )
 
     def _read_dag(self, serdag: SerializedDagModel) -> SerializedDAG | None:
         """Read and optionally cache a SerializedDAG from a SerializedDagModel."""
@@ -90,10 +138,16 @@ class DBDagBag:
         if not dag:
             return None
         with self._lock:
-            self._dags[serdag.dag_version_id] = dag
+            try:
+                self._dags[serdag.dag_version_id] = dag
+            except ValueError:
+                # Larger than the whole size-bounded cache; serve it without caching it.
+                log.warning("DAG %s is too large to be cached", serdag.dag_id)
             cache_size = len(self._dags)
         if self._use_cache:
             stats.gauge("api_server.dag_bag.cache_size", cache_size, rate=0.1)
+        elif isinstance(self._dags, _SizeBoundedDagCache):
+            stats.gauge("scheduler.dag_bag.cache_bytes", self._dags.currsize, rate=0.1)
         return dag
 
     def _get_dag(self, version_id: UUID | str, session: Session) -> SerializedDAG | None:
@@ -104,6 +158,8 @@ class DBDagBag:
         if dag:
             if self._use_cache:
                 stats.incr("api_server.dag_bag.cache_hit")
+            elif self._report_scheduler_metrics:
+                stats.incr("scheduler.dag_bag.cache_hit")
             return dag
 
         dag_version = session.get(DagVersion, version_id, options=[joinedload(DagVersion.serialized_dag)])
@@ -121,6 +177,8 @@ class DBDagBag:
                     stats.incr("api_server.dag_bag.cache_hit")
                     return dag
             stats.incr("api_server.dag_bag.cache_miss")
+        elif self._report_scheduler_metrics:
+            stats.incr("scheduler.dag_bag.cache_miss")
         return self._read_dag(serdag)
 
     def get_dag(self, version_id: UUID | str, session: Session) -> SerializedDAG | None:
@@ -156,6 +214,51 @@ class DBDagBag:
             stats.gauge("api_server.dag_bag.cache_size", 0)
         return count
 
+    def prewarm(self, *, session: Session) -> int:
+        """
+        Deserialize and cache the latest version of every active, unpaused DAG.
+
+        Stops early once a size-bounded cache is full, so pre-warming doesn't evict what it just loaded.
+
+        :return: Number of DAGs cached.
+        """
+        from airflow.models.dag import DagModel
+        from airflow.models.serialized_dag import SerializedDagModel
+
+        latest = (
+            select(SerializedDagModel.dag_id, func.max(SerializedDagModel.created_at).label("max_created"))
+            .group_by(SerializedDagModel.dag_id)
+            .subquery()
+        )
+        serdags = session.scalars(
+            select(SerializedDagModel)
+            .join(
+                latest,
+                and_(
+                    SerializedDagModel.dag_id == latest.c.dag_id,
+                    SerializedDagModel.created_at == latest.c.max_created,
+                ),
+            )
+            .join(DagModel, DagModel.dag_id == SerializedDagModel.dag_id)
+            .where(~DagModel.is_paused, ~DagModel.is_stale)
+        )
+        evictions = self._dags.evictions if isinstance(self._dags, _SizeBoundedDagCache) else 0
+        count = 0
+        for serdag in serdags:
+            with self._lock:
+                if serdag.dag_version_id in self._dags:
+                    continue
+            try:
+                dag = self._read_dag(serdag)
+            except Exception:
+                log.exception("Failed to deserialize DAG %s while pre-warming the DAG cache", serdag.dag_id)
+                continue
+            if isinstance(self._dags, _SizeBoundedDagCache) and self._dags.evictions > evictions:
+                break
+            if dag:
+                count += 1
+        return count
+
     @staticmethod
     def _version_from_dag_run(dag_run: DagRun, *, session: Session) -> UUID | None:
         if not dag_run.bundle_version:
@@ -1108,7 +1108,11 @@ class DagRun(Base, LoggingMixin):
 
     @provide_session
     def update_state(
-        self, *, session: Session = NEW_SESSION, execute_callbacks: bool = True
+        self,
+        *,
+        session: Session = NEW_SESSION,
+        execute_callbacks: bool = True,
+        tis: list[TI] | None = None,
     ) -> tuple[list[TI], DagCallbackRequest | None]:
         """
         Determine the overall state of the DagRun based on the state of its TaskInstances.
@@ -1116,6 +1120,8 @@ class DagRun(Base, LoggingMixin):
         :param session: Sqlalchemy ORM Session
         :param execute_callbacks: Should dag callbacks (success/failure, SLA etc.) be invoked
             directly (default: true) or recorded as a pending request in the ``returned_callback`` property
+        :param tis: All task instances of this dag run, if already loaded (e.g. together with those of
+            other dag runs). They are fetched from the database if not given.
         :return: Tuple containing tis that can be scheduled in the current loop & `returned_callback` that
             needs to be executed
         """
@@ -1156,7 +1162,7 @@ class DagRun(Base, LoggingMixin):
             tags=self.stats_tags,
         ):
             dag = self.get_dag()
-            info = self.task_instance_scheduling_decisions(session=session)
+            info = self.task_instance_scheduling_decisions(session=session, tis=tis)
 
             tis = info.tis
             schedulable_tis = info.schedulable_tis
@@ -1306,8 +1312,14 @@ class DagRun(Base, LoggingMixin):
         return schedulable_tis, callback
 
     @provide_session
-    def task_instance_scheduling_decisions(self, *, session: Session = NEW_SESSION) -> TISchedulingDecision:
-        tis = self.get_task_instances(session=session, state=State.task_states)
+    def task_instance_scheduling_decisions(
+        self, *, session: Session = NEW_SESSION, tis: list[TI] | None = None
+    ) -> TISchedulingDecision:
+        if tis is None:
+            tis = self.get_task_instances(session=session, state=State.task_states)
+        elif (task_ids := DagRun._get_partial_task_ids(self.dag)) is not None:
+            partial_task_ids = set(task_ids)
+            tis = [ti for ti in tis if ti.task_id in partial_task_ids]
         self.log.debug("number of tis tasks for %s: %s task(s)", self, len(tis))
 
         def _filter_tis_and_exclude_removed(dag: SerializedDAG, tis: list[TI]) -> Iterable[TI]:
@@ -1680,15 +1692,7 @@ class DagRun(Base, LoggingMixin):
         )
 
         def task_filter(task: Operator) -> bool:
-            return task.task_id not in task_ids and (
-                self.run_type == DagRunType.BACKFILL_JOB
-                or (
-                    task.start_date is None
-                    or self.logical_date is None
-                    or task.start_date <= self.logical_date
-                )
-                and (task.end_date is None or self.logical_date is None or self.logical_date <= task.end_date)
-            )
+            return task.task_id not in task_ids and self._covers_task(task)
 
         created_counts: dict[str, int] = defaultdict(int)
         task_creator = self._get_task_creator(
@@ -1703,6 +1707,60 @@ class DagRun(Base, LoggingMixin):
         )
         self._create_task_instances(self.dag_id, tis_to_create, created_counts, hook_is_noop, session=session)
 
+    @classmethod
+    def create_task_instances_for_new_runs(
+        cls, dag_runs: Sequence[DagRun], *, dag_version_id: UUID, session: Session
+    ) -> None:
+        """
+        Create the task instances of Dag runs that were just created, all together.
+
+        This is what :meth:`verify_integrity` does for a run without any task instance yet, with the task
+        instances of all ``dag_runs`` inserted at once. The runs must belong to the same Dag, which must be
+        set on them. Unlike :meth:`verify_integrity`, a conflict with existing task instances is raised.
+
+        :param dag_runs: The newly created Dag runs
+        :param dag_version_id: The DAG version ID
+        :param session: Sqlalchemy ORM Session
+        """
+        from airflow.settings import task_instance_mutation_hook
+
+        if not dag_runs:
+            return
+        hook_is_noop: Literal[True, False] = getattr(task_instance_mutation_hook, "is_noop", False)
+
+        created_counts: dict[str, int] = defaultdict(int)
+        tis_to_create: list[Any] = []
+        for dag_run in dag_runs:
+            task_creator = dag_run._get_task_creator(
+                created_counts, task_instance_mutation_hook, hook_is_noop, dag_version_id
+            )
+            tis_to_create.extend(
+                dag_run._create_tasks(
+                    (task for task in dag_run.get_dag().task_dict.values() if dag_run._covers_task(task)),
+                    task_creator,
+                    session=session,
+                )
+            )
+        if hook_is_noop:
+            session.bulk_insert_mappings(TI.__mapper__, tis_to_create)
+        else:
+            session.bulk_save_objects(tis_to_create)
+        session.flush()
+
+        for task_type, count in created_counts.items():
+            stats.incr(
+                "task_instance_created",
+                count,
+                tags={**dag_runs[0].stats_tags, "task_type": task_type},
+            )
+
+    def _covers_task(self, task: Operator) -> bool:
+        """Whether the start and end dates of ``task`` let it have a task instance in this run."""
+        return self.run_type == DagRunType.BACKFILL_JOB or (
+            (task.start_date is None or self.logical_date is None or task.start_date <= self.logical_date)
+            and (task.end_date is None or self.logical_date is None or self.logical_date <= task.end_date)
+        )
+
     def _check_for_removed_or_restored_tasks(
         self, dag: SerializedDAG, ti_mutation_hook, *, session: Session
     ) -> set[str]:
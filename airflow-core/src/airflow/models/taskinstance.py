@@ -76,7 +76,7 @@ from airflow._shared.observability.traces import (
     new_task_run_carrier,
 )
 from airflow._shared.timezones import timezone
-from airflow.assets.manager import asset_manager
+from airflow.assets.manager import AssetChange, asset_manager
 from airflow.configuration import conf
 from airflow.exceptions import RemovedInAirflow4Warning
 from airflow.executors.workloads import BaseWorkload
@@ -1573,28 +1573,19 @@ class TaskInstance(Base, LoggingMixin, BaseWorkload):
             )
         }
 
+        # Registered at once below, so the number of queries does not grow with the number of outlets
+        changes: list[AssetChange] = []
+
         def _register(am: AssetModel, key: SerializedAssetUniqueKey) -> None:
             payloads_for_asset = payloads_by_asset.get(key, [])
             if not payloads_for_asset:
-                asset_manager.register_asset_change(
-                    task_instance=ti,
-                    asset=am,
-                    extra=None,
-                    partition_key=dag_run_partition_key,
-                    session=session,
-                )
+                changes.append(AssetChange(am, partition_key=dag_run_partition_key))
                 return
             for payload in payloads_for_asset:
                 effective_pk = (
                     payload.partition_key if payload.partition_key is not None else dag_run_partition_key
                 )
-                asset_manager.register_asset_change(
-                    task_instance=ti,
-                    asset=am,
-                    extra=payload.extra,
-                    partition_key=effective_pk,
-                    session=session,
-                )
+                changes.append(AssetChange(am, extra=payload.extra, partition_key=effective_pk))
 
         for key in asset_keys:
             try:
@@ -1655,13 +1646,13 @@ class TaskInstance(Base, LoggingMixin, BaseWorkload):
             return d
 
         outlet_alias_names = {o.name for o in task_outlets if o.type == "AssetAlias" and o.name}
+        alias_changes: list[AssetChange] = []
         if outlet_alias_names and (event_extras_from_aliases := _asset_event_extras_from_aliases()):
             for (
                 asset_key,
                 asset_extra_json,
                 asset_event_extras_json,
             ), event_aliase_names in event_extras_from_aliases.items():
-                asset_event_extra = json.loads(asset_event_extras_json)
                 asset = SerializedAsset(
                     name=asset_key.name,
                     uri=asset_key.uri,
@@ -1670,26 +1661,30 @@ class TaskInstance(Base, LoggingMixin, BaseWorkload):
                     watchers=[],
                 )
                 ti.log.debug("register event for asset %s with aliases %s", asset_key, event_aliase_names)
-                event = asset_manager.register_asset_change(
-                    task_instance=ti,
-                    asset=asset,
-                    source_alias_names=event_aliase_names,
-                    extra=asset_event_extra,
-                    partition_key=dag_run_partition_key,
-                    session=session,
-                )
-                if event is None:
-                    ti.log.info("Dynamically creating AssetModel %s", asset_key)
-                    session.add(AssetModel.from_serialized(asset))
-                    session.flush()  # So event can set up its asset fk.
-                    asset_manager.register_asset_change(
-                        task_instance=ti,
-                        asset=asset,
+                alias_changes.append(
+                    AssetChange(
+                        asset,
+                        extra=json.loads(asset_event_extras_json),
                         source_alias_names=event_aliase_names,
-                        extra=asset_event_extra,
                         partition_key=dag_run_partition_key,
-                        session=session,
                     )
+                )
+
+        events = asset_manager.register_asset_changes(
+            task_instance=ti, changes=[*changes, *alias_changes], session=session
+        )
+        if missing := [
+            change for change, event in zip(alias_changes, events[len(changes) :]) if event is None
+        ]:
+            # An asset emitted through aliases with different extras is still created only once
+            assets_to_create: dict[SerializedAssetUniqueKey, SerializedAsset] = {}
+            for change in missing:
+                assets_to_create.setdefault(SerializedAssetUniqueKey.from_asset(change.asset), change.asset)
+            for asset_key, asset in assets_to_create.items():
+                ti.log.info("Dynamically creating AssetModel %s", asset_key)
+                session.add(AssetModel.from_serialized(asset))
+            session.flush()  # So events can set up their asset fk.
+            asset_manager.register_asset_changes(task_instance=ti, changes=missing, session=session)
 
     @provide_session
     def update_rtif(self, rendered_fields, *, session: Session = NEW_SESSION):
@@ -16,9 +16,10 @@
 # under the License.
 from __future__ import annotations
 
+import bisect
 import datetime
 import logging
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from enum import Enum
 from functools import singledispatch
 from traceback import format_exception
@@ -37,6 +38,7 @@ from airflow.models.base import Base
 from airflow.models.taskinstance import TaskInstance
 from airflow.serialization.enums import stringify_encoding_keys as _stringify_encoding_keys
 from airflow.triggers.base import BaseTaskEndEvent
+from airflow.utils.hashlib_wrapper import md5
 from airflow.utils.retries import run_with_db_retries
 from airflow.utils.session import NEW_SESSION, provide_session
 from airflow.utils.sqlalchemy import UtcDateTime, get_dialect_name, with_row_locks
@@ -72,6 +74,56 @@ class TriggerFailureReason(str, Enum):
     TRIGGER_FAILURE = "Trigger failure"
 
 
+class TriggererHashRing:
+    """
+    Consistent-hash ring mapping trigger ids to triggerer job ids.
+
+    Each triggerer is placed on the ring at several points, so that adding or removing one only moves the
+    triggers between it and its neighbours instead of reshuffling all of them.
+
+    :param triggerer_ids: Ids of the triggerer jobs on the ring.
+    :param points_per_triggerer: Number of points each triggerer takes on the ring.
+    """
+
+    def __init__(self, triggerer_ids: Iterable[int], points_per_triggerer: int = 64):
+        points = sorted(
+            (self._hash(f"{triggerer_id}:{i}"), triggerer_id)
+            for triggerer_id in set(triggerer_ids)
+            for i in range(points_per_triggerer)
+        )
+        self._hashes = [h for h, _ in points]
+        self._triggerer_ids = [triggerer_id for _, triggerer_id in points]
+        self._num_triggerers = len(set(self._triggerer_ids))
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int.from_bytes(md5(key.encode()).digest()[:8], "big")
+
+    def preference(self, trigger_id: int) -> Iterator[int]:
+        """Yield the triggerers that should run ``trigger_id``, most preferred first, each once."""
+        if not self._hashes:
+            return
+        start = bisect.bisect(self._hashes, self._hash(str(trigger_id)))
+        seen: set[int] = set()
+        for i in range(len(self._hashes)):
+            triggerer_id = self._triggerer_ids[(start + i) % len(self._hashes)]
+            if triggerer_id not in seen:
+                seen.add(triggerer_id)
+                yield triggerer_id
+                if len(seen) == self._num_triggerers:
+                    return
+
+    def owner(self, trigger_id: int, loads: dict[int, int], capacity: int) -> int | None:
+        """
+        Return the first triggerer on the ring for ``trigger_id`` that still has room for it.
+
+        :param trigger_id: The trigger to place.
+        :param loads: Number of triggers assigned to each triggerer.
+        :param capacity: How many triggers each triggerer runs at most.
+        """
+        return next((t for t in self.preference(trigger_id) if loads.get(t, 0) < capacity), None)
+
+
 class Trigger(Base):
     """
     Base Trigger class.
@@ -345,23 +397,10 @@ class Trigger(Base):
         session: Session = NEW_SESSION,
     ) -> list[int]:
         """Retrieve a list of trigger ids."""
-        query = select(cls.id).where(cls.triggerer_id == triggerer_id)
         # By default, there is no trigger queue assignment. Only filter by queue when explicitly set in the triggerer CLI.
-        # Filter by queues if the triggerer explicitly was called with `--queues`, otherwise, filter out
-        # Triggers which have an explicit `queue` value since there may be other triggerer hosts explicitly assigned to that queue.
-        if queues:
-            query = query.filter(cls.queue.in_(queues))
-        else:
-            query = query.filter(cls.queue.is_(None))
-
-        # Check config instead of team_name: if multi-team is disabled after triggers were
-        # created with a team, those triggers must still be picked up instead of being orphaned.
-        if conf.getboolean("core", "multi_team"):
-            if team_name:
-                query = query.filter(cls.team_name == team_name)
-            else:
-                query = query.filter(cls.team_name.is_(None))
-
+        query = cls._filter_by_queues_and_team(
+            select(cls.id).where(cls.triggerer_id == triggerer_id), queues, team_name
+        )
         return list(session.scalars(query).all())
 
     @classmethod
@@ -383,8 +422,6 @@ class Trigger(Base):
         health check threshold, and the queues and assigns unassigned triggers until that
         capacity is reached, or there are no more unassigned triggers.
         """
-        from airflow.jobs.job import Job  # To avoid circular import
-
         count = session.scalar(select(func.count(cls.id)).filter(cls.triggerer_id == triggerer_id))
         capacity -= count
 
@@ -396,11 +433,7 @@ class Trigger(Base):
             )
             return
 
-        alive_triggerer_ids = select(Job.id).where(
-            Job.end_date.is_(None),
-            Job.latest_heartbeat > timezone.utcnow() - datetime.timedelta(seconds=health_check_threshold),
-            Job.job_type == "TriggererJob",
-        )
+        alive_triggerer_ids = cls._alive_triggerer_ids(health_check_threshold)
 
         # Find triggers who do NOT have an alive triggerer_id, and then assign
         # up to `capacity` of those to us.
@@ -421,6 +454,127 @@ class Trigger(Base):
 
         session.commit()
 
+    @classmethod
+    @provide_session
+    def assign_consistent_hash(
+        cls,
+        triggerer_id: int,
+        capacity: int,
+        health_check_threshold: float,
+        max_moves: int,
+        queues: set[str] | None = None,
+        team_name: str | None = None,
+        *,
+        session: Session = NEW_SESSION,
+    ) -> tuple[int, int]:
+        """
+        Assign triggers to triggerers by consistent hashing of the trigger ids.
+
+        The ring is made of the triggerers with a recent heartbeat. This triggerer claims the unassigned
+        triggers (or those of dead triggerers) that hash to it, skipping to the next triggerer on the ring
+        when one is full. It then releases up to ``max_moves`` of its triggers that now hash to another
+        triggerer with room for them, which claims them on its next loop. This way a triggerer joining or
+        leaving only moves its share of the triggers, and does so gradually.
+
+        All triggerers are assumed to run with the same capacity, queues and team.
+
+        :return: The number of triggers claimed and released by this triggerer.
+        """
+        alive_triggerer_ids = set(session.scalars(cls._alive_triggerer_ids(health_check_threshold)))
+        alive_triggerer_ids.add(triggerer_id)
+        ring = TriggererHashRing(alive_triggerer_ids)
+        loads: dict[int, int] = dict.fromkeys(alive_triggerer_ids, 0)
+        loads.update(
+            session.execute(
+                select(cls.triggerer_id, func.count(cls.id))
+                .where(cls.triggerer_id.in_(alive_triggerer_ids))
+                .group_by(cls.triggerer_id)
+            ).all()
+        )
+
+        unassigned_query = cls._filter_by_queues_and_team(
+            select(cls.id)
+            .where(or_(cls.triggerer_id.is_(None), cls.triggerer_id.not_in(alive_triggerer_ids)))
+            .order_by(cls.id),
+            queues,
+            team_name,
+        )
+        to_claim: list[int] = []
+        for trigger_id in session.scalars(unassigned_query):
+            if len(to_claim) >= cls.max_trigger_to_select_per_loop:
+                break
+            owner = ring.owner(trigger_id, loads, capacity)
+            if owner is None:
+                break
+            loads[owner] += 1
+            if owner == triggerer_id:
+                to_claim.append(trigger_id)
+
+        claimed = 0
+        if to_claim:
+            result = session.execute(
+                update(cls)
+                .where(
+                    cls.id.in_(to_claim),
+                    or_(cls.triggerer_id.is_(None), cls.triggerer_id.not_in(alive_triggerer_ids)),
+                )
+                .values(triggerer_id=triggerer_id)
+                .execution_options(synchronize_session=False)
+            )
+            claimed = getattr(result, "rowcount", 0)
+
+        to_release: list[int] = []
+        for trigger_id in cls.ids_for_triggerer(triggerer_id, queues, team_name, session=session):
+            if len(to_release) >= max_moves:
+                break
+            preferred = next(ring.preference(trigger_id))
+            if preferred != triggerer_id and loads[preferred] < capacity:
+                loads[preferred] += 1
+                loads[triggerer_id] -= 1
+                to_release.append(trigger_id)
+
+        if to_release:
+            session.execute(
+                update(cls)
+                .where(cls.id.in_(to_release), cls.triggerer_id == triggerer_id)
+                .values(triggerer_id=None)
+                .execution_options(synchronize_session=False)
+            )
+
+        session.commit()
+        return claimed, len(to_release)
+
+    @classmethod
+    def _alive_triggerer_ids(cls, health_check_threshold: float) -> Select:
+        from airflow.jobs.job import Job  # To avoid circular import
+
+        return select(Job.id).where(
+            Job.end_date.is_(None),
+            Job.latest_heartbeat > timezone.utcnow() - datetime.timedelta(seconds=health_check_threshold),
+            Job.job_type == "TriggererJob",
+        )
+
+    @classmethod
+    def _filter_by_queues_and_team(
+        cls, query: Select, queues: set[str] | None, team_name: str | None
+    ) -> Select:
+        # Filter by queues if the triggerer explicitly was called with `--queues`, otherwise, filter out
+        # Triggers which have an explicit `queue` value since there may be other triggerer hosts explicitly
+        # assigned to that queue.
+        if queues:
+            query = query.filter(cls.queue.in_(queues))
+        else:
+            query = query.filter(cls.queue.is_(None))
+
+        # Check config instead of team_name: if multi-team is disabled after triggers were
+        # created with a team, those triggers must still be picked up instead of being orphaned.
+        if conf.getboolean("core", "multi_team"):
+            if team_name:
+                query = query.filter(cls.team_name == team_name)
+            else:
+                query = query.filter(cls.team_name.is_(None))
+        return query
+
     @classmethod
     def get_sorted_triggers(
         cls,
@@ -475,22 +629,7 @@ class Trigger(Base):
             # picking up too many triggers and starving other triggerers for HA setup.
             remaining_capacity = min(remaining_capacity, cls.max_trigger_to_select_per_loop)
 
-            # Filter by queues if the triggerer explicitly was called with `--queues`, otherwise, filter out
-            # Triggers which have an explicit `queue` value since there may be other triggerer hosts explicitly
-            # assigned to that queue.
-            if queues:
-                filtered_query = query.filter(cls.queue.in_(queues))
-            else:
-                filtered_query = query.filter(cls.queue.is_(None))
-
-            # Check config instead of team_name: if multi-team is disabled after triggers were
-            # created with a team, those triggers must still be picked up instead of being orphaned.
-            if conf.getboolean("core", "multi_team"):
-                if team_name:
-                    filtered_query = filtered_query.filter(cls.team_name == team_name)
-                else:
-                    filtered_query = filtered_query.filter(cls.team_name.is_(None))
-
+            filtered_query = cls._filter_by_queues_and_team(query, queues, team_name)
             locked_query = with_row_locks(filtered_query.limit(remaining_capacity), session, skip_locked=True)
             result.extend(session.execute(locked_query).all())
 
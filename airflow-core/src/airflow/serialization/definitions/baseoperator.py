@@ -115,7 +115,9 @@ class SerializedBaseOperator(DAGNode):
 
     outlets: Sequence = []
     owner: str = "airflow"
-    params: SerializedParamsDict = SerializedParamsDict()
+    _params: SerializedParamsDict = SerializedParamsDict()
+    # Params as stored in the serialized DAG, until ``params`` is first accessed.
+    _encoded_params: list | dict | None = None
     pool: str = "default_pool"
     pool_slots: int = 1
     priority_weight: int = 1
@@ -169,6 +171,7 @@ class SerializedBaseOperator(DAGNode):
         return f"<SerializedTask({self.task_type}): {self.task_id}>"
 
     @classmethod
+    @functools.cache
     def get_serialized_fields(cls):
         """Fields to deserialize from the serialized JSON object."""
         return frozenset(
@@ -309,6 +312,22 @@ class SerializedBaseOperator(DAGNode):
     def task_display_name(self) -> str:
         return self._task_display_name or self.task_id
 
+    @property
+    def params(self) -> SerializedParamsDict:
+        # Params are only deserialized when first needed, since the scheduler rarely looks at them and
+        # decoding every task's params is a large part of the time spent deserializing a DAG.
+        if self._encoded_params is not None:
+            from airflow.serialization.serialized_objects import OperatorSerialization
+
+            self._params = OperatorSerialization._deserialize_params_dict(self._encoded_params)
+            self._encoded_params = None
+        return self._params
+
+    @params.setter
+    def params(self, params: SerializedParamsDict) -> None:
+        self._params = params
+        self._encoded_params = None
+
     def expand_start_trigger_args(self, *, context: Context) -> StartTriggerArgs | None:
         return self.start_trigger_args
 
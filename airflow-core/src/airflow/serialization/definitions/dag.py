@@ -558,8 +558,6 @@ class SerializedDAG:
 
         :meta private:
         """
-        from airflow.models.dagrun import RUN_ID_REGEX
-
         log.info(
             "creating dag run",
             run_after=run_after,
@@ -567,6 +565,145 @@ class SerializedDAG:
             logical_date=logical_date,
             partition_key=partition_key,
         )
+        logical_date, data_interval, run_type = self._validate_dagrun_args(
+            run_id=run_id,
+            logical_date=logical_date,
+            data_interval=data_interval,
+            run_type=run_type,
+            partition_key=partition_key,
+        )
+
+        # todo: AIP-78 add verification that if run type is backfill then we have a backfill id
+        copied_params = self.params.deep_merge(conf)
+        copied_params.validate()
+        orm_dagrun = _create_orm_dagrun(
+            dag=self,
+            run_id=run_id,
+            logical_date=logical_date,
+            data_interval=data_interval,
+            run_after=coerce_datetime(run_after),
+            start_date=coerce_datetime(start_date),
+            conf=conf,
+            state=state,
+            run_type=run_type,
+            creating_job_id=creating_job_id,
+            backfill_id=backfill_id,
+            triggered_by=triggered_by,
+            triggering_user_name=triggering_user_name,
+            partition_key=partition_key,
+            partition_date=partition_date,
+            note=note,
+            session=session,
+        )
+
+        if self.deadline:
+            self._process_dagrun_deadline_alerts(orm_dagrun, session)
+
+        return orm_dagrun
+
+    @provide_session
+    def create_dagruns(
+        self,
+        *,
+        runs: Sequence[tuple[str, DagRunInfo]],
+        conf: dict | None = None,
+        run_type: DagRunType,
+        triggered_by: DagRunTriggeredByType,
+        triggering_user_name: str | None = None,
+        state: DagRunState,
+        start_date: datetime.datetime | None = None,
+        creating_job_id: int | None = None,
+        backfill_id: NonNegativeInt | None = None,
+        session: Session = NEW_SESSION,
+    ) -> list[DagRun]:
+        """
+        Create several runs for this DAG to run its tasks, with a constant number of queries.
+
+        Each run is created as :meth:`create_dagrun` creates it, but the runs and their task instances are
+        inserted together. Nothing is created if a run conflicts with an existing one.
+
+        :param runs: The ID and the timetable info of each run
+        :param conf: Dict containing configuration/parameters to pass to the DAG
+        :param triggered_by: the entity which triggers the dag_runs
+        :param triggering_user_name: the user name who triggers the dag_runs
+        :param start_date: the date these dag runs should be evaluated
+        :param creating_job_id: ID of the job creating these DagRuns
+        :param backfill_id: ID of the backfill run if one exists
+        :return: The created DAG runs, in the order of ``runs``.
+
+        :meta private:
+        """
+        if not runs:
+            return []
+        log.info("creating dag runs", count=len(runs), run_type=run_type)
+        validated_runs = [
+            (
+                run_id,
+                info,
+                *self._validate_dagrun_args(
+                    run_id=run_id,
+                    logical_date=info.logical_date,
+                    data_interval=info.data_interval,
+                    run_type=run_type,
+                    partition_key=info.partition_key,
+                ),
+            )
+            for run_id, info in runs
+        ]
+        self.params.deep_merge(conf).validate()
+
+        dag_version, bundle_version, log_template_id = _get_dagrun_creation_context(self, session=session)
+        orm_dagruns = [
+            _new_orm_dagrun(
+                dag_version=dag_version,
+                log_template_id=log_template_id,
+                dag_id=self.dag_id,
+                run_id=run_id,
+                logical_date=logical_date,
+                start_date=coerce_datetime(start_date),
+                run_after=coerce_datetime(info.run_after),
+                conf=conf,
+                state=state,
+                run_type=validated_run_type,
+                creating_job_id=creating_job_id,
+                data_interval=data_interval,
+                triggered_by=triggered_by,
+                triggering_user_name=triggering_user_name,
+                backfill_id=backfill_id,
+                bundle_version=bundle_version,
+                partition_key=info.partition_key,
+                partition_date=info.partition_date,
+            )
+            for run_id, info, logical_date, data_interval, validated_run_type in validated_runs
+        ]
+        session.add_all(orm_dagruns)
+        session.flush()
+        for orm_dagrun in orm_dagruns:
+            orm_dagrun.dag = self
+        DagRun.create_task_instances_for_new_runs(orm_dagruns, dag_version_id=dag_version.id, session=session)
+
+        if self.deadline:
+            for orm_dagrun in orm_dagruns:
+                self._process_dagrun_deadline_alerts(orm_dagrun, session)
+
+        return orm_dagruns
+
+    def _validate_dagrun_args(
+        self,
+        *,
+        run_id: str,
+        logical_date: datetime.datetime | None,
+        data_interval: tuple[datetime.datetime, datetime.datetime] | None,
+        run_type: DagRunType,
+        partition_key: str | None,
+    ) -> tuple[datetime.datetime | None, DataInterval | None, DagRunType]:
+        """
+        Validate the arguments a run of this DAG is created with.
+
+        :return: The logical date, data interval and run type of the run, coerced to their expected types.
+        """
+        from airflow.models.dagrun import RUN_ID_REGEX
+
         logical_date = coerce_datetime(logical_date)
         # For manual runs where logical_date is None, ensure no data_interval is set.
         if logical_date is None and data_interval is not None:
@@ -607,34 +744,7 @@ class SerializedDAG:
                 )
 
         self.validate_partition_key(partition_key)
-
-        # todo: AIP-78 add verification that if run type is backfill then we have a backfill id
-        copied_params = self.params.deep_merge(conf)
-        copied_params.validate()
-        orm_dagrun = _create_orm_dagrun(
-            dag=self,
-            run_id=run_id,
-            logical_date=logical_date,
-            data_interval=data_interval,
-            run_after=coerce_datetime(run_after),
-            start_date=coerce_datetime(start_date),
-            conf=conf,
-            state=state,
-            run_type=run_type,
-            creating_job_id=creating_job_id,
-            backfill_id=backfill_id,
-            triggered_by=triggered_by,
-            triggering_user_name=triggering_user_name,
-            partition_key=partition_key,
-            partition_date=partition_date,
-            note=note,
-            session=session,
-        )
-
-        if self.deadline:
-            self._process_dagrun_deadline_alerts(orm_dagrun, session)
-
-        return orm_dagrun
+        return logical_date, data_interval, run_type
 
     def _process_dagrun_deadline_alerts(
         self,
@@ -1322,6 +1432,31 @@ class SerializedDAG:
         return empty
 
 
+def _get_dagrun_creation_context(
+    dag: SerializedDAG, *, session: Session
+) -> tuple[DagVersion, str | None, int]:
+    """Return the DAG version, bundle version and log template ID new runs of ``dag`` are created with."""
+    bundle_version = None
+    if not dag.disable_bundle_versioning:
+        bundle_version = session.scalar(
+            select(DagModel.bundle_version).where(DagModel.dag_id == dag.dag_id),
+        )
+    dag_version = DagVersion.get_latest_version(dag.dag_id, session=session)
+    if not dag_version:
+        raise AirflowException(f"Cannot create DagRun for DAG {dag.dag_id} because the dag is not serialized")
+    max_log_template_id = session.scalar(select(func.max(LogTemplate.__table__.c.id)))
+    return dag_version, bundle_version, int(max_log_template_id) if max_log_template_id is not None else 0
+
+
+def _new_orm_dagrun(*, dag_version: DagVersion, log_template_id: int, **kwargs: Any) -> DagRun:
+    run = DagRun(**kwargs)
+    # Load defaults into the following two fields to ensure result can be serialized detached
+    run.log_template_id = log_template_id
+    run.created_dag_version = dag_version
+    run.consumed_asset_events = []
+    return run
+
+
 @provide_session
 def _create_orm_dagrun(
     *,
@@ -1343,16 +1478,10 @@ def _create_orm_dagrun(
     note: str | None = None,
     session: Session = NEW_SESSION,
 ) -> DagRun:
-    bundle_version = None
-    if not dag.disable_bundle_versioning:
-        bundle_version = session.scalar(
-            select(DagModel.bundle_version).where(DagModel.dag_id == dag.dag_id),
-        )
-    dag_version = DagVersion.get_latest_version(dag.dag_id, session=session)
-    if not dag_version:
-        raise AirflowException(f"Cannot create DagRun for DAG {dag.dag_id} because the dag is not serialized")
-
-    run = DagRun(
+    dag_version, bundle_version, log_template_id = _get_dagrun_creation_context(dag, session=session)
+    run = _new_orm_dagrun(
+        dag_version=dag_version,
+        log_template_id=log_template_id,
         dag_id=dag.dag_id,
         run_id=run_id,
         logical_date=logical_date,
@@ -1371,11 +1500,6 @@ def _create_orm_dagrun(
         partition_date=partition_date,
         note=note,
     )
-    # Load defaults into the following two fields to ensure result can be serialized detached
-    max_log_template_id = session.scalar(select(func.max(LogTemplate.__table__.c.id)))
-    run.log_template_id = int(max_log_template_id) if max_log_template_id is not None else 0
-    run.created_dag_version = dag_version
-    run.consumed_asset_events = []
     session.add(run)
     session.flush()
     run.dag = dag
@@ -335,6 +335,7 @@ class SerializedMappedOperator(DAGNode):
         self.partial_kwargs["on_failure_fail_dagrun"] = bool(v)
 
     @classmethod
+    @functools.cache
     def get_serialized_fields(cls):
         """Fields to extract from JSON-Serialized DAG."""
         return frozenset(
@@ -1139,6 +1139,12 @@ class OperatorSerialization(DAGNode, BaseSerialization):
                 k = "operator_extra_links"
 
             elif k == "params":
+                if not op.is_mapped:
+                    if TYPE_CHECKING:
+                        assert isinstance(op, SerializedBaseOperator)
+                    # Deserialized on first access, see SerializedBaseOperator.params.
+                    op._encoded_params = v
+                    continue
                 v = cls._deserialize_params_dict(v)
             elif k == "partial_kwargs":
                 # Use unified deserializer that supports both encoded and non-encoded values
@@ -18,7 +18,9 @@
 from __future__ import annotations
 
 import contextlib
-from typing import TYPE_CHECKING
+from collections import defaultdict
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Any
 
 import attr
 
@@ -85,6 +87,12 @@ class DepContext:
     have_changed_ti_states: bool = False
     """Have any of the TIs state's been changed as a result of evaluating dependencies"""
 
+    trigger_rule_cache: dict[Hashable, Any] = attr.field(factory=dict, init=False)
+    """Upstream counts shared by the TIs of a task, computed once per context by the trigger rule dep"""
+
+    _finished_tis_by_task_id: dict[str, list[TaskInstance]] | None = attr.field(default=None, init=False)
+    _indexed_finished_tis: tuple[int, int] = attr.field(default=(0, 0), init=False)
+
     def ensure_finished_tis(self, dag_run: DagRun, session: Session) -> list[TaskInstance]:
         """
         Ensure finished_tis is populated if it's currently None, which allows running tasks without dag_run.
@@ -103,3 +111,26 @@ class DepContext:
         else:
             finished_tis = self.finished_tis
         return finished_tis
+
+    def ensure_finished_tis_by_task_id(
+        self, dag_run: DagRun, session: Session
+    ) -> dict[str, list[TaskInstance]]:
+        """
+        Return the finished task instances of the run (see ``ensure_finished_tis``) grouped by task id.
+
+        The index is built once and reused for every TI evaluated in this context, unless ``finished_tis``
+        is replaced or extended in the meantime, in which case ``trigger_rule_cache`` is cleared as well.
+
+        :param dag_run: The DagRun for which to find finished tasks
+        """
+        finished_tis = self.ensure_finished_tis(dag_run, session)
+        indexed = (id(finished_tis), len(finished_tis))
+        if self._finished_tis_by_task_id is None or self._indexed_finished_tis != indexed:
+            by_task_id: dict[str, list[TaskInstance]] = defaultdict(list)
+            for ti in finished_tis:
+                by_task_id[ti.task_id].append(ti)
+            self._finished_tis_by_task_id = dict(by_task_id)
+            self._indexed_finished_tis = indexed
+            # Anything computed from the previous finished tis is stale now.
+            self.trigger_rule_cache.clear()
+        return self._finished_tis_by_task_id
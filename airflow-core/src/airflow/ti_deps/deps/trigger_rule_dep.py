@@ -263,6 +263,50 @@ class TriggerRuleDep(BaseTIDep):
                 else:
                     yield and_(TaskInstance.task_id == upstream_id, TaskInstance.map_index == map_indexes)
 
+        def _calculate_upstream_states(relevant_ids: set[str] | KeysView[str]) -> _UpstreamTIStates:
+            """Count the states of the finished tis of ``relevant_ids`` the current ti depends on."""
+            finished_tis_by_task_id = dep_context.ensure_finished_tis_by_task_id(
+                ti.get_dagrun(session=session), session=session
+            )
+
+            def _calculate() -> _UpstreamTIStates:
+                return _UpstreamTIStates.calculate(
+                    upstream
+                    for upstream_id in relevant_ids
+                    for upstream in finished_tis_by_task_id.get(upstream_id, ())
+                    if _is_relevant_upstream(upstream=upstream, relevant_ids=relevant_ids)
+                )
+
+            # Outside of mapped task groups, all tis of a task depend on the same upstream tis, so the
+            # states only need to be counted once per task, not once per expanded ti.
+            if task.get_closest_mapped_task_group() is not None:
+                return _calculate()
+            key = ("upstream_states", ti.dag_id, ti.run_id, frozenset(relevant_ids))
+            if key not in dep_context.trigger_rule_cache:
+                dep_context.trigger_rule_cache[key] = _calculate()
+            return dep_context.trigger_rule_cache[key]
+
+        def _count_upstream_tis(relevant_tasks: Mapping[str, Operator]) -> dict[str, int]:
+            """Count the tis of ``relevant_tasks`` the current ti depends on, by task id."""
+
+            def _query() -> dict[str, int]:
+                # The below type annotation is acceptable on SQLA2.1, but not on 2.0
+                task_id_counts: Sequence[Row[Unpack[tuple[str, int]]]] = session.execute(  # type: ignore[type-arg]
+                    select(TaskInstance.task_id, func.count(TaskInstance.task_id))
+                    .where(TaskInstance.dag_id == ti.dag_id, TaskInstance.run_id == ti.run_id)
+                    .where(or_(*_iter_upstream_conditions(relevant_tasks=relevant_tasks)))
+                    .group_by(TaskInstance.task_id)
+                ).all()
+                return {task_id: count for task_id, count in task_id_counts}
+
+            # As above, the counts are the same for every ti of a task outside of mapped task groups.
+            if task.get_closest_mapped_task_group() is not None:
+                return _query()
+            key = ("upstream_ti_counts", ti.dag_id, ti.run_id, frozenset(relevant_tasks))
+            if key not in dep_context.trigger_rule_cache:
+                dep_context.trigger_rule_cache[key] = _query()
+            return dep_context.trigger_rule_cache[key]
+
         def _evaluate_setup_constraint(
             *, relevant_setups: Mapping[str, Operator]
         ) -> Iterator[tuple[TIDepStatus, bool]]:
@@ -275,12 +319,7 @@ class TriggerRuleDep(BaseTIDep):
                 return
 
             indirect_setups = {k: v for k, v in relevant_setups.items() if k not in task.upstream_task_ids}
-            finished_upstream_tis = (
-                x
-                for x in dep_context.ensure_finished_tis(ti.get_dagrun(session=session), session=session)
-                if _is_relevant_upstream(upstream=x, relevant_ids=indirect_setups.keys())
-            )
-            upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
+            upstream_states = _calculate_upstream_states(indirect_setups.keys())
 
             # all of these counts reflect indirect setups which are relevant for this ti
             success = upstream_states.success
@@ -294,13 +333,7 @@ class TriggerRuleDep(BaseTIDep):
             if not any(t.get_needs_expansion() for t in indirect_setups.values()):
                 upstream = len(indirect_setups)
             else:
-                task_id_counts = session.execute(
-                    select(TaskInstance.task_id, func.count(TaskInstance.task_id))
-                    .where(TaskInstance.dag_id == ti.dag_id, TaskInstance.run_id == ti.run_id)
-                    .where(or_(*_iter_upstream_conditions(relevant_tasks=indirect_setups)))
-                    .group_by(TaskInstance.task_id)
-                ).all()
-                upstream = sum(count for _, count in task_id_counts)
+                upstream = sum(_count_upstream_tis(indirect_setups).values())
 
             new_state = None
             changed = False
@@ -358,14 +391,7 @@ class TriggerRuleDep(BaseTIDep):
             trigger_rule = task.trigger_rule
             trigger_rule_str = getattr(trigger_rule, "value", trigger_rule)
 
-            finished_upstream_tis = (
-                finished_ti
-                for finished_ti in dep_context.ensure_finished_tis(
-                    ti.get_dagrun(session=session), session=session
-                )
-                if _is_relevant_upstream(upstream=finished_ti, relevant_ids=task.upstream_task_ids)
-            )
-            upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
+            upstream_states = _calculate_upstream_states(task.upstream_task_ids)
 
             success = upstream_states.success
             skipped = upstream_states.skipped
@@ -382,15 +408,9 @@ class TriggerRuleDep(BaseTIDep):
                 upstream = len(upstream_tasks)
                 upstream_setup = sum(1 for x in upstream_tasks.values() if x.is_setup)
             else:
-                # The below type annotation is acceptable on SQLA2.1, but not on 2.0
-                task_id_counts: Sequence[Row[Unpack[tuple[str, int]]]] = session.execute(  # type: ignore[type-arg]
-                    select(TaskInstance.task_id, func.count(TaskInstance.task_id))
-                    .where(TaskInstance.dag_id == ti.dag_id, TaskInstance.run_id == ti.run_id)
-                    .where(or_(*_iter_upstream_conditions(relevant_tasks=upstream_tasks)))
-                    .group_by(TaskInstance.task_id)
-                ).all()
-                upstream = sum(count for _, count in task_id_counts)
-                upstream_setup = sum(c for t, c in task_id_counts if upstream_tasks[t].is_setup)
+                task_id_counts = _count_upstream_tis(upstream_tasks)
+                upstream = sum(task_id_counts.values())
+                upstream_setup = sum(c for t, c in task_id_counts.items() if upstream_tasks[t].is_setup)
 
             upstream_done = done >= upstream
 
@@ -675,23 +695,12 @@ class TriggerRuleDep(BaseTIDep):
 
             in_scope_tasks = {tid: task.dag.get_task(tid) for tid in in_scope_ids}
 
-            done = sum(
-                1
-                for x in dep_context.ensure_finished_tis(ti.get_dagrun(session=session), session=session)
-                if _is_relevant_upstream(upstream=x, relevant_ids=in_scope_ids)
-            )
+            done = _calculate_upstream_states(in_scope_ids).done
 
             if not any(t.get_needs_expansion() for t in in_scope_tasks.values()):
                 expected = len(in_scope_tasks)
             else:
-                expected = (
-                    session.scalar(
-                        select(func.count(TaskInstance.task_id))
-                        .where(TaskInstance.dag_id == ti.dag_id, TaskInstance.run_id == ti.run_id)
-                        .where(or_(*_iter_upstream_conditions(relevant_tasks=in_scope_tasks)))
-                    )
-                    or 0
-                )
+                expected = sum(_count_upstream_tis(in_scope_tasks).values())
 
             if done < expected:
                 trigger_rule_str = getattr(task.trigger_rule, "value", task.trigger_rule)
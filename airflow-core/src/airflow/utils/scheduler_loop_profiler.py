@@ -0,0 +1,223 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Per-phase timing of the scheduler loop, and on-demand sampling profiles of it."""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from sqlalchemy import event
+
+from airflow._shared.observability.metrics import stats
+from airflow.utils.log.logging_mixin import LoggingMixin
+
+if TYPE_CHECKING:
+    from types import FrameType
+
+    from sqlalchemy.engine import Engine
+
+# Seconds between two samples of the scheduler thread's stack while a sampling profile runs.
+SAMPLING_INTERVAL = 0.005
+
+
+@dataclass
+class PhaseStats:
+    """Time and queries spent in one phase of the scheduler loop."""
+
+    calls: int = 0
+    wall_time: float = 0.0
+    db_time: float = 0.0
+    queries: int = 0
+
+
+@dataclass
+class _ActivePhase:
+    name: str
+    db_time: float = 0.0
+    queries: int = 0
+    query_starts: list[float] = field(default_factory=list)
+
+
+class SchedulerLoopProfiler(LoggingMixin):
+    """
+    Break the time spent in the scheduler loop down by phase.
+
+    Each phase entered with :meth:`phase` reports its wall time, the time spent waiting on the database
+    and the number of queries it ran as ``scheduler.loop_phase_*`` metrics tagged with the phase name,
+    and adds them to totals that :meth:`report` summarizes. Phases may be nested; database time and
+    queries are attributed to the innermost phase only, while wall time includes nested phases.
+
+    Only the thread that created the profiler is measured, so queries run by executor threads don't get
+    attributed to whichever phase the scheduler loop happens to be in.
+
+    :param enabled: Whether to measure phases at all. When disabled, :meth:`phase` is a no-op.
+    :param sampling_duration: How long (in seconds) a sampling profile started by :meth:`dump` runs;
+        0 disables sampling profiles.
+    :param output_dir: Directory sampling profiles are written to.
+    """
+
+    def __init__(self, *, enabled: bool, sampling_duration: float = 0, output_dir: str = "."):
+        self.enabled = enabled
+        self.sampling_duration = sampling_duration
+        self.output_dir = output_dir
+        self.totals: dict[str, PhaseStats] = {}
+        self._thread_id = threading.get_ident()
+        self._active: list[_ActivePhase] = []
+        self._engine: Engine | None = None
+        self._sampler: threading.Thread | None = None
+
+    def install(self, engine: Engine | None) -> None:
+        """Start measuring the queries run on ``engine``."""
+        if not self.enabled or engine is None or self._engine is not None:
+            return
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        self._engine = engine
+
+    def uninstall(self) -> None:
+        """Stop measuring queries."""
+        if self._engine is None:
+            return
+        event.remove(self._engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(self._engine, "after_cursor_execute", self._after_cursor_execute)
+        self._engine = None
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if self._active and threading.get_ident() == self._thread_id:
+            self._active[-1].query_starts.append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if self._active and threading.get_ident() == self._thread_id:
+            active = self._active[-1]
+            if active.query_starts:
+                active.db_time += time.perf_counter() - active.query_starts.pop()
+                active.queries += 1
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Measure the body of the ``with`` block as the phase ``name``."""
+        if not self.enabled:
+            yield
+            return
+        active = _ActivePhase(name)
+        self._active.append(active)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - start
+            self._active.remove(active)
+            self._record(active, wall_time)
+
+    def _record(self, active: _ActivePhase, wall_time: float) -> None:
+        totals = self.totals.setdefault(active.name, PhaseStats())
+        totals.calls += 1
+        totals.wall_time += wall_time
+        totals.db_time += active.db_time
+        totals.queries += active.queries
+
+        tags = {"phase": active.name}
+        stats.timing("scheduler.loop_phase_duration", timedelta(seconds=wall_time), tags=tags)
+        stats.timing("scheduler.loop_phase_db_duration", timedelta(seconds=active.db_time), tags=tags)
+        if active.queries:
+            stats.incr("scheduler.loop_phase_queries", active.queries, tags=tags)
+
+    def report(self) -> str:
+        """Summarize the time spent per phase since the profiler was created, slowest phases first."""
+        if not self.totals:
+            return "No scheduler loop phases were measured."
+        lines = [f"{'phase':<40} {'calls':>8} {'wall ms':>12} {'db ms':>12} {'queries':>9} {'ms/call':>9}"]
+        for name, phase_stats in sorted(self.totals.items(), key=lambda item: -item[1].wall_time):
+            lines.append(
+                f"{name:<40} {phase_stats.calls:>8} {phase_stats.wall_time * 1000:>12.1f} "
+                f"{phase_stats.db_time * 1000:>12.1f} {phase_stats.queries:>9} "
+                f"{phase_stats.wall_time * 1000 / phase_stats.calls:>9.2f}"
+            )
+        return "\n".join(lines)
+
+    def dump(self) -> None:
+        """Log the per-phase summary, and start a sampling profile if those are enabled."""
+        if self.enabled:
+            self.log.info("Scheduler loop phases:\n%s", self.report())
+        if self.sampling_duration > 0:
+            self.start_sampling()
+
+    def start_sampling(self) -> bool:
+        """
+        Sample the stack of the scheduler thread in the background for ``sampling_duration`` seconds.
+
+        The samples are written in the "folded" format (one ``frame;frame;frame count`` line per distinct
+        stack) understood by ``flamegraph.pl``, speedscope and similar tools.
+
+        :return: Whether a new sampling profile was started; only one runs at a time.
+        """
+        if self._sampler is not None and self._sampler.is_alive():
+            self.log.warning("A sampling profile of the scheduler loop is already running")
+            return False
+        path = os.path.join(
+            self.output_dir, f"scheduler_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.folded"
+        )
+        self._sampler = threading.Thread(
+            target=self._sample,
+            args=(self._thread_id, self.sampling_duration, path),
+            name="scheduler-loop-sampler",
+            daemon=True,
+        )
+        self._sampler.start()
+        self.log.info(
+            "Sampling the scheduler loop for %.1f seconds, the profile will be written to %s",
+            self.sampling_duration,
+            path,
+        )
+        return True
+
+    def _sample(self, thread_id: int, duration: float, path: str) -> None:
+        samples: Counter[str] = Counter()
+        deadline = time.monotonic() + duration
+        while time.monotonic() < deadline:
+            frame = sys._current_frames().get(thread_id)
+            if frame is None:
+                break
+            samples[_fold_stack(frame)] += 1
+            time.sleep(SAMPLING_INTERVAL)
+        try:
+            with open(path, "w") as f:
+                for stack, count in samples.most_common():
+                    f.write(f"{stack} {count}\n")
+        except OSError:
+            self.log.exception("Failed to write the scheduler loop profile to %s", path)
+            return
+        self.log.info("Wrote %d samples of the scheduler loop to %s", sum(samples.values()), path)
+
+
+def _fold_stack(frame: FrameType | None) -> str:
+    frames: list[str] = []
+    while frame is not None:
+        code = frame.f_code
+        frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(frames))
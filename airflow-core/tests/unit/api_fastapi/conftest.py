@@ -98,9 +98,9 @@ def _isolated_shared_app(_shared_api_app):
     entry and restoring them on exit keeps the reset resilient to future mutations without having to
     enumerate them.
 
-    ``app.state.dag_bag`` is the exception: tests mutate the DagBag object *in place* (its cache of
-    deserialized Dags fills as requests resolve them), which a state snapshot can't undo, so its
-    cache is cleared explicitly. A leaked warm entry would otherwise let a later test skip a
+    ``app.state.dag_bag`` and ``app.state.response_cache`` are the exception: tests mutate them *in
+    place* (their caches fill as requests resolve Dags and responses), which a state snapshot can't
+    undo, so their caches are cleared explicitly. A leaked warm entry would otherwise let a later test skip a
     serialized-Dag DB read and break query-count assertions (e.g. the grid ``ti_summaries`` stream
     tests) depending on execution order.
     """
@@ -108,6 +108,7 @@ def _isolated_shared_app(_shared_api_app):
     # ``app.state._state`` is Starlette's backing dict for ``State`` -- the only way to enumerate it.
     saved = [(app, dict(app.state._state), dict(app.dependency_overrides)) for app in apps]
     _shared_api_app.state.dag_bag.clear_cache()
+    _shared_api_app.state.response_cache.clear()
     try:
         yield _shared_api_app
     finally:
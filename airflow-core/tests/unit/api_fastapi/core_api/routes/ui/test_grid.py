@@ -20,6 +20,7 @@ from __future__ import annotations
 import json
 from datetime import timedelta
 from operator import attrgetter
+from unittest import mock
 
 import pendulum
 import pytest
@@ -537,6 +538,28 @@ class TestGetGridDataEndpoint:
         assert response.status_code == 200
         assert response.json() == [{"id": "task2", "label": "task2"}]
 
+    def test_structure_should_be_cached(self, test_client):
+        response = test_client.get(f"/grid/structure/{DAG_ID}?limit=5")
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        # The serialized Dags aren't loaded again once the structure is cached
+        with assert_queries_count(6):
+            cached_response = test_client.get(f"/grid/structure/{DAG_ID}?limit=5")
+        assert cached_response.status_code == 200
+        assert cached_response.headers["etag"] == etag
+        assert cached_response.json() == response.json()
+
+        not_modified = test_client.get(f"/grid/structure/{DAG_ID}?limit=5", headers={"If-None-Match": etag})
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+
+        filtered = test_client.get(
+            f"/grid/structure/{DAG_ID}?limit=5&root=task", headers={"If-None-Match": etag}
+        )
+        assert filtered.status_code == 200
+        assert filtered.headers["etag"] != etag
+
     def test_runs_should_response_200_without_dag_run(self, test_client):
         with assert_queries_count(5):
             response = test_client.get(f"/grid/runs/{DAG_ID_2}")
@@ -1189,8 +1212,30 @@ class TestGetGridDataEndpoint:
 
         run_ids = ["run_1", "run_2"]
         # 2 auth queries + 1 serdag query shared across both runs
-        # + 1 TI query per run = 5 total (not 1 serdag per run which would be 6+).
-        with assert_queries_count(5):
+        # + 1 TI query for both runs = 4 total (not 1 serdag per run which would be 5+).
+        with assert_queries_count(4):
             response = test_client.get(f"/grid/ti_summaries/{DAG_ID}", params={"run_ids": run_ids})
         assert response.status_code == 200
         assert len(self._parse_ndjson(response)) == len(run_ids)
+
+    @pytest.mark.parametrize("runs_per_query", [1, 20])
+    def test_grid_ti_summaries_stream_batches_runs(self, session, test_client, runs_per_query):
+        """Runs are fetched in batches, and emitted in the order they were requested."""
+        session.commit()
+
+        run_ids = ["run_2", "nonexistent_run", "run_1"]
+        with mock.patch(
+            "airflow.api_fastapi.core_api.routes.ui.grid.TI_SUMMARIES_RUNS_PER_QUERY", runs_per_query
+        ):
+            response = test_client.get(f"/grid/ti_summaries/{DAG_ID}", params={"run_ids": run_ids})
+        assert response.status_code == 200
+        summaries = self._parse_ndjson(response)
+        assert [s["run_id"] for s in summaries] == ["run_2", "run_1"]
+
+        single = {
+            run_id: self._parse_ndjson(
+                test_client.get(f"/grid/ti_summaries/{DAG_ID}", params={"run_ids": [run_id]})
+            )[0]
+            for run_id in ["run_1", "run_2"]
+        }
+        assert summaries == [single["run_2"], single["run_1"]]
@@ -704,6 +704,41 @@ class TestStructureDataEndpoint:
         edge_targets = {edge["target_id"] for edge in result["edges"]}
         assert not any(DAG_ID in tid for tid in edge_targets)
 
+    @pytest.mark.usefixtures("make_dag_with_multiple_versions")
+    def test_should_be_cached(self, test_client):
+        params = {"dag_id": DAG_ID}
+        response = test_client.get("/structure/structure_data", params=params)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        with mock.patch(
+            "airflow.api_fastapi.core_api.routes.ui.structure._get_nodes_and_edges"
+        ) as get_nodes_and_edges:
+            cached_response = test_client.get("/structure/structure_data", params=params)
+            not_modified = test_client.get(
+                "/structure/structure_data", params=params, headers={"If-None-Match": etag}
+            )
+        get_nodes_and_edges.assert_not_called()
+        assert cached_response.json() == response.json() == LATEST_VERSION_DAG_RESPONSE
+        assert cached_response.headers["etag"] == etag
+        assert not_modified.status_code == 304
+
+        previous_version = test_client.get(
+            "/structure/structure_data",
+            params={**params, "version_number": 1},
+            headers={"If-None-Match": etag},
+        )
+        assert previous_version.status_code == 200
+        assert previous_version.headers["etag"] != etag
+
+    @pytest.mark.usefixtures("make_dags")
+    def test_external_dependencies_are_not_cached(self, test_client):
+        response = test_client.get(
+            "/structure/structure_data", params={"dag_id": DAG_ID, "external_dependencies": True}
+        )
+        assert response.status_code == 200
+        assert "etag" not in response.headers
+
     def test_should_return_404(self, test_client):
         response = test_client.get("/structure/structure_data", params={"dag_id": "not_existing"})
         assert response.status_code == 404
@@ -2548,6 +2548,157 @@ class TestTIHealthEndpoint:
         assert ti.last_heartbeat_at == new_time
 
 
+class TestTIBulkHeartbeat:
+    def setup_method(self):
+        clear_db_runs()
+
+    def teardown_method(self):
+        clear_db_runs()
+
+    @staticmethod
+    def _create_tis(dag_maker, session, tis: dict[str, tuple[TaskInstanceState, int]]):
+        """Create a running dag run with a task instance per entry, in the given state and with the given pid."""
+        with dag_maker(session=session, serialized=True):
+            for task_id in tis:
+                EmptyOperator(task_id=task_id)
+        dr = dag_maker.create_dagrun()
+        created = {}
+        for ti in dr.get_task_instances(session=session):
+            ti.state, ti.pid = tis[ti.task_id]
+            ti.hostname = "random-hostname"
+            created[ti.task_id] = ti
+        session.commit()
+        return created
+
+    @pytest.fixture
+    def generator(self):
+        generator = mock.MagicMock(spec=JWTGenerator)
+        generator.generate.return_value = "refreshed-token"
+        lifespan.registry.register_value(JWTGenerator, generator)
+        return generator
+
+    @pytest.fixture
+    def validator(self):
+        """Accept tokens of the form ``token-<ti id>[-expiring]`` for the TI they name."""
+
+        async def avalidated_claims(token, required_claims=None):
+            now = int(timezone.utcnow().timestamp())
+            if not token.startswith("token-"):
+                raise ValueError("Invalid token")
+            ti_id, expiring, _ = token.removeprefix("token-").partition("-expiring")
+            return {
+                "sub": ti_id,
+                "scope": "execution",
+                "iat": now - 600,
+                "exp": now + (10 if expiring else 600),
+            }
+
+        validator = mock.AsyncMock(spec=JWTValidator)
+        validator.avalidated_claims.side_effect = avalidated_claims
+        lifespan.registry.register_value(JWTValidator, validator)
+        return validator
+
+    def test_bulk_heartbeat(self, client, session, dag_maker, time_machine, validator, generator):
+        time_now = timezone.parse("2024-10-31T12:00:00Z")
+        time_machine.move_to(time_now, tick=False)
+
+        tis = self._create_tis(
+            dag_maker,
+            session,
+            {
+                "running": (State.RUNNING, 100),
+                "running_expiring_token": (State.RUNNING, 101),
+                "running_elsewhere": (State.RUNNING, 102),
+                "finished": (State.SUCCESS, 103),
+                "bad_token": (State.RUNNING, 104),
+                "other_tis_token": (State.RUNNING, 105),
+            },
+        )
+        missing_id = uuid4()
+
+        def heartbeat(ti_id, pid, token=None):
+            return {
+                "id": str(ti_id),
+                "hostname": "random-hostname",
+                "pid": pid,
+                "token": token or f"token-{ti_id}",
+            }
+
+        response = client.put(
+            "/execution/task-instances/heartbeats",
+            json={
+                "heartbeats": [
+                    heartbeat(tis["running"].id, 100),
+                    heartbeat(
+                        tis["running_expiring_token"].id,
+                        101,
+                        f"token-{tis['running_expiring_token'].id}-expiring",
+                    ),
+                    heartbeat(tis["running_elsewhere"].id, 999),
+                    heartbeat(tis["finished"].id, 103),
+                    heartbeat(tis["bad_token"].id, 104, "garbage"),
+                    heartbeat(tis["other_tis_token"].id, 105, f"token-{tis['running'].id}"),
+                    heartbeat(missing_id, 106),
+                ]
+            },
+        )
+
+        assert response.status_code == 200, response.json()
+        results = response.json()["results"]
+        assert {ti_id: result["status_code"] for ti_id, result in results.items()} == {
+            str(tis["running"].id): 204,
+            str(tis["running_expiring_token"].id): 204,
+            str(tis["running_elsewhere"].id): 409,
+            str(tis["finished"].id): 409,
+            str(tis["bad_token"].id): 403,
+            str(tis["other_tis_token"].id): 403,
+            str(missing_id): 404,
+        }
+        assert results[str(tis["running_elsewhere"].id)]["detail"]["reason"] == "running_elsewhere"
+        assert results[str(tis["finished"].id)]["detail"]["reason"] == "not_running"
+        assert results[str(tis["running"].id)]["refreshed_token"] is None
+        assert results[str(tis["running_expiring_token"].id)]["refreshed_token"] == "refreshed-token"
+
+        for ti in tis.values():
+            session.refresh(ti)
+        assert tis["running"].last_heartbeat_at == time_now
+        assert tis["running_expiring_token"].last_heartbeat_at == time_now
+        assert tis["running_elsewhere"].last_heartbeat_at is None
+        assert tis["bad_token"].last_heartbeat_at is None
+        assert tis["other_tis_token"].last_heartbeat_at is None
+
+    def test_bulk_heartbeat_updates_running_tis_in_one_statement(
+        self, client, session, dag_maker, validator, generator
+    ):
+        tis = list(
+            self._create_tis(
+                dag_maker, session, {f"task_{i}": (State.RUNNING, 100 + i) for i in range(3)}
+            ).values()
+        )
+
+        with mock.patch(
+            "airflow.api_fastapi.execution_api.routes.task_instances._ti_heartbeat_slow_path"
+        ) as slow_path:
+            response = client.put(
+                "/execution/task-instances/heartbeats",
+                json={
+                    "heartbeats": [
+                        {
+                            "id": str(ti.id),
+                            "hostname": "random-hostname",
+                            "pid": ti.pid,
+                            "token": f"token-{ti.id}",
+                        }
+                        for ti in tis
+                    ]
+                },
+            )
+
+        assert response.status_code == 200
+        assert {result["status_code"] for result in response.json()["results"].values()} == {204}
+        slow_path.assert_not_called()
+
+
 class TestTIPutRTIF:
     def setup_method(self):
         clear_db_runs()
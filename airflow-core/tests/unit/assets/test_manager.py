@@ -29,7 +29,7 @@ from sqlalchemy import delete, func, select
 from sqlalchemy.orm import Session
 
 from airflow import settings
-from airflow.assets.manager import AssetManager
+from airflow.assets.manager import AssetChange, AssetManager
 from airflow.models.asset import (
     AssetAliasModel,
     AssetDagRunQueue,
@@ -47,6 +47,7 @@ from airflow.providers.standard.operators.empty import EmptyOperator
 from airflow.sdk.definitions.asset import Asset
 from airflow.sdk.definitions.timetables.assets import PartitionedAssetTimetable
 
+from tests_common.test_utils.asserts import assert_queries_count
 from tests_common.test_utils.config import conf_vars
 from tests_common.test_utils.db import clear_db_apdr, clear_db_logs, clear_db_pakl
 from unit.listeners import asset_listener
@@ -92,7 +93,7 @@ class TestAssetManager:
 
         mock_session = mock.Mock(spec=Session)
         # Gotta mock up the query results
-        mock_session.scalar.return_value = None
+        mock_session.scalars.return_value.unique.return_value = []
 
         asset_manger = AssetManager()
         asset_manger.register_asset_change(
@@ -193,6 +194,58 @@ class TestAssetManager:
         )
         assert session.scalar(select(func.count()).select_from(AssetDagRunQueue)) == 0
 
+    @pytest.mark.usefixtures("clear_assets", "testing_dag_bundle")
+    @pytest.mark.parametrize("num_assets", [1, 10])
+    def test_register_asset_changes(self, session, mock_task_instance, num_assets):
+        consumers = [DagModel(dag_id=f"consumer_{i}", bundle_name="testing") for i in range(2)]
+        session.add_all(consumers)
+        asset_models = [
+            AssetModel(uri=f"test://asset{i}/", name=f"asset_{i}", group="asset") for i in range(num_assets)
+        ]
+        session.add_all(asset_models)
+        for asm in asset_models:
+            asm.scheduled_dags = [DagScheduleAssetReference(dag_id=dag.dag_id) for dag in consumers]
+        session.execute(delete(AssetDagRunQueue))
+        session.flush()
+
+        changes = [AssetChange(Asset(uri=f"test://asset{i}", name=f"asset_{i}")) for i in range(num_assets)]
+        changes.append(AssetChange(Asset(uri="test://not_exist", name="not_exist")))
+        with assert_queries_count(5, session=session):
+            events = AssetManager.register_asset_changes(
+                task_instance=mock_task_instance, changes=changes, session=session
+            )
+        session.flush()
+
+        assert [event.asset_id if event else None for event in events] == [
+            *(asm.id for asm in asset_models),
+            None,
+        ]
+        assert session.scalar(select(func.count()).select_from(AssetDagRunQueue)) == 2 * num_assets
+
+    @pytest.mark.usefixtures("clear_assets", "testing_dag_bundle")
+    def test_register_asset_changes_overridden_register_asset_change(self, session, mock_task_instance):
+        calls = []
+
+        class CustomAssetManager(AssetManager):
+            @classmethod
+            def register_asset_change(cls, **kwargs):
+                calls.append(kwargs["asset"].uri)
+                return super().register_asset_change(**kwargs)
+
+        asset_models = [
+            AssetModel(uri=f"test://asset{i}/", name=f"asset_{i}", group="asset") for i in range(2)
+        ]
+        session.add_all(asset_models)
+        session.flush()
+
+        changes = [AssetChange(Asset(uri=f"test://asset{i}", name=f"asset_{i}")) for i in range(2)]
+        events = CustomAssetManager.register_asset_changes(
+            task_instance=mock_task_instance, changes=changes, session=session
+        )
+
+        assert calls == ["test://asset0/", "test://asset1/"]
+        assert [event.asset_id for event in events] == [asm.id for asm in asset_models]
+
     def test_register_asset_change_notifies_asset_listener(
         self, session, mock_task_instance, testing_dag_bundle, listener_manager
     ):
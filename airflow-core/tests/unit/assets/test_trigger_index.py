@@ -0,0 +1,116 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+from sqlalchemy import delete
+
+from airflow.assets.trigger_index import AssetTriggerIndex
+from airflow.models.asset import AssetDagRunQueue
+from airflow.models.serialized_dag import SerializedDagModel
+from airflow.providers.standard.operators.empty import EmptyOperator
+from airflow.sdk import Asset
+
+from tests_common.test_utils.db import clear_db_assets, clear_db_dags, clear_db_runs, clear_db_serialized_dags
+
+pytestmark = pytest.mark.db_test
+
+
+@pytest.fixture(autouse=True)
+def clean_db():
+    clear_db_runs()
+    clear_db_dags()
+    clear_db_serialized_dags()
+    clear_db_assets()
+    yield
+    clear_db_runs()
+    clear_db_dags()
+    clear_db_serialized_dags()
+    clear_db_assets()
+
+
+@pytest.fixture
+def asset_ids(dag_maker, session):
+    with dag_maker(dag_id="consumer", schedule=[Asset("a1"), Asset("a2")], session=session):
+        EmptyOperator(task_id="task")
+    return sorted(asset.id for asset in dag_maker.dag_model.schedule_assets)
+
+
+def _queue(session, asset_id):
+    adrq = AssetDagRunQueue(asset_id=asset_id, target_dag_id="consumer")
+    session.add(adrq)
+    session.flush()
+    return adrq
+
+
+def test_incremental_passes(session, asset_ids):
+    index = AssetTriggerIndex(resync_interval=3600)
+    assert index.triggered_dates(session) == {}
+
+    _queue(session, asset_ids[0])
+    assert index.triggered_dates(session) == {}
+
+    last = _queue(session, asset_ids[1])
+    assert index.triggered_dates(session) == {"consumer": last.created_at}
+    # Still due while its queued events are not consumed
+    assert index.triggered_dates(session) == {"consumer": last.created_at}
+
+    # Consumed, e.g. by another scheduler
+    session.execute(delete(AssetDagRunQueue))
+    assert index.triggered_dates(session) == {}
+
+
+def test_unchanged_dags_are_not_evaluated_again(session, asset_ids):
+    index = AssetTriggerIndex(resync_interval=3600)
+    _queue(session, asset_ids[0])
+    assert index.triggered_dates(session) == {}
+
+    with (
+        mock.patch.object(AssetTriggerIndex, "_get_conditions", return_value={}) as get_conditions,
+        mock.patch.object(SerializedDagModel, "get_latest_serialized_dags") as get_latest_serialized_dags,
+    ):
+        assert index.triggered_dates(session) == {}
+    get_conditions.assert_called_once_with(set(), session)
+    get_latest_serialized_dags.assert_not_called()
+
+
+def test_condition_is_not_deserialized_again(session, asset_ids):
+    index = AssetTriggerIndex(resync_interval=3600)
+    _queue(session, asset_ids[0])
+    assert index.triggered_dates(session) == {}
+
+    last = _queue(session, asset_ids[1])
+    with mock.patch.object(
+        SerializedDagModel, "get_latest_serialized_dags", wraps=SerializedDagModel.get_latest_serialized_dags
+    ) as get_latest_serialized_dags:
+        assert index.triggered_dates(session) == {"consumer": last.created_at}
+    get_latest_serialized_dags.assert_not_called()
+
+
+def test_full_resync(session, asset_ids):
+    index = AssetTriggerIndex(resync_interval=0)
+    _queue(session, asset_ids[0])
+    assert index.triggered_dates(session) == {}
+
+    with mock.patch.object(
+        SerializedDagModel, "get_latest_serialized_dags", wraps=SerializedDagModel.get_latest_serialized_dags
+    ) as get_latest_serialized_dags:
+        assert index.triggered_dates(session) == {}
+    # The condition is kept, but the Dag is evaluated again
+    get_latest_serialized_dags.assert_not_called()
@@ -1295,6 +1295,60 @@ class TestDagFileProcessorManager:
         assert manager._file_stats[file].last_finish_time > original_stat.last_finish_time
         assert manager._file_stats[file].num_dags == 0
 
+    @pytest.mark.parametrize(
+        ("requested_runtime_data", "expect_skipped"),
+        [
+            pytest.param(False, True, id="static"),
+            pytest.param(True, False, id="requested-runtime-data"),
+        ],
+    )
+    @conf_vars({("dag_processor", "unchanged_file_process_interval"): "600"})
+    def test_unchanged_file_is_not_parsed_again(self, tmp_path, requested_runtime_data, expect_skipped):
+        dag_file = tmp_path / "dag.py"
+        dag_file.write_text("from helper import make_dag\n")
+        helper = tmp_path / "helper.py"
+        helper.write_text("def make_dag(): ...\n")
+        an_hour_ago = time.time() - 3600
+        for path in (dag_file, helper):
+            os.utime(path, (an_hour_ago, an_hour_ago))
+
+        manager = DagFileProcessorManager(max_runs=-1)
+        manager._file_process_interval = 30
+        manager._bundle_versions["testing"] = None
+        file = DagFileInfo(bundle_name="testing", rel_path=Path("dag.py"), bundle_path=tmp_path)
+        processor, _ = self.mock_processor(start_time=time.monotonic() - 1)
+        processor.requested_runtime_data = requested_runtime_data
+        processor.parsing_result = DagFileParsingResult(
+            fileloc=str(dag_file), serialized_dags=[], dependencies=[str(helper)]
+        )
+        with mock.patch.object(manager, "persist_parsing_result"):
+            manager.handle_parsing_result(file, processor)
+
+        # Past min_file_process_interval, but within unchanged_file_process_interval
+        manager._file_stats[file].last_finish_time = timezone.utcnow() - timedelta(seconds=60)
+        manager.prepare_file_queue(known_files={"testing": {file}})
+        assert (file not in manager._file_queue) is expect_skipped
+
+        # A change in an imported module makes the file due for parsing again
+        manager._file_queue.clear()
+        helper.write_text("def make_dag(): return None\n")
+        manager.prepare_file_queue(known_files={"testing": {file}})
+        assert file in manager._file_queue
+
+    @conf_vars({("dag_processor", "unchanged_file_process_interval"): "600"})
+    def test_unchanged_file_fingerprint_includes_bundle_version(self, tmp_path):
+        (tmp_path / "dag.py").write_text("")
+        manager = DagFileProcessorManager(max_runs=-1)
+        file = DagFileInfo(bundle_name="testing", rel_path=Path("dag.py"), bundle_path=tmp_path)
+
+        manager._bundle_versions["testing"] = "v1"
+        fingerprint = manager._get_content_fingerprint(file, ())
+        manager._bundle_versions["testing"] = "v2"
+
+        assert fingerprint is not None
+        assert manager._get_content_fingerprint(file, ()) != fingerprint
+        assert manager._get_content_fingerprint(file, (str(tmp_path / "missing.py"),)) is None
+
     def test_collect_results_processes_remaining_files_when_one_persist_fails(self, session):
         manager = DagFileProcessorManager(max_runs=1)
         file_a = DagFileInfo(bundle_name="testing", rel_path=Path("a.py"), bundle_path=TEST_DAGS_FOLDER)
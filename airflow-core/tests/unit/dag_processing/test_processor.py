@@ -61,8 +61,10 @@ from airflow.dag_processing.processor import (
     _execute_dag_callbacks,
     _execute_email_callbacks,
     _execute_task_callbacks,
+    _get_bundle_module_files,
     _parse_file,
     _pre_import_airflow_modules,
+    pre_import_configured_modules,
 )
 from airflow.models import DagRun
 from airflow.sdk import DAG, BaseOperator
@@ -84,6 +86,7 @@ from airflow.sdk.execution_time.comms import (
     XComSequenceSliceResult,
 )
 from airflow.sdk.execution_time.task_runner import RuntimeTaskInstance
+from airflow.utils.file import iter_airflow_imports
 from airflow.utils.session import create_session
 from airflow.utils.state import TaskInstanceState
 
@@ -467,6 +470,50 @@ class TestDagFileProcessor:
 
         assert logger.warning.call_count == 1
 
+    def test__pre_import_airflow_modules_scans_unchanged_file_once(self, tmp_path):
+        dag_file = tmp_path / "dag.py"
+        dag_file.write_text("import airflow.models\n")
+        logger = MagicMock(spec=FilteringBoundLogger)
+        with (
+            env_vars({"AIRFLOW__DAG_PROCESSOR__PARSING_PRE_IMPORT_MODULES": "true"}),
+            patch(
+                "airflow.dag_processing.processor.iter_airflow_imports",
+                wraps=iter_airflow_imports,
+            ) as mock_iter,
+            patch("airflow.dag_processing.processor.importlib.import_module") as mock_import,
+        ):
+            _pre_import_airflow_modules(str(dag_file), logger)
+            _pre_import_airflow_modules(str(dag_file), logger)
+            assert mock_iter.call_count == 1
+
+            dag_file.write_text("import airflow.models\nimport airflow.utils.state\n")
+            _pre_import_airflow_modules(str(dag_file), logger)
+            assert mock_iter.call_count == 2
+
+        assert mock_import.call_args_list[-1].args == ("airflow.utils.state",)
+
+    def test_get_bundle_module_files(self, tmp_path, monkeypatch):
+        dag_file = tmp_path / "dag.py"
+        helper = tmp_path / "common" / "helper.py"
+        monkeypatch.setitem(sys.modules, "unusual_prefix_dag", MagicMock(__file__=str(dag_file)))
+        monkeypatch.setitem(sys.modules, "common.helper", MagicMock(__file__=str(helper)))
+        monkeypatch.setitem(sys.modules, "namespace_pkg", MagicMock(__file__=None))
+
+        assert _get_bundle_module_files(tmp_path, str(dag_file)) == [str(helper)]
+
+    @conf_vars({("dag_processor", "parsing_pre_import_module_list"): "airflow.models, non_existent_module"})
+    def test_pre_import_configured_modules(self):
+        logger = MagicMock(spec=FilteringBoundLogger)
+        with patch(
+            "airflow.dag_processing.processor.importlib.import_module",
+            side_effect=[None, ModuleNotFoundError()],
+        ) as mock_import:
+            pre_import_configured_modules(logger)
+
+        assert [c.args[0] for c in mock_import.call_args_list] == ["airflow.models", "non_existent_module"]
+        logger.warning.assert_called_once()
+        assert logger.warning.call_args[0][1] == "non_existent_module"
+
 
 def write_dag_in_a_fn_to_file(fn: Callable[[], None], folder: pathlib.Path) -> pathlib.Path:
     # Create the dag in a fn, and use inspect.getsource to write it to a file so that
@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 import logging
+import random
 from datetime import timedelta
 from pathlib import Path
 from textwrap import dedent
@@ -35,7 +36,7 @@ from airflow.callbacks.callback_requests import CallbackRequest
 from airflow.cli.cli_config import DefaultHelpParser, GroupCommand
 from airflow.cli.cli_parser import AirflowHelpFormatter
 from airflow.executors import workloads
-from airflow.executors.base_executor import BaseExecutor, RunningRetryAttemptType
+from airflow.executors.base_executor import BaseExecutor, QueuedTasks, RunningRetryAttemptType
 from airflow.executors.local_executor import LocalExecutor
 from airflow.executors.workloads.base import BundleInfo
 from airflow.executors.workloads.callback import CallbackDTO
@@ -350,6 +351,46 @@ def test_trigger_running_tasks(dag_maker):
     executor._process_workloads.assert_called_once()
 
 
+def test_queued_tasks_by_priority_matches_sorting_the_queue():
+    def workload(priority_weight):
+        return mock.Mock(ti=mock.Mock(priority_weight=priority_weight))
+
+    rng = random.Random(42)
+    queued = QueuedTasks()
+    expected: dict[TaskInstanceKey, mock.Mock] = {}
+    for i in range(2000):
+        key = TaskInstanceKey("dag", f"task_{rng.randrange(300)}", "run", 1, -1)
+        if key in expected and rng.random() < 0.5:
+            queued.pop(key)
+            del expected[key]
+        else:
+            queued[key] = expected[key] = workload(rng.randrange(10))
+
+        if i % 100 == 0:
+            ordered = sorted(expected.items(), key=lambda item: item[1].ti.priority_weight)
+            assert queued.by_priority() == ordered
+            assert queued.by_priority(limit=5) == ordered[:5]
+
+    assert queued == expected
+    # Stale heap entries of removed and replaced workloads don't pile up
+    assert len(queued._heap) <= 2 * len(queued) + 16
+
+    queued.clear()
+    assert queued.by_priority() == []
+
+
+@pytest.mark.db_test
+def test_trigger_tasks_only_takes_open_slots(dag_maker):
+    executor, dagrun = setup_trigger_tasks(dag_maker)
+    weights = {ti.key: ti.priority_weight for ti in dagrun.task_instances}
+
+    executor.trigger_tasks(open_slots=2)
+
+    (scheduled,) = executor._process_workloads.call_args.args
+    assert len(scheduled) == 2
+    assert sorted(weights.values())[:2] == [workload.ti.priority_weight for workload in scheduled]
+
+
 def test_debug_dump(caplog):
     executor = BaseExecutor()
     with caplog.at_level(logging.INFO):
@@ -30,7 +30,7 @@ from uuid6 import uuid7
 from airflow._shared.timezones import timezone
 from airflow.executors import workloads
 from airflow.executors.base_executor import BaseExecutor, ExecutorConf, get_execution_api_server_url
-from airflow.executors.local_executor import LocalExecutor
+from airflow.executors.local_executor import LocalExecutor, _pre_import_task_modules
 from airflow.executors.workloads.base import BundleInfo
 from airflow.executors.workloads.callback import CallbackDTO
 from airflow.executors.workloads.task import TaskInstanceDTO
@@ -398,6 +398,79 @@ class TestLocalExecutor:
 
         executor.end()
 
+    @conf_vars({("core", "local_executor_heartbeat_coalesce_interval"): "1.5"})
+    @mock.patch.object(LocalExecutor, "is_mp_using_fork", False)
+    @mock.patch("airflow.executors.local_executor.multiprocessing.Process")
+    @mock.patch("airflow.sdk.execution_time.supervisor.HeartbeatAgent")
+    def test_heartbeat_agent(self, mock_agent_cls, mock_process):
+        executor = LocalExecutor(parallelism=1)
+        executor.start()
+        agent = mock_agent_cls.return_value
+        mock_agent_cls.assert_called_once_with(
+            server=get_execution_api_server_url(executor.conf), interval=1.5
+        )
+        agent.start.assert_called_once()
+
+        executor._spawn_worker()
+        assert mock_process.call_args.kwargs["kwargs"]["heartbeat_channel"] is agent.connect.return_value
+
+        mock_process.return_value.is_alive.return_value = False
+        executor._check_workers()
+        agent.disconnect.assert_called_once_with(agent.connect.return_value)
+
+        executor.end()
+        agent.stop.assert_called_once()
+
+    @mock.patch.object(LocalExecutor, "is_mp_using_fork", False)
+    @mock.patch("airflow.sdk.execution_time.supervisor.HeartbeatAgent")
+    def test_heartbeat_agent_disabled_by_default(self, mock_agent_cls):
+        executor = LocalExecutor(parallelism=1)
+        executor.start()
+        try:
+            mock_agent_cls.assert_not_called()
+            assert executor._heartbeat_agent is None
+        finally:
+            executor.end()
+
+    @pytest.mark.parametrize(
+        ("enabled", "expected_imports"),
+        [
+            pytest.param(
+                "True",
+                [
+                    "airflow.sdk.execution_time.task_runner",
+                    "airflow.dag_processing.dagbag",
+                    "json",
+                    "not_a_module",
+                ],
+                id="enabled",
+            ),
+            pytest.param("False", [], id="disabled"),
+        ],
+    )
+    @mock.patch("airflow.executors.local_executor.gc.freeze")
+    def test_pre_import_task_modules(self, mock_freeze, enabled, expected_imports):
+        log = mock.MagicMock()
+        with (
+            conf_vars(
+                {
+                    ("core", "local_executor_pre_import_modules"): enabled,
+                    ("core", "local_executor_pre_import_module_list"): "json, not_a_module",
+                }
+            ),
+            mock.patch(
+                "airflow.executors.local_executor.importlib.import_module",
+                side_effect=[None, None, None, ModuleNotFoundError("No module named 'not_a_module'")],
+            ) as mock_import,
+        ):
+            _pre_import_task_modules(ExecutorConf(), log)
+
+        assert [call.args[0] for call in mock_import.call_args_list] == expected_imports
+        assert mock_freeze.called == bool(expected_imports)
+        if expected_imports:
+            log.warning.assert_called_once()
+            assert log.warning.call_args.args[1] == "not_a_module"
+
 
 class TestLocalExecutorConnectionTestSupport:
     def test_supports_connection_test_flag_is_true(self):
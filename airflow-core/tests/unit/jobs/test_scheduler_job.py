@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import contextlib
 import datetime
+import gc
 import logging
 import os
 import re
@@ -57,7 +58,7 @@ from airflow.executors.executor_loader import ExecutorLoader
 from airflow.executors.executor_utils import ExecutorName
 from airflow.executors.local_executor import LocalExecutor
 from airflow.jobs.job import Job, run_job
-from airflow.jobs.scheduler_job_runner import SchedulerJobRunner
+from airflow.jobs.scheduler_job_runner import ConcurrencyMap, SchedulerJobRunner
 from airflow.models.asset import (
     AssetActive,
     AssetAliasModel,
@@ -134,7 +135,7 @@ from airflow.timetables.simple import (
     PartitionedAssetTimetable as CorePartitionedAssetTimetable,
 )
 from airflow.utils.session import NEW_SESSION, create_session, provide_session
-from airflow.utils.sqlalchemy import with_row_locks
+from airflow.utils.sqlalchemy import prohibit_commit, with_row_locks
 from airflow.utils.state import CallbackState, DagRunState, State, TaskInstanceState
 from airflow.utils.types import DagRunTriggeredByType, DagRunType
 
@@ -1912,6 +1913,61 @@ class TestSchedulerJob:
 
         session.rollback()
 
+    @pytest.mark.parametrize(
+        ("limit_candidates_per_pool", "expected_queued"),
+        [
+            pytest.param("True", {"hot": 1, "cold": 3}, id="limited"),
+            pytest.param("False", {"hot": 1}, id="unlimited"),
+        ],
+    )
+    def test_find_executable_task_instances_limits_candidates_per_pool(
+        self, dag_maker, session, limit_candidates_per_pool, expected_queued
+    ):
+        """Candidates from a nearly full pool should not crowd out the rest of the batch."""
+        session.add(Pool(pool="hot", slots=1, include_deferred=False))
+        session.add(Pool(pool="cold", slots=32, include_deferred=False))
+
+        with dag_maker(dag_id="limit_candidates_per_pool", max_active_tasks=16, session=session):
+            for i in range(4):
+                EmptyOperator(task_id=f"hot_{i}", priority_weight=10, pool="hot")
+            for i in range(3):
+                EmptyOperator(task_id=f"cold_{i}", priority_weight=1, pool="cold")
+
+        dr = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED, session=session)
+        for ti in dr.get_task_instances(session=session):
+            ti.state = State.SCHEDULED
+        session.flush()
+
+        with conf_vars({("scheduler", "limit_candidates_per_pool"): limit_candidates_per_pool}):
+            self.job_runner = SchedulerJobRunner(job=Job())
+        res = self.job_runner._executable_task_instances_to_queued(max_tis=4, session=session)
+
+        assert Counter(ti.pool for ti in res) == expected_queued
+
+        session.rollback()
+
+    @conf_vars({("scheduler", "limit_candidates_per_pool"): "True"})
+    def test_find_executable_task_instances_limits_candidates_per_pool_logs_found(self, dag_maker, session):
+        session.add(Pool(pool="wide", slots=3, include_deferred=False))
+        with dag_maker(dag_id="limit_candidates_per_pool_logs", max_active_tasks=16, session=session):
+            EmptyOperator(task_id="small_a", priority_weight=3, pool="wide")
+            EmptyOperator(task_id="big", priority_weight=2, pool="wide", pool_slots=3)
+            EmptyOperator(task_id="small_b", priority_weight=1, pool="wide")
+
+        dr = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED, session=session)
+        for ti in dr.get_task_instances(session=session):
+            ti.state = State.SCHEDULED
+        session.flush()
+
+        self.job_runner = SchedulerJobRunner(job=Job())
+        with mock.patch.object(self.job_runner.log, "info") as mock_info:
+            self.job_runner._executable_task_instances_to_queued(max_tis=4, session=session)
+
+        messages = [call.args[0] for call in mock_info.call_args_list]
+        assert not any(message.startswith("Found no task instances to queue") for message in messages)
+
+        session.rollback()
+
     def test_find_executable_task_instances_order_logical_date_and_priority(self, dag_maker):
         dag_id_1 = "SchedulerJobTest.test_find_executable_task_instances_order_logical_date_and_priority-a"
         dag_id_2 = "SchedulerJobTest.test_find_executable_task_instances_order_logical_date_and_priority-b"
@@ -2215,6 +2271,68 @@ class TestSchedulerJob:
 
         session.rollback()
 
+    @conf_vars({("scheduler", "concurrency_map_reconcile_interval"): "300"})
+    def test_find_executable_task_instances_incremental_concurrency_map(self, dag_maker, session):
+        """The concurrency map is loaded once and then maintained from queueing and executor events."""
+        with dag_maker(dag_id="incremental_concurrency_map", max_active_tasks=2, session=session):
+            EmptyOperator(task_id="task_1")
+            EmptyOperator(task_id="task_2")
+            EmptyOperator(task_id="task_3")
+
+        executor = MockExecutor(do_update=False)
+        self.job_runner = SchedulerJobRunner(job=Job(), executors=[executor])
+
+        dr = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED, session=session)
+        for ti in dr.get_task_instances(session=session):
+            ti.state = State.SCHEDULED
+        session.flush()
+
+        with mock.patch.object(
+            ConcurrencyMap, "load", autospec=True, side_effect=ConcurrencyMap.load
+        ) as load:
+            queued_tis = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+            assert len(queued_tis) == 2
+            assert load.call_count == 1
+            session.flush()
+
+            # The map already accounts for the two queued TIs, without reloading it
+            assert self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session) == []
+            assert load.call_count == 1
+
+            # Once the executor reports one of them finished, its slot is released
+            finished_ti = dr.get_task_instance(queued_tis[0].task_id, session=session)
+            finished_ti.state = State.SUCCESS
+            finished_ti.end_date = timezone.utcnow()
+            session.flush()
+            executor.event_buffer[finished_ti.key] = State.SUCCESS, None
+            self.job_runner._process_executor_events(executor=executor, session=session)
+
+            queued_tis = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+            assert len(queued_tis) == 1
+            assert load.call_count == 1
+
+        concurrency_map = self.job_runner._concurrency_map
+        assert concurrency_map.dag_run_active_tasks_map[dr.dag_id, dr.run_id] == 2
+
+    def test_concurrency_map_release_skips_tis_finished_before_load(self):
+        concurrency_map = ConcurrencyMap()
+        concurrency_map.loaded_at = timezone.utcnow()
+        ti = mock.MagicMock(spec=TaskInstance, dag_id="dag", task_id="task", run_id="run", queued_by_job_id=1)
+        concurrency_map.add_queued(ti)
+
+        ti.end_date = concurrency_map.loaded_at - timedelta(seconds=1)
+        concurrency_map.release(ti, job_id=1)
+        assert concurrency_map.task_concurrency_map["dag", "task"] == 1
+
+        ti.end_date = concurrency_map.loaded_at + timedelta(seconds=1)
+        concurrency_map.release(ti, job_id=2)
+        assert concurrency_map.task_concurrency_map["dag", "task"] == 1
+
+        concurrency_map.release(ti, job_id=1)
+        assert not concurrency_map.task_concurrency_map
+        assert not concurrency_map.task_dagrun_concurrency_map
+        assert not concurrency_map.dag_run_active_tasks_map
+
     # TODO: This is a hack, I think I need to just remove the setting and have it on always
     def test_find_executable_task_instances_max_active_tis_per_dag(self, dag_maker):
         dag_id = "SchedulerJobTest.test_find_executable_task_instances_max_active_tis_per_dag"
@@ -5758,6 +5876,55 @@ class TestSchedulerJob:
                 for msg in error_messages
             )
 
+    @pytest.mark.parametrize("bulk_scheduling_decisions", [True, False])
+    def test_schedule_all_dag_runs_bulk_scheduling_decisions(
+        self, dag_maker, session, bulk_scheduling_decisions
+    ):
+        dag_runs = []
+        for dag_id in ("bulk_dag_1", "bulk_dag_2"):
+            with dag_maker(dag_id=dag_id, schedule="@once", session=session):
+                upstream = EmptyOperator(task_id="upstream")
+                upstream >> EmptyOperator(task_id="downstream")
+            dag_runs.append(dag_maker.create_dagrun(state=DagRunState.RUNNING))
+        session.flush()
+
+        with conf_vars({("scheduler", "bulk_scheduling_decisions"): str(bulk_scheduling_decisions)}):
+            self.job_runner = SchedulerJobRunner(job=Job(), executors=[self.null_exec])
+        with (
+            mock.patch.object(
+                DagRun, "fetch_task_instances", wraps=DagRun.fetch_task_instances
+            ) as mock_fetch,
+            prohibit_commit(session) as guard,
+        ):
+            result = self.job_runner._schedule_all_dag_runs.__wrapped__(
+                self.job_runner, guard, dag_runs, session=session
+            )
+
+        assert [run for run, _ in result] == dag_runs
+        assert mock_fetch.call_count == (0 if bulk_scheduling_decisions else len(dag_runs))
+        assert self.job_runner._prefetched_tis == {}
+        session.expire_all()
+        for dag_run in dag_runs:
+            states = {ti.task_id: ti.state for ti in dag_run.get_task_instances(session=session)}
+            assert states == {"upstream": TaskInstanceState.SUCCESS, "downstream": None}
+
+    def test_prefetch_scheduling_state_keeps_dag_models(self, dag_maker, session):
+        for dag_id in ("prefetch_dag_1", "prefetch_dag_2"):
+            with dag_maker(dag_id=dag_id, schedule="@once", session=session):
+                EmptyOperator(task_id="task")
+            dag_maker.create_dagrun(state=DagRunState.RUNNING)
+        session.flush()
+        session.expunge_all()
+        dag_runs = session.scalars(select(DagRun).order_by(DagRun.dag_id)).all()
+
+        self.job_runner = SchedulerJobRunner(job=Job(), executors=[self.null_exec])
+        self.job_runner._prefetch_scheduling_state(dag_runs, session=session)
+        gc.collect()
+
+        with assert_queries_count(0, session=session):
+            dag_models = [DagModel.get_dagmodel(dr.dag_id, session=session) for dr in dag_runs]
+        assert [dm.dag_id for dm in dag_models] == ["prefetch_dag_1", "prefetch_dag_2"]
+
     def test_schedule_all_dag_runs_reraises_db_errors(self, dag_maker, session):
         """Test that _schedule_all_dag_runs does not catch DBAPIError, allowing
         it to propagate to @retry_db_transaction for proper retry handling.
@@ -61,6 +61,7 @@ from airflow.jobs.triggerer_job_runner import (
     TriggerRunner,
     TriggerRunnerSupervisor,
     _make_trigger_span,
+    _TimedTriggerCoroutine,
     messages,
 )
 from airflow.models import Connection, DagModel, DagRun, Trigger, Variable
@@ -524,6 +525,74 @@ def test_load_triggers_passes_team_name(supervisor_builder, mocker):
     ids_for_triggerer.assert_called_once_with(proc.job.id, queues=proc.queues, team_name="team_x")
 
 
+def test_load_triggers_splits_triggers_between_partitions(supervisor_builder, mocker):
+    primary = supervisor_builder()
+    peer = supervisor_builder()
+    primary.num_partitions = peer.num_partitions = 2
+    peer.partition = 1
+    primary.peers = [peer]
+
+    assign_unassigned = mocker.patch("airflow.jobs.triggerer_job_runner.Trigger.assign_unassigned")
+    mocker.patch("airflow.jobs.triggerer_job_runner.Trigger.ids_for_triggerer", return_value=[1, 2, 3, 4])
+    update_triggers = mocker.patch.object(TriggerRunnerSupervisor, "update_triggers", autospec=True)
+
+    primary.load_triggers()
+    peer.load_triggers()
+
+    # Only the primary assigns triggers to the job, for the capacity of all the runners
+    assign_unassigned.assert_called_once()
+    assert update_triggers.call_args_list == [mock.call(primary, {2, 4}), mock.call(peer, {1, 3})]
+
+    gauge = mocker.patch("airflow.jobs.triggerer_job_runner.stats.gauge")
+    primary.running_triggers = {2, 4}
+    peer.running_triggers = {1}
+    primary.emit_metrics()
+    gauge.assert_any_call("triggers.running", 3, tags=ANY)
+
+
+def test_run_raises_error_of_peer(supervisor_builder, mocker):
+    """A peer runner whose loop fails stops the main loop, even though its subprocess is still alive."""
+    primary = supervisor_builder()
+    peer = supervisor_builder()
+    primary.num_partitions = peer.num_partitions = 2
+    peer.partition = 1
+    primary.peers = [peer]
+    mocker.patch.object(
+        TriggerRunnerSupervisor,
+        "run_once",
+        autospec=True,
+        side_effect=lambda runner: runner.partition == 1 and runner.load_triggers(),
+    )
+    mocker.patch.object(TriggerRunnerSupervisor, "load_triggers", side_effect=RuntimeError("DB is down"))
+
+    thread = threading.Thread(target=peer.run_as_peer)
+    thread.start()
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+    assert peer.is_alive()
+
+    with pytest.raises(RuntimeError, match="DB is down"):
+        primary.run()
+
+
+def test_run_once_loads_triggers_at_most_once_per_interval(supervisor_builder, mocker):
+    proc = supervisor_builder()
+    load_triggers = mocker.patch.object(TriggerRunnerSupervisor, "load_triggers")
+    service_subprocess = mocker.patch.object(TriggerRunnerSupervisor, "_service_subprocess")
+    mocker.patch.object(TriggerRunnerSupervisor, "heartbeat")
+    mocker.patch.object(TriggerRunnerSupervisor, "clean_unused")
+
+    # The runner syncing several times in quick succession doesn't load the triggers each time
+    proc.run_once()
+    proc.run_once()
+    load_triggers.assert_called_once()
+    assert 0 < service_subprocess.call_args.args[0] <= 1
+
+    proc._last_trigger_load -= 1
+    proc.run_once()
+    assert load_triggers.call_count == 2
+
+
 def test_create_workload_uses_supervisor_id_without_job(jobless_supervisor, mocker):
     """_create_workload() should fall back to self.id for the log filename when job is None."""
     trigger = mocker.Mock()
@@ -753,6 +822,72 @@ class TestTriggerRunner:
         assert threshold == 0.5
         mock_stats_incr.assert_called_once_with("triggers.blocked_main_thread")
 
+    @pytest.mark.asyncio
+    async def test_trigger_steps_are_timed(self) -> None:
+        with conf_vars({("triggerer", "blocked_main_thread_warning_threshold"): "0.05"}):
+            trigger_runner = TriggerRunner()
+        trigger_runner.log = MagicMock()
+
+        async def blocking_trigger():
+            await asyncio.sleep(0)
+            time.sleep(0.1)  # noqa: ASYNC251 - blocking on purpose
+            await asyncio.sleep(0)
+
+        async def well_behaved_trigger():
+            await asyncio.sleep(0.1)
+
+        await asyncio.gather(
+            asyncio.create_task(
+                _TimedTriggerCoroutine(
+                    blocking_trigger(), name="blocking (ID 1)", classpath="a.Blocking", runner=trigger_runner
+                )
+            ),
+            asyncio.create_task(
+                _TimedTriggerCoroutine(
+                    well_behaved_trigger(), name="fine (ID 2)", classpath="a.Fine", runner=trigger_runner
+                )
+            ),
+        )
+
+        assert trigger_runner.trigger_loop_time["blocking (ID 1)"] >= 0.1
+        assert trigger_runner.trigger_loop_time["fine (ID 2)"] < 0.05
+        trigger_runner.log.warning.assert_called_once()
+        assert trigger_runner.log.warning.call_args.args[1] == "blocking (ID 1)"
+
+        with patch("airflow.jobs.triggerer_job_runner.stats.timing") as mock_timing:
+            trigger_runner.report_trigger_loop_time(60)
+
+        assert {c.kwargs["tags"]["classpath"] for c in mock_timing.call_args_list} == {"a.Blocking", "a.Fine"}
+        report = trigger_runner.log.info.call_args.args[2]
+        assert report.index("blocking (ID 1)") < report.index("fine (ID 2)")
+        assert not trigger_runner.trigger_loop_time
+
+    @pytest.mark.asyncio
+    async def test_trigger_events_wake_up_the_sync(self) -> None:
+        with conf_vars({("triggerer", "state_sync_batch_delay"): "0.05"}):
+            trigger_runner = TriggerRunner()
+        trigger_runner._wakeup = asyncio.Event()
+
+        async def fire_events():
+            await asyncio.sleep(0.01)
+            for trigger_id in range(3):
+                trigger_runner.events.append((trigger_id, TriggerEvent(True)))
+                trigger_runner.request_sync()
+
+        start = time.monotonic()
+        await asyncio.gather(trigger_runner.wait_for_state_change(), fire_events())
+        elapsed = time.monotonic() - start
+
+        # Woken up by the first event, long before the sync interval, and batched the rest with it
+        assert 0.05 <= elapsed < 0.5
+        assert len(trigger_runner.events) == 3
+        assert not trigger_runner._wakeup.is_set()
+
+        # Pending state is synced without waiting to be woken up
+        start = time.monotonic()
+        await trigger_runner.wait_for_state_change()
+        assert time.monotonic() - start < 0.5
+
     def test_run_inline_trigger_canceled(self, session) -> None:
         trigger_runner = TriggerRunner()
         trigger_runner.triggers = {
@@ -20,6 +20,7 @@ from __future__ import annotations
 from contextlib import nullcontext
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
+from unittest import mock
 
 import pendulum
 import pytest
@@ -162,6 +163,51 @@ def test_create_backfill_simple(reverse, existing, dag_maker, session):
     assert all(x.conf == expected_run_conf for x in dag_runs)
 
 
+@mock.patch("airflow.models.backfill.BACKFILL_DAG_RUN_BATCH_SIZE", 2)
+def test_create_backfill_in_batches(dag_maker, session):
+    """Verify runs created in batches alongside existing runs are the same as when created one by one."""
+    with dag_maker(schedule="@daily") as dag:
+        PythonOperator(task_id="hi", python_callable=print)
+        PythonOperator.partial(task_id="mapped", python_callable=print).expand(op_args=[[1], [2], [3]])
+    dag_maker.create_dagrun(
+        run_id="scheduled_2021-01-03", logical_date=timezone.parse("2021-01-03"), session=session
+    )
+    session.commit()
+
+    b = _create_backfill(
+        dag_id=dag.dag_id,
+        from_date=pendulum.parse("2021-01-01"),
+        to_date=pendulum.parse("2021-01-05"),
+        max_active_runs=2,
+        reverse=False,
+        triggering_user_name="pytest",
+        dag_run_conf=None,
+    )
+    bdrs = session.scalars(
+        select(BackfillDagRun).where(BackfillDagRun.backfill_id == b.id).order_by(BackfillDagRun.sort_ordinal)
+    ).all()
+    assert [(bdr.sort_ordinal, str(bdr.logical_date.date()), bdr.exception_reason) for bdr in bdrs] == [
+        (1, "2021-01-01", None),
+        (2, "2021-01-02", None),
+        (3, "2021-01-03", BackfillDagRunExceptionReason.IN_FLIGHT),
+        (4, "2021-01-04", None),
+        (5, "2021-01-05", None),
+    ]
+    dag_runs = session.scalars(
+        select(DagRun).where(DagRun.backfill_id == b.id).order_by(DagRun.logical_date)
+    ).all()
+    assert [dr.id for dr in dag_runs] == [bdr.dag_run_id for bdr in bdrs if bdr.dag_run_id]
+    assert all(dr.state == DagRunState.QUEUED and dr.run_type == DagRunType.BACKFILL_JOB for dr in dag_runs)
+    for dr in dag_runs:
+        tis = session.scalars(select(TaskInstance).where(TaskInstance.run_id == dr.run_id)).all()
+        assert sorted((ti.task_id, ti.map_index) for ti in tis) == [
+            ("hi", -1),
+            ("mapped", 0),
+            ("mapped", 1),
+            ("mapped", 2),
+        ]
+
+
 @pytest.mark.parametrize("run_on_latest_version", [True, False])
 def test_create_backfill_clear_existing_bundle_version(dag_maker, session, run_on_latest_version):
     """
@@ -1510,6 +1510,45 @@ class TestDag:
         )
         assert dr.note == note
 
+    def test_create_dagruns(self, testing_dag_bundle, session):
+        with DAG(dag_id="test_create_dagruns", schedule="@daily", start_date=DEFAULT_DATE) as dag:
+            EmptyOperator(task_id="task_1") >> EmptyOperator(task_id="task_2")
+        scheduler_dag = sync_dag_to_db(dag, session=session)
+        infos = [
+            DagRunInfo.interval(DEFAULT_DATE + timedelta(days=i), DEFAULT_DATE + timedelta(days=i + 1))
+            for i in range(3)
+        ]
+
+        drs = scheduler_dag.create_dagruns(
+            runs=[(f"run_{i}", info) for i, info in enumerate(infos)],
+            run_type=DagRunType.BACKFILL_JOB,
+            state=State.QUEUED,
+            triggered_by=DagRunTriggeredByType.TEST,
+            session=session,
+        )
+
+        assert [(dr.run_id, dr.logical_date, dr.run_after) for dr in drs] == [
+            (f"run_{i}", info.logical_date, info.run_after) for i, info in enumerate(infos)
+        ]
+        assert all(dr.created_dag_version is not None for dr in drs)
+        tis = session.execute(select(TI.run_id, TI.task_id).where(TI.dag_id == dag.dag_id)).all()
+        assert sorted(tis) == [(f"run_{i}", f"task_{t}") for i in range(3) for t in (1, 2)]
+
+    def test_create_dagruns_validates_run_ids(self, testing_dag_bundle, session):
+        dag = DAG(dag_id="test_create_dagruns_validates_run_ids", schedule="@daily", start_date=DEFAULT_DATE)
+        scheduler_dag = sync_dag_to_db(dag, session=session)
+        info = DagRunInfo.interval(DEFAULT_DATE, DEFAULT_DATE + timedelta(days=1))
+
+        with pytest.raises(ValueError, match="must not contain '..'"):
+            scheduler_dag.create_dagruns(
+                runs=[("valid", info), ("in..valid", info)],
+                run_type=DagRunType.BACKFILL_JOB,
+                state=State.QUEUED,
+                triggered_by=DagRunTriggeredByType.TEST,
+                session=session,
+            )
+        assert session.scalar(select(func.count()).where(DagRun.dag_id == dag.dag_id)) == 0
+
     @pytest.mark.parametrize(
         ("partition_key", "expected_cm"),
         [
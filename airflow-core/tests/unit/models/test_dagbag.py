@@ -24,7 +24,7 @@ import pytest
 import time_machine
 from cachetools import LRUCache, TTLCache
 
-from airflow.models.dagbag import DBDagBag
+from airflow.models.dagbag import DBDagBag, estimate_dag_size
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.serialization.serialized_objects import SerializedDAG
 
@@ -303,3 +303,86 @@ class TestDBDagBagCache:
         dag_bag._read_dag(mock_serdag)
 
         mock_stats.gauge.assert_called_with("api_server.dag_bag.cache_size", 1, rate=0.1)
+
+
+class TestDBDagBagSizeBoundedCache:
+    """Tests for the scheduler's size-bounded DBDagBag cache."""
+
+    @staticmethod
+    def _serdag(version_id, size):
+        serdag = MagicMock(spec=SerializedDagModel)
+        serdag.dag = MagicMock(spec=SerializedDAG, size=size)
+        serdag.dag_id = f"dag_{version_id}"
+        serdag.dag_version_id = version_id
+        return serdag
+
+    def test_estimate_dag_size_grows_with_tasks(self):
+        from airflow.providers.standard.operators.empty import EmptyOperator
+        from airflow.sdk import DAG
+
+        from tests_common.test_utils.dag import create_scheduler_dag
+
+        def make_dag(num_tasks):
+            with DAG(dag_id=f"dag_{num_tasks}", schedule=None) as dag:
+                for i in range(num_tasks):
+                    EmptyOperator(task_id=f"task_{i}")
+            return create_scheduler_dag(dag)
+
+        assert 0 < estimate_dag_size(make_dag(1)) < estimate_dag_size(make_dag(10))
+
+    @patch("airflow.models.dagbag.stats")
+    @patch("airflow.models.dagbag.estimate_dag_size", lambda dag: dag.size)
+    def test_evicts_least_recently_used_by_size(self, mock_stats):
+        dag_bag = DBDagBag(max_cache_bytes=100)
+
+        dag_bag._read_dag(self._serdag("v1", 40))
+        dag_bag._read_dag(self._serdag("v2", 40))
+        assert dag_bag._dags.get("v1") is not None
+        dag_bag._read_dag(self._serdag("v3", 40))
+
+        assert set(dag_bag._dags) == {"v1", "v3"}
+        assert dag_bag._dags.currsize == 80
+        mock_stats.incr.assert_called_once_with("scheduler.dag_bag.cache_evict")
+        mock_stats.gauge.assert_called_with("scheduler.dag_bag.cache_bytes", 80, rate=0.1)
+
+    @patch("airflow.models.dagbag.estimate_dag_size", lambda dag: dag.size)
+    def test_dag_larger_than_cache_is_not_cached(self):
+        dag_bag = DBDagBag(max_cache_bytes=100)
+        serdag = self._serdag("v1", 200)
+
+        assert dag_bag._read_dag(serdag) is serdag.dag
+        assert len(dag_bag._dags) == 0
+
+    @patch("airflow.models.dagbag.stats")
+    def test_scheduler_hit_and_miss_metrics(self, mock_stats):
+        dag_bag = DBDagBag(max_cache_bytes=0)
+        assert isinstance(dag_bag._dags, dict)
+        mock_session = MagicMock()
+        mock_session.get.return_value = MagicMock(serialized_dag=self._serdag("v1", 1))
+
+        dag_bag.get_dag("v1", mock_session)
+        dag_bag.get_dag("v1", mock_session)
+
+        assert [c.args[0] for c in mock_stats.incr.call_args_list] == [
+            "scheduler.dag_bag.cache_miss",
+            "scheduler.dag_bag.cache_hit",
+        ]
+
+    def test_prewarm_caches_latest_version_of_unpaused_dags(self, dag_maker, session):
+        from airflow.models.dag import DagModel
+        from airflow.models.dag_version import DagVersion
+        from airflow.providers.standard.operators.empty import EmptyOperator
+
+        with dag_maker("prewarm_active", session=session):
+            EmptyOperator(task_id="task")
+        with dag_maker("prewarm_paused", session=session):
+            EmptyOperator(task_id="task")
+        session.get(DagModel, "prewarm_paused").is_paused = True
+        session.flush()
+
+        dag_bag = DBDagBag(max_cache_bytes=0)
+        assert dag_bag.prewarm(session=session) == 1
+
+        latest = DagVersion.get_latest_version("prewarm_active", session=session)
+        assert list(dag_bag._dags) == [latest.id]
+        assert dag_bag._dags[latest.id].dag_id == "prewarm_active"
@@ -2056,6 +2056,25 @@ class TestTaskInstance:
         assert asset_model.active is None, "dynamically created asset should be inactive"
         assert session.scalars(asset_event_check_stmt).one().uri == asset_uri
 
+    def test_outlet_asset_alias_asset_not_exists_different_extras(self, dag_maker, session):
+        asset_alias_name = "test_outlet_asset_alias_asset_not_exists_asset_alias"
+        asset_uri = "does_not_exist"
+
+        with dag_maker(dag_id="producer_dag", schedule=None, session=session):
+
+            @task(outlets=AssetAlias(asset_alias_name))
+            def producer(*, outlet_events):
+                outlet_events[AssetAlias(asset_alias_name)].add(Asset(asset_uri), extra={"key": "value"})
+                outlet_events[AssetAlias(asset_alias_name)].add(Asset(asset_uri), extra={"key": "other"})
+
+            producer()
+
+        dag_maker.run_ti("producer")
+
+        asset_model = session.scalars(select(AssetModel)).one()
+        assert asset_model.uri == asset_uri
+        assert sorted(e.extra["key"] for e in session.scalars(select(AssetEvent))) == ["other", "value"]
+
     def test_outlet_asset_alias_asset_inactive(self, dag_maker, session):
         asset1 = SerializedAsset("asset1", "asset1", "", {}, [])
         asset2 = SerializedAsset("asset2", "asset2", "", {}, [])
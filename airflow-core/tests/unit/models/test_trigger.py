@@ -34,6 +34,7 @@ from airflow.jobs.triggerer_job_runner import TriggererJobRunner
 from airflow.models import TaskInstance, Trigger
 from airflow.models.asset import AssetEvent, AssetModel, AssetWatcherModel
 from airflow.models.callback import Callback, TriggererCallback
+from airflow.models.trigger import TriggererHashRing
 from airflow.models.xcom import XComModel
 from airflow.providers.standard.operators.empty import EmptyOperator
 from airflow.sdk.definitions.callback import AsyncCallback
@@ -542,6 +543,60 @@ def test_assign_unassigned_with_qeueus(session, create_triggerer, create_trigger
     )
 
 
+def test_triggerer_hash_ring_only_moves_triggers_to_new_triggerer():
+    before = TriggererHashRing([1, 2, 3])
+    after = TriggererHashRing([1, 2, 3, 4])
+    trigger_ids = range(1000)
+
+    moved = {t for t in trigger_ids if next(before.preference(t)) != next(after.preference(t))}
+
+    assert {next(after.preference(t)) for t in moved} == {4}
+    assert 100 < len(moved) < 400
+    assert sorted(after.preference(7)) == [1, 2, 3, 4]
+    # A full triggerer is skipped in favour of the next one on the ring
+    preferred, second = list(after.preference(7))[:2]
+    assert after.owner(7, {preferred: 10}, capacity=10) == second
+    assert after.owner(7, dict.fromkeys([1, 2, 3, 4], 10), capacity=10) is None
+
+
+def test_assign_consistent_hash_rebalances_gradually(session, create_triggerer):
+    time_now = timezone.utcnow()
+    triggerers = [create_triggerer(session, State.RUNNING, latest_heartbeat=time_now) for _ in range(2)]
+    triggers = [Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={}) for _ in range(40)]
+    session.add_all(triggers)
+    session.commit()
+
+    def assign_until_stable(triggerer_ids, max_moves):
+        released_per_call = []
+        for _ in range(20):
+            moves = [
+                Trigger.assign_consistent_hash(t, 100, 30, max_moves, session=session) for t in triggerer_ids
+            ]
+            released_per_call.extend(released for _, released in moves)
+            if not any(claimed or released for claimed, released in moves):
+                break
+        session.expire_all()
+        return {t.id: t.triggerer_id for t in session.scalars(select(Trigger))}, released_per_call
+
+    triggerer_ids = [t.id for t in triggerers]
+    assignment, _ = assign_until_stable(triggerer_ids, max_moves=2)
+    ring = TriggererHashRing(triggerer_ids)
+    assert assignment == {t.id: next(ring.preference(t.id)) for t in triggers}
+
+    new_triggerer = create_triggerer(session, State.RUNNING, latest_heartbeat=time_now)
+    session.commit()
+    triggerer_ids.append(new_triggerer.id)
+    new_assignment, released_per_call = assign_until_stable(triggerer_ids, max_moves=2)
+
+    ring = TriggererHashRing(triggerer_ids)
+    assert new_assignment == {t.id: next(ring.preference(t.id)) for t in triggers}
+    # Only the triggers now owned by the new triggerer moved, and at most 2 at a time
+    assert {new_assignment[t] for t in new_assignment if new_assignment[t] != assignment[t]} == {
+        new_triggerer.id
+    }
+    assert max(released_per_call) == 2
+
+
 def test_queue_column_max_len_matches_ti_column_max_len() -> None:
     """Ensures that the `trigger.queue` column has the same max length as the `task_instance.queue` column."""
     expected_queue_col_max_length_from_ti = TaskInstance.queue.property.columns[0].type.length
@@ -1355,6 +1355,21 @@ class TestStringifiedDAGs:
         deserialized_simple_task = deserialized_dag.task_dict["simple_task"]
         assert expected_val == deserialized_simple_task.params.dump()
 
+    def test_task_params_deserialized_on_first_access(self):
+        dag = DAG(dag_id="simple_dag", schedule=None, params={"dag_param": 1})
+        BaseOperator(task_id="simple_task", dag=dag, params={"param_1": "value_1"})
+        serialized_dag = DagSerialization.to_dict(dag)
+
+        with mock.patch.object(
+            BaseSerialization, "_deserialize_params_dict", wraps=BaseSerialization._deserialize_params_dict
+        ) as mock_deserialize:
+            deserialized_simple_task = DagSerialization.from_dict(serialized_dag).task_dict["simple_task"]
+            # Only the DAG's own params are deserialized eagerly.
+            assert mock_deserialize.call_count == 1
+            assert deserialized_simple_task.params.dump() == {"dag_param": 1, "param_1": "value_1"}
+            assert deserialized_simple_task.params.dump() == {"dag_param": 1, "param_1": "value_1"}
+            assert mock_deserialize.call_count == 2
+
     @pytest.mark.db_test
     @pytest.mark.parametrize(
         ("bash_command", "serialized_links", "links"),
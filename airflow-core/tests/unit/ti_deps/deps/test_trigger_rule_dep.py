@@ -1448,6 +1448,27 @@ class TestTriggerRuleDep:
             expected_ti_state=expected_ti_state,
         )
 
+    def test_upstream_counts_are_shared_by_expanded_tis(self, session, get_mapped_task_dagrun):
+        """The expanded tis of a task outside mapped task groups share one upstream count per context."""
+        dr, task, _ = get_mapped_task_dagrun(state=FAILED)
+        tis = sorted(
+            (ti for ti in dr.get_task_instances(session=session) if ti.task_id == "do_something_else"),
+            key=lambda ti: ti.map_index,
+        )
+        assert len(tis) == 5
+        dep_context = DepContext(flag_upstream_failed=False)
+
+        with mock.patch.object(session, "execute", wraps=session.execute) as mock_execute:
+            for ti in tis:
+                ti.task = task
+                (status,) = TriggerRuleDep()._evaluate_trigger_rule(
+                    ti=ti, dep_context=dep_context, session=session
+                )
+                assert not status.passed
+                assert "found 3 non-success(es)" in status.reason
+
+        assert mock_execute.call_count == 1
+
     @pytest.mark.flaky(reruns=3, reruns_delay=1)
     @pytest.mark.parametrize("flag_upstream_failed", [True, False])
     def test_mapped_task_upstream_removed_with_all_failed_trigger_rules(
@@ -0,0 +1,77 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest import mock
+
+from sqlalchemy import create_engine, text
+
+from airflow.utils.scheduler_loop_profiler import SchedulerLoopProfiler
+
+
+class TestSchedulerLoopProfiler:
+    def test_disabled_profiler_records_nothing(self):
+        profiler = SchedulerLoopProfiler(enabled=False)
+        with profiler.phase("do_scheduling"):
+            pass
+        assert profiler.totals == {}
+
+    @mock.patch("airflow.utils.scheduler_loop_profiler.stats")
+    def test_queries_are_attributed_to_innermost_phase(self, mock_stats):
+        engine = create_engine("sqlite://")
+        profiler = SchedulerLoopProfiler(enabled=True)
+        profiler.install(engine)
+        try:
+            with engine.connect() as conn:
+                with profiler.phase("do_scheduling"):
+                    conn.execute(text("SELECT 1"))
+                    with profiler.phase("critical_section"):
+                        conn.execute(text("SELECT 1"))
+                        conn.execute(text("SELECT 1"))
+                # Queries outside a phase are not counted anywhere
+                conn.execute(text("SELECT 1"))
+        finally:
+            profiler.uninstall()
+
+        assert profiler.totals["do_scheduling"].queries == 1
+        assert profiler.totals["critical_section"].queries == 2
+        assert profiler.totals["do_scheduling"].wall_time >= profiler.totals["critical_section"].wall_time
+        mock_stats.incr.assert_any_call("scheduler.loop_phase_queries", 2, tags={"phase": "critical_section"})
+        assert {call.args[0] for call in mock_stats.timing.call_args_list} == {
+            "scheduler.loop_phase_duration",
+            "scheduler.loop_phase_db_duration",
+        }
+
+        report = profiler.report()
+        assert "critical_section" in report
+        assert "do_scheduling" in report
+
+    @mock.patch("airflow.utils.scheduler_loop_profiler.SAMPLING_INTERVAL", 0.001)
+    def test_sampling_profile_writes_folded_stacks(self, tmp_path):
+        profiler = SchedulerLoopProfiler(enabled=False, sampling_duration=0.05, output_dir=str(tmp_path))
+
+        assert profiler.start_sampling()
+        assert not profiler.start_sampling()
+        profiler._sampler.join()
+
+        (profile,) = tmp_path.glob("scheduler_profile_*.folded")
+        lines = profile.read_text().splitlines()
+        assert lines
+        stack, count = lines[0].rsplit(" ", 1)
+        assert int(count) > 0
+        assert "test_sampling_profile_writes_folded_stacks" in stack
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import datetime
+import time
+from unittest import mock
+
+import rich_click as click
+from sqlalchemy import delete, func, select
+
+DAG_ID = "perf_backfill_creation"
+
+
+def create_dag(num_tasks: int, start_date: datetime.datetime):
+    """Create and serialize an hourly Dag with ``num_tasks`` tasks."""
+    from airflow.providers.standard.operators.empty import EmptyOperator
+    from airflow.sdk import DAG
+
+    from tests_common.test_utils.dag import sync_dag_to_db
+
+    with DAG(DAG_ID, schedule="@hourly", start_date=start_date, catchup=False) as dag:
+        for i in range(num_tasks):
+            EmptyOperator(task_id=f"task_{i}")
+    sync_dag_to_db(dag)
+
+
+def reset_runs(session) -> None:
+    """Delete the backfills and Dag runs of the benchmarked Dag."""
+    from airflow.models.backfill import Backfill
+    from airflow.models.dagrun import DagRun
+
+    session.execute(delete(DagRun).where(DagRun.dag_id == DAG_ID))
+    session.execute(delete(Backfill).where(Backfill.dag_id == DAG_ID))
+
+
+def create_backfill(from_date: datetime.datetime, to_date: datetime.datetime) -> float:
+    """Create a backfill of the benchmarked Dag, and return how many seconds it took."""
+    from airflow.models.backfill import _create_backfill
+
+    start = time.perf_counter()
+    _create_backfill(
+        dag_id=DAG_ID,
+        from_date=from_date,
+        to_date=to_date,
+        max_active_runs=10,
+        reverse=False,
+        dag_run_conf=None,
+        triggering_user_name="perf",
+    )
+    return time.perf_counter() - start
+
+
+@click.command()
+@click.option("--num-runs", default=50_000, help="number of hourly Dag runs in the backfill")
+@click.option("--num-tasks", default=5, help="number of tasks of the Dag")
+@click.option(
+    "--one-at-a-time/--no-one-at-a-time",
+    default=True,
+    help="also create the backfill one run at a time, which is how backfills used to be created",
+)
+def main(num_runs, num_tasks, one_at_a_time):
+    """
+    Measure how long it takes to create a backfill with many Dag runs.
+
+    A Dag with an hourly schedule is serialized to the configured metadata database, then a backfill of
+    ``--num-runs`` runs is created in bulk and, unless disabled, one run at a time. The runs and backfills
+    of the Dag are deleted before each measurement.
+    """
+    from airflow.models.dagrun import DagRun
+    from airflow.utils.session import create_session
+
+    to_date = datetime.datetime.now(tz=datetime.timezone.utc).replace(minute=0, second=0, microsecond=0)
+    to_date -= datetime.timedelta(hours=2)
+    from_date = to_date - datetime.timedelta(hours=num_runs - 1)
+    create_dag(num_tasks, start_date=from_date)
+
+    modes = {"bulk": None}
+    if one_at_a_time:
+        modes["one at a time"] = mock.patch(
+            "airflow.models.backfill._create_backfill_dag_runs_in_bulk", return_value=False
+        )
+    for mode, patch in modes.items():
+        with create_session() as session:
+            reset_runs(session)
+        if patch is None:
+            elapsed = create_backfill(from_date, to_date)
+        else:
+            with patch:
+                elapsed = create_backfill(from_date, to_date)
+        with create_session() as session:
+            created = session.scalar(select(func.count()).where(DagRun.dag_id == DAG_ID))
+            reset_runs(session)
+        click.echo(f"{mode:>14}: {created} runs in {elapsed:.1f}s ({created / elapsed:,.0f} runs/s)")
+
+
+if __name__ == "__main__":
+    main()
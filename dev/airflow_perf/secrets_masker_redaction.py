@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import random
+import re
+import statistics
+import string
+import time
+
+import rich_click as click
+
+from airflow._shared.secrets_masker import SecretsMasker
+
+
+def _random_secret(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_letters + string.digits, k=rng.randint(12, 40)))
+
+
+def _log_lines(rng: random.Random, secrets: list[str], num_lines: int, secret_ratio: float) -> list[str]:
+    words = ["INFO", "task", "running", "connection", "host=db.example.com", "rows", "42", "done", "sql"]
+    lines = []
+    for _ in range(num_lines):
+        line = [rng.choice(words) for _ in range(rng.randint(8, 20))]
+        if rng.random() < secret_ratio:
+            line.insert(rng.randrange(len(line)), rng.choice(secrets))
+        lines.append(" ".join(line))
+    return lines
+
+
+def _time_it(func, lines: list[str], repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for line in lines:
+            func(line)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+@click.command()
+@click.option("--num-lines", default=20_000, help="number of log lines redacted per run")
+@click.option("--repeat", default=5, help="number of times to run each measurement, to reduce variance")
+@click.option("--secret-ratio", default=0.05, help="fraction of the log lines containing a secret")
+@click.option("--seed", default=0, help="seed of the generated secrets and log lines")
+@click.argument("secret_counts", type=int, nargs=-1)
+def main(num_lines, repeat, secret_ratio, seed, secret_counts):
+    """
+    Measure how many log lines per second the secrets masker redacts, depending on the number of secrets.
+
+    For each number of secrets given (10, 100 and 1000 by default), the same generated log lines are
+    redacted by a SecretsMasker masking that many secrets, and by one matching them with a single regular
+    expression alternating between all the secrets, which is how secrets used to be matched.
+    """
+    rng = random.Random(seed)
+    click.echo(f"{'secrets':>8} {'masker lines/s':>16} {'alternation lines/s':>20} {'speedup':>8}")
+    for count in secret_counts or (10, 100, 1000):
+        secrets = [_random_secret(rng) for _ in range(count)]
+        lines = _log_lines(rng, secrets, num_lines, secret_ratio)
+
+        masker = SecretsMasker()
+        for secret in secrets:
+            masker.add_mask(secret)
+        # The same masker, but matching the secrets the way it used to
+        alternation = SecretsMasker()
+        alternation.replacer = re.compile("|".join(re.escape(secret) for secret in secrets))  # type: ignore[assignment]
+
+        if any(masker.redact(line) != alternation.redact(line) for line in lines):
+            raise click.ClickException("The masker and the alternation redacted the log lines differently")
+
+        masker_time = statistics.median(_time_it(masker.redact, lines, repeat))
+        alternation_time = statistics.median(_time_it(alternation.redact, lines, repeat))
+        click.echo(
+            f"{count:>8} {num_lines / masker_time:>16,.0f} {num_lines / alternation_time:>20,.0f} "
+            f"{alternation_time / masker_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
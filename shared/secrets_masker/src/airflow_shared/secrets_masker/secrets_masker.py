@@ -186,10 +186,110 @@ def _get_v1_env_var_type_cached() -> type:
         return type("V1EnvVar", (), {})
 
 
+class _SecretMatcher:
+    """
+    Find and replace any of a set of secrets in strings.
+
+    Matching the secrets with a plain alternation (``secret1|secret2|...``) makes the regular expression
+    engine try every secret at every position of the string, so the time it takes grows with the number of
+    secrets. Here the secrets are kept in a trie, that a secret is added to in time proportional to its
+    length, and the trie is compiled into a regular expression in which secrets sharing a prefix share a
+    branch: at each position the engine only follows the branch of the next character, like an Aho-Corasick
+    automaton does. Where secrets overlap, the longest one is replaced.
+
+    The expression is compiled lazily, the first time it's needed after secrets were added, so adding many
+    secrets in a row only compiles it once.
+    """
+
+    _END = ""
+    """Key marking the end of a secret in a trie node; characters are never empty."""
+
+    def __init__(self) -> None:
+        self._trie: dict[str, Any] = {}
+        self._count = 0
+        self._min_length = sys.maxsize
+        self._compiled: Pattern | None = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, secret: str) -> bool:
+        """Add a secret to match, returning whether it's new."""
+        node = self._trie
+        for char in secret:
+            node = node.setdefault(char, {})
+        if self._END in node:
+            return False
+        node[self._END] = True
+        self._count += 1
+        self._min_length = min(self._min_length, len(secret))
+        self._compiled = None
+        return True
+
+    @property
+    def regex(self) -> Pattern:
+        """The regular expression matching any of the secrets."""
+        if self._compiled is None:
+            try:
+                self._compiled = re.compile(self._to_regex(self._trie))
+            except (RecursionError, re.error):
+                # A trie too deep for the regular expression compiler; fall back to an alternation that
+                # still prefers the longest secret.
+                self._compiled = re.compile(
+                    "|".join(re.escape(secret) for secret in sorted(self._secrets(), key=len, reverse=True))
+                )
+        return self._compiled
+
+    @property
+    def pattern(self) -> str:
+        return self.regex.pattern
+
+    def search(self, string: str) -> re.Match | None:
+        if len(string) < self._min_length:
+            return None
+        return self.regex.search(string)
+
+    def sub(self, replacement: str, string: str) -> str:
+        # Cheap check for the strings too short to hold any secret, such as most values in structured logs
+        if len(string) < self._min_length:
+            return string
+        return self.regex.sub(replacement, string)
+
+    def _to_regex(self, node: dict[str, Any]) -> str:
+        branches = []
+        for first, child in sorted(node.items()):
+            if first == self._END:
+                continue
+            # Collapse chains of single children into a literal
+            chars, rest = [first], child
+            while len(rest) == 1 and self._END not in rest:
+                ((char, rest),) = rest.items()
+                chars.append(char)
+            branches.append(re.escape("".join(chars)) + self._to_regex(rest))
+        if not branches:
+            return ""
+        if self._END in node:
+            # Greedy, so the longer secret is preferred over the one ending here
+            return f"(?:{'|'.join(branches)})?"
+        if len(branches) == 1:
+            return branches[0]
+        return f"(?:{'|'.join(branches)})"
+
+    def _secrets(self) -> Iterator[str]:
+        stack: list[tuple[str, dict[str, Any]]] = [("", self._trie)]
+        while stack:
+            prefix, node = stack.pop()
+            for char, child in node.items():
+                if char == self._END:
+                    yield prefix
+                else:
+                    stack.append((prefix + char, child))
+
+
 class SecretsMasker(logging.Filter):
     """Redact secrets from logs."""
 
-    replacer: Pattern | None = None
+    replacer: _SecretMatcher | None = None
     patterns: set[str]
 
     ALREADY_FILTERED_FLAG = "__SecretsMasker_filtered"
@@ -603,7 +703,6 @@ class SecretsMasker(logging.Filter):
                     SecretsMasker._has_warned_short_secret = True
                 return
 
-            new_mask = False
             for s in self._adaptations(secret):
                 if s:
                     if len(s) < min_length:
@@ -615,9 +714,9 @@ class SecretsMasker(logging.Filter):
                     pattern = re.escape(s)
                     if pattern not in self.patterns and (not name or self.should_hide_value_for_key(name)):
                         self.patterns.add(pattern)
-                        new_mask = True
-            if new_mask:
-                self.replacer = re.compile("|".join(self.patterns))
+                        if self.replacer is None:
+                            self.replacer = _SecretMatcher()
+                        self.replacer.add(s)
 
         elif isinstance(secret, collections.abc.Iterable):
             for v in secret:
@@ -1165,6 +1165,27 @@ class TestEdgeCases:
         assert redacted.startswith("Contains ")
         assert " and " in redacted
 
+    def test_overlapping_secrets_mask_the_longest(self):
+        secrets_masker = SecretsMasker()
+        configure_secrets_masker_for_test(secrets_masker)
+
+        for secret in ["abcdef", "abcdefgh", "abc12", "xabcd"]:
+            secrets_masker.add_mask(secret)
+
+        assert secrets_masker.redact("abcdefgh abcdef abc12 abc xabcdefgh") == "*** *** *** abc ***efgh"
+
+    def test_many_secrets(self):
+        secrets = [f"secret-{i:04d}-value" for i in range(1000)]
+
+        secrets_masker = SecretsMasker()
+        configure_secrets_masker_for_test(secrets_masker)
+        for secret in secrets:
+            secrets_masker.add_mask(secret)
+
+        assert len(secrets_masker.replacer) == 1000
+        assert secrets_masker.redact(" ".join(secrets[::-7])) == " ".join(["***"] * len(secrets[::-7]))
+        assert secrets_masker.redact("secret-1000-value secret-0999") == "secret-1000-value secret-0999"
+
 
 class TestDirectMethodCalls:
     def test_redact_all_directly(self):
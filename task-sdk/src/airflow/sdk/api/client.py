@@ -70,6 +70,9 @@ from airflow.sdk.api.datamodels._generated import (
     TaskStoreResponse,
     TerminalStateNonSuccess,
     TIAwaitingInputStatePayload,
+    TIBulkHeartbeatItem,
+    TIBulkHeartbeatPayload,
+    TIBulkHeartbeatResponse,
     TIDeferredStatePayload,
     TIEnterRunningPayload,
     TIHeartbeatInfo,
@@ -324,6 +327,12 @@ class TaskInstanceOperations:
         body = TIHeartbeatInfo(pid=pid, hostname=get_hostname())
         self.client.put(f"task-instances/{id}/heartbeat", content=body.model_dump_json())
 
+    def heartbeats(self, heartbeats: list[TIBulkHeartbeatItem]) -> TIBulkHeartbeatResponse:
+        """Send the heartbeats of several TIs, each with its own token, in a single request."""
+        body = TIBulkHeartbeatPayload(heartbeats=heartbeats)
+        resp = self.client.put("task-instances/heartbeats", content=body.model_dump_json())
+        return TIBulkHeartbeatResponse.model_validate_json(resp.read())
+
     def skip_downstream_tasks(self, id: uuid.UUID, msg: SkipDownstreamTasks):
         """Tell the API server to skip the downstream tasks of this TI."""
         body = TISkippedDownstreamTasksStatePayload(tasks=msg.tasks)
@@ -306,6 +306,51 @@ class TIHeartbeatInfo(BaseModel):
     pid: Annotated[int, Field(title="Pid")]
 
 
+class TIBulkHeartbeatItem(BaseModel):
+    """
+    The heartbeat of one TaskInstance, sent to the bulk heartbeat endpoint.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    hostname: Annotated[str, Field(title="Hostname")]
+    pid: Annotated[int, Field(title="Pid")]
+    id: Annotated[UUID, Field(title="Id")]
+    token: Annotated[str, Field(title="Token")]
+
+
+class TIBulkHeartbeatPayload(BaseModel):
+    """
+    Schema for the bulk TaskInstance heartbeat endpoint.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    heartbeats: Annotated[list[TIBulkHeartbeatItem], Field(title="Heartbeats")]
+
+
+class TIBulkHeartbeatResult(BaseModel):
+    """
+    What became of the heartbeat of one TaskInstance sent to the bulk heartbeat endpoint.
+
+    ``status_code`` and ``detail`` are what the heartbeat endpoint of the TaskInstance would have responded.
+    """
+
+    status_code: Annotated[int, Field(title="Status Code")]
+    detail: Annotated[dict[str, Any] | str | None, Field(title="Detail")] = None
+    refreshed_token: Annotated[str | None, Field(title="Refreshed Token")] = None
+
+
+class TIBulkHeartbeatResponse(BaseModel):
+    """
+    Response of the bulk TaskInstance heartbeat endpoint.
+    """
+
+    results: Annotated[dict[str, TIBulkHeartbeatResult], Field(title="Results")]
+
+
 class TIRescheduleStatePayload(BaseModel):
     """
     Schema for updating TaskInstance to a up_for_reschedule state.
@@ -25,6 +25,8 @@ from typing import TYPE_CHECKING, Any, Literal, TypeVar, overload
 import attrs
 import structlog
 
+from airflow.sdk.configuration import conf
+
 if TYPE_CHECKING:
     from airflow.sdk.definitions.xcom_arg import PlainXComArg
     from airflow.sdk.execution_time.task_runner import RuntimeTaskInstance
@@ -36,35 +38,96 @@ T = TypeVar("T")
 # {"value": value} dict since it wastes bandwidth.
 _XComWrapper = collections.namedtuple("_XComWrapper", "value")
 
+_MISSING = object()
+
 log = structlog.get_logger(logger_name=__name__)
 
 
 @attrs.define
 class LazyXComIterator(Iterator[T]):
+    """
+    Iterate over a :class:`LazyXComSequence`, fetching its values a page at a time.
+
+    Each page is fetched with a single slice request, so iterating over the return values of a task
+    mapped ``n`` ways takes ``n / page_size`` round trips to the API server instead of ``n``.
+    """
+
     seq: LazyXComSequence[T]
     index: int = 0
     dir: Literal[1, -1] = 1
+    page_size: int = attrs.field(factory=lambda: conf.getint("core", "xcom_sequence_page_size"))
+    _page: list[T] = attrs.field(factory=list, init=False)
+    _page_start: int = attrs.field(default=0, init=False)
+    _end: int | None = attrs.field(default=None, init=False)
 
     def __next__(self) -> T:
-        if self.index < 0:
-            # When iterating backwards, avoid extra HTTP request
+        if self.index < 0 or (self._end is not None and self.index >= self._end):
+            # When iterating backwards, or past the end of a page shorter than requested, avoid an extra
+            # HTTP request
             raise StopIteration()
-        try:
-            val = self.seq[self.index]
-        except IndexError:
-            raise StopIteration from None
+        if self.page_size <= 1:
+            try:
+                val = self.seq[self.index]
+            except IndexError:
+                raise StopIteration from None
+        elif self._page_start <= self.index < self._page_start + len(self._page):
+            val = self._page[self.index - self._page_start]
+        elif (val := self.seq._cache.get(self.index, _MISSING)) is _MISSING:
+            if not self._fetch_page():
+                raise StopIteration()
+            val = self._page[self.index - self._page_start]
         self.index += self.dir
         return val
 
+    def _fetch_page(self) -> bool:
+        """Fetch the page of values the next value is in, in the direction of iteration."""
+        if self.dir == 1:
+            start = self.index
+        else:
+            start = max(self.index - self.page_size + 1, 0)
+        self._page = self.seq._get_slice(start, start + self.page_size)
+        self._page_start = start
+        self.seq._cache.add(start, self._page)
+        if self.dir == 1 and len(self._page) < self.page_size:
+            self._end = start + len(self._page)
+        return self._page_start <= self.index < self._page_start + len(self._page)
+
     def __iter__(self) -> Iterator[T]:
         return self
 
 
+class _ValueCache(collections.OrderedDict):
+    """Deserialized values of a sequence by index, keeping at most ``maxsize`` of the last used ones."""
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+
+    def get(self, index: int, default: Any = None) -> Any:
+        if index not in self:
+            return default
+        self.move_to_end(index)
+        return self[index]
+
+    def add(self, start: int, values: Sequence[Any]) -> None:
+        if self.maxsize <= 0:
+            return
+        skip = max(len(values) - self.maxsize, 0)
+        for index, value in enumerate(values[skip:], start=start + skip):
+            self[index] = value
+            self.move_to_end(index)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
 @attrs.define
 class LazyXComSequence(Sequence[T]):
     _len: int | None = attrs.field(init=False, default=None)
     _xcom_arg: PlainXComArg = attrs.field(alias="xcom_arg")
     _ti: RuntimeTaskInstance = attrs.field(alias="ti")
+    _cache: _ValueCache = attrs.field(
+        init=False, factory=lambda: _ValueCache(conf.getint("core", "xcom_sequence_cache_size"))
+    )
 
     def __repr__(self) -> str:
         if self._len is not None:
@@ -119,36 +182,22 @@ class LazyXComSequence(Sequence[T]):
         from airflow.sdk.execution_time.comms import (
             ErrorResponse,
             GetXComSequenceItem,
-            GetXComSequenceSlice,
             XComSequenceIndexResult,
-            XComSequenceSliceResult,
         )
         from airflow.sdk.execution_time.task_runner import SUPERVISOR_COMMS
         from airflow.sdk.execution_time.xcom import XCom
 
         if isinstance(key, slice):
-            start, stop, step = _coerce_slice(key)
-            source = (xcom_arg := self._xcom_arg).operator
-            msg = SUPERVISOR_COMMS.send(
-                GetXComSequenceSlice(
-                    key=xcom_arg.key,
-                    dag_id=source.dag_id,
-                    task_id=source.task_id,
-                    run_id=self._ti.run_id,
-                    start=start,
-                    stop=stop,
-                    step=step,
-                ),
-            )
-            if not isinstance(msg, XComSequenceSliceResult):
-                raise TypeError(f"Got unexpected response to GetXComSequenceSlice: {msg!r}")
-            return [XCom.deserialize_value(_XComWrapper(value)) for value in msg.root]
+            return self._get_slice(*_coerce_slice(key))
 
         if not isinstance(key, int):
             if (index := getattr(key, "__index__", None)) is not None:
                 key = index()
             raise TypeError(f"Sequence indices must be integers or slices not {type(key).__name__}")
 
+        if (cached := self._cache.get(key, _MISSING)) is not _MISSING:
+            return cached
+
         source = (xcom_arg := self._xcom_arg).operator
         msg = SUPERVISOR_COMMS.send(
             GetXComSequenceItem(
@@ -163,7 +212,31 @@ class LazyXComSequence(Sequence[T]):
             raise IndexError(key)
         if not isinstance(msg, XComSequenceIndexResult):
             raise TypeError(f"Got unexpected response to GetXComSequenceItem: {msg!r}")
-        return XCom.deserialize_value(_XComWrapper(msg.root))
+        value = XCom.deserialize_value(_XComWrapper(msg.root))
+        if key >= 0:
+            self._cache.add(key, [value])
+        return value
+
+    def _get_slice(self, start: int | None, stop: int | None, step: int | None = None) -> list[T]:
+        from airflow.sdk.execution_time.comms import GetXComSequenceSlice, XComSequenceSliceResult
+        from airflow.sdk.execution_time.task_runner import SUPERVISOR_COMMS
+        from airflow.sdk.execution_time.xcom import XCom
+
+        source = (xcom_arg := self._xcom_arg).operator
+        msg = SUPERVISOR_COMMS.send(
+            GetXComSequenceSlice(
+                key=xcom_arg.key,
+                dag_id=source.dag_id,
+                task_id=source.task_id,
+                run_id=self._ti.run_id,
+                start=start,
+                stop=stop,
+                step=step,
+            ),
+        )
+        if not isinstance(msg, XComSequenceSliceResult):
+            raise TypeError(f"Got unexpected response to GetXComSequenceSlice: {msg!r}")
+        return [XCom.deserialize_value(_XComWrapper(value)) for value in msg.root]
 
 
 def _coerce_slice_index(value: Any) -> int | None:
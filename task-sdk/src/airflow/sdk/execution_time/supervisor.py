@@ -36,6 +36,7 @@ from collections.abc import Callable, Generator
 from contextlib import contextmanager, suppress
 from datetime import datetime, timezone
 from http import HTTPStatus
+from multiprocessing import SimpleQueue
 from socket import socket, socketpair
 from typing import TYPE_CHECKING, Any, BinaryIO, ClassVar, NoReturn, TextIO, cast
 from urllib.parse import urlparse
@@ -49,12 +50,15 @@ import structlog
 from pydantic import BaseModel, TypeAdapter
 
 from airflow.sdk._shared.logging.structlog import reconfigure_logger
-from airflow.sdk.api.client import Client, ServerResponseError
+from airflow.sdk.api.client import BearerAuth, Client, ServerResponseError, get_hostname
 from airflow.sdk.api.datamodels._generated import (
     AssetResponse,
     ConnectionResponse,
     TaskInstance,
     TaskInstanceState,
+    TIBulkHeartbeatItem,
+    TIBulkHeartbeatResponse,
+    TIBulkHeartbeatResult,
 )
 from airflow.sdk.configuration import conf
 from airflow.sdk.exceptions import ErrorType
@@ -1274,6 +1278,145 @@ def _remote_logging_conn(client: Client):
         del client
 
 
+@attrs.define
+class HeartbeatChannel:
+    """
+    The end of a :class:`HeartbeatAgent` that the supervisors of one worker process submit heartbeats to.
+
+    The results the agent sends back are kept here until the supervisor of their task picks them up.
+    """
+
+    key: int
+    requests: SimpleQueue[tuple[int, TIBulkHeartbeatItem]]
+    results: SimpleQueue[tuple[UUID, TIBulkHeartbeatResult | Exception]]
+    _received: dict[UUID, TIBulkHeartbeatResult | Exception] = attrs.field(factory=dict, init=False)
+
+    def submit(self, id: UUID, pid: int, token: str) -> None:
+        """Hand the heartbeat of a task to the agent, to be sent with its next request."""
+        heartbeat = TIBulkHeartbeatItem(id=id, pid=pid, hostname=get_hostname(), token=token)
+        self.requests.put((self.key, heartbeat))
+
+    def pop_result(self, id: UUID) -> TIBulkHeartbeatResult | Exception | None:
+        """Return the result of the last heartbeat sent for a task, if one came back since the last call."""
+        while not self.results.empty():
+            ti_id, result = self.results.get()
+            self._received[ti_id] = result
+        return self._received.pop(id, None)
+
+    def discard(self, id: UUID) -> None:
+        """Forget the results of a task whose supervisor is done with it."""
+        self.pop_result(id)
+
+
+@attrs.define
+class HeartbeatAgent:
+    """
+    Send the heartbeats of the tasks supervised by several worker processes in a single request.
+
+    The agent runs in the process that starts the workers, and each worker gets a :class:`HeartbeatChannel`
+    from :meth:`connect` to submit the heartbeats of its tasks through. Every ``interval`` seconds a thread
+    sends all the heartbeats submitted since its last request together, and hands each result back to the
+    worker the heartbeat came from. Each heartbeat carries the token of its own task, so the server checks
+    them one by one.
+    """
+
+    server: str
+    interval: float
+    _requests: SimpleQueue[tuple[int, TIBulkHeartbeatItem]] = attrs.field(factory=SimpleQueue, init=False)
+    _results: dict[int, SimpleQueue[tuple[UUID, TIBulkHeartbeatResult | Exception]]] = attrs.field(
+        factory=dict, init=False
+    )
+    _next_key: int = attrs.field(default=0, init=False)
+    _lock: threading.Lock = attrs.field(factory=threading.Lock, init=False)
+    _stopped: threading.Event = attrs.field(factory=threading.Event, init=False)
+    _thread: threading.Thread | None = attrs.field(default=None, init=False)
+
+    def connect(self) -> HeartbeatChannel:
+        """Open a channel for a new worker process, to be passed to it when it is started."""
+        results: SimpleQueue[tuple[UUID, TIBulkHeartbeatResult | Exception]] = SimpleQueue()
+        with self._lock:
+            key, self._next_key = self._next_key, self._next_key + 1
+            self._results[key] = results
+        return HeartbeatChannel(key=key, requests=self._requests, results=results)
+
+    def disconnect(self, channel: HeartbeatChannel) -> None:
+        """Close the channel of a worker process that has exited."""
+        with self._lock:
+            results = self._results.pop(channel.key, None)
+        if results is not None:
+            results.close()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="heartbeat-agent", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            results, self._results = self._results, {}
+        for queue in results.values():
+            queue.close()
+        self._requests.close()
+
+    def _run(self) -> None:
+        client = Client(base_url=self.server, token="")
+        while not self._stopped.wait(self.interval):
+            try:
+                self.flush(client)
+            except Exception:
+                log.exception("Failed to send the heartbeats of the workers")
+
+    def flush(self, client: Client) -> None:
+        """Send the heartbeats submitted since the last request, if any."""
+        pending: dict[UUID, tuple[int, TIBulkHeartbeatItem]] = {}
+        while not self._requests.empty():
+            key, heartbeat = self._requests.get()
+            pending[heartbeat.id] = (key, heartbeat)
+        if not pending:
+            return
+
+        results: dict[UUID, TIBulkHeartbeatResult | Exception]
+        try:
+            response = self._send(client, [heartbeat for _, heartbeat in pending.values()])
+        except Exception as e:
+            # The exception goes to other processes, so only its message is sent along
+            results = dict.fromkeys(pending, RuntimeError(f"Failed to send the heartbeats: {e}"))
+        else:
+            results = {UUID(id): result for id, result in response.results.items()}
+
+        with self._lock:
+            for id, result in results.items():
+                if id in pending and (queue := self._results.get(pending[id][0])) is not None:
+                    queue.put((id, result))
+
+    @staticmethod
+    def _send(client: Client, heartbeats: list[TIBulkHeartbeatItem]) -> TIBulkHeartbeatResponse:
+        # Each heartbeat is authorized by its own token, so the request can be authenticated with the token
+        # of any of them; the next one is tried if the server doesn't accept it (e.g. it has expired)
+        for heartbeat in heartbeats[:-1]:
+            client.auth = BearerAuth(heartbeat.token)
+            try:
+                return client.task_instances.heartbeats(heartbeats)
+            except ServerResponseError as e:
+                if e.response.status_code not in {HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN}:
+                    raise
+        client.auth = BearerAuth(heartbeats[-1].token)
+        return client.task_instances.heartbeats(heartbeats)
+
+
+# The channel to the heartbeat agent of the worker process this supervisor runs in, if it has one
+_HEARTBEAT_CHANNEL: HeartbeatChannel | None = None
+
+
+def use_heartbeat_channel(channel: HeartbeatChannel | None) -> None:
+    """Make the supervisors in this process submit their heartbeats to a :class:`HeartbeatAgent`."""
+    global _HEARTBEAT_CHANNEL
+    _HEARTBEAT_CHANNEL = channel
+
+
 @attrs.define(kw_only=True)
 class ActivitySubprocess(WatchedSubprocess):
     client: Client
@@ -1296,6 +1439,8 @@ class ActivitySubprocess(WatchedSubprocess):
 
     _last_successful_heartbeat: float = attrs.field(default=0, init=False)
     _last_heartbeat_attempt: float = attrs.field(default=0, init=False)
+    # Whether a heartbeat was handed to the heartbeat agent and its result hasn't come back yet
+    _heartbeat_submitted: bool = attrs.field(default=False, init=False)
 
     _should_retry: bool = attrs.field(default=False, init=False)
     """Whether the task should retry or not as decided by the API server."""
@@ -1415,6 +1560,8 @@ class ActivitySubprocess(WatchedSubprocess):
             self._monitor_subprocess()
         finally:
             self.selector.close()
+            if _HEARTBEAT_CHANNEL is not None:
+                _HEARTBEAT_CHANNEL.discard(self.id)
             signal.signal(signal.SIGTERM, prev_sigterm)
             signal.signal(signal.SIGINT, prev_sigint)
 
@@ -1595,6 +1742,11 @@ class ActivitySubprocess(WatchedSubprocess):
 
     def _send_heartbeat_if_needed(self):
         """Send a heartbeat to the client if heartbeat interval has passed."""
+        channel = _HEARTBEAT_CHANNEL
+        if channel is not None and (result := channel.pop_result(self.id)) is not None:
+            self._heartbeat_submitted = False
+            self._handle_coalesced_heartbeat_result(result)
+
         # Respect the minimum interval between heartbeat attempts
         if (time.monotonic() - self._last_heartbeat_attempt) < MIN_HEARTBEAT_INTERVAL:
             return
@@ -1605,34 +1757,66 @@ class ActivitySubprocess(WatchedSubprocess):
             return
 
         self._last_heartbeat_attempt = time.monotonic()
+        if channel is not None:
+            if self._heartbeat_submitted:
+                self._handle_heartbeat_failures(
+                    RuntimeError("The heartbeat agent didn't send back the result of the previous heartbeat")
+                )
+            channel.submit(self.id, self._process.pid, getattr(self.client.auth, "token", "") or "")
+            self._heartbeat_submitted = True
+            return
         try:
             self.client.task_instances.heartbeat(self.id, pid=self._process.pid)
-            # Update the last heartbeat time on success
-            self._last_successful_heartbeat = time.monotonic()
-
-            # Reset the counter on success
-            self.failed_heartbeats = 0
+            self._on_heartbeat_success()
         except ServerResponseError as e:
             if e.response.status_code in {HTTPStatus.NOT_FOUND, HTTPStatus.GONE, HTTPStatus.CONFLICT}:
-                log.error(
-                    "Server indicated the task shouldn't be running anymore",
-                    detail=e.detail,
-                    status_code=e.response.status_code,
-                    ti_id=self.id,
-                )
-                self.process_log.error(
-                    "Server indicated the task shouldn't be running anymore. Terminating process",
-                    detail=e.detail,
-                )
-                self.kill(signal.SIGTERM, force=True)
-                self.process_log.error("Task killed!")
-                self._terminal_state = SERVER_TERMINATED
+                self._terminate_on_server_request(e.detail, e.response.status_code)
             else:
                 # If we get any other error, we'll just log it and try again next time
                 self._handle_heartbeat_failures(e)
         except Exception as e:
             self._handle_heartbeat_failures(e)
 
+    def _handle_coalesced_heartbeat_result(self, result: TIBulkHeartbeatResult | Exception):
+        """Act on the result of a heartbeat the heartbeat agent sent together with those of other tasks."""
+        if self._terminal_state:
+            return
+        if isinstance(result, Exception):
+            self._handle_heartbeat_failures(result)
+        elif result.status_code < 300:
+            self._on_heartbeat_success()
+            if result.refreshed_token:
+                log.debug("Execution API issued us a refreshed Task token", ti_id=self.id)
+                self.client.auth = BearerAuth(result.refreshed_token)
+        elif result.status_code in {HTTPStatus.NOT_FOUND, HTTPStatus.GONE, HTTPStatus.CONFLICT}:
+            self._terminate_on_server_request(result.detail, result.status_code)
+        else:
+            self._handle_heartbeat_failures(
+                RuntimeError(f"Server responded {result.status_code} to the heartbeat: {result.detail}")
+            )
+
+    def _on_heartbeat_success(self):
+        # Update the last heartbeat time on success
+        self._last_successful_heartbeat = time.monotonic()
+
+        # Reset the counter on success
+        self.failed_heartbeats = 0
+
+    def _terminate_on_server_request(self, detail: Any, status_code: int):
+        log.error(
+            "Server indicated the task shouldn't be running anymore",
+            detail=detail,
+            status_code=status_code,
+            ti_id=self.id,
+        )
+        self.process_log.error(
+            "Server indicated the task shouldn't be running anymore. Terminating process",
+            detail=detail,
+        )
+        self.kill(signal.SIGTERM, force=True)
+        self.process_log.error("Task killed!")
+        self._terminal_state = SERVER_TERMINATED
+
     def _handle_heartbeat_failures(self, exc: Exception):
         """Increment the failed heartbeats counter and kill the process if too many failures."""
         self.failed_heartbeats += 1
@@ -17,8 +17,12 @@
 
 from __future__ import annotations
 
+import contextlib
 import logging
 import shutil
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, ClassVar
 from urllib.parse import urlsplit
 
@@ -30,12 +34,20 @@ from airflow.sdk.io.stat import stat_result
 from airflow.sdk.io.store import attach
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from concurrent.futures import Executor, Future
+
     from fsspec import AbstractFileSystem
     from typing_extensions import Self
     from upath.types import JoinablePathLike
 
 log = logging.getLogger(__name__)
 
+# Copies between stores read files larger than this in ranges of this size, concurrently
+_COPY_BLOCK_SIZE = 8 * 1024 * 1024
+# Maximum number of ranges read ahead, and of files copied at once, by a copy between stores
+_COPY_MAX_CONCURRENCY = 8
+
 
 class _TrackingFileWrapper:
     """Wrapper that tracks file operations to intercept lineage."""
@@ -79,6 +91,45 @@ class _TrackingFileWrapper:
         self._obj.__exit__(exc_type, exc_val, exc_tb)
 
 
+class _RangeReader:
+    """
+    Read files in consecutive ranges, concurrently.
+
+    The ranges read but not consumed yet, across all the files read, are bounded by ``max_pending``.
+    """
+
+    def __init__(self, executor: Executor, max_pending: int):
+        self._executor = executor
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+    def iter_ranges(self, path: ObjectStoragePath, size: int, block_size: int) -> Iterator[bytes]:
+        pending: deque[Future[bytes]] = deque()
+
+        def _pop() -> bytes:
+            try:
+                return pending.popleft().result()
+            finally:
+                self._slots.release()
+
+        try:
+            for start in range(0, size, block_size):
+                # Only wait for a slot while none of the ranges of this file are pending, as the ranges of
+                # other files may hold all the slots
+                while not self._slots.acquire(blocking=not pending):
+                    yield _pop()
+                pending.append(
+                    self._executor.submit(
+                        path.fs.cat_file, path.path, start=start, end=min(start + block_size, size)
+                    )
+                )
+            while pending:
+                yield _pop()
+        finally:
+            for future in pending:
+                future.cancel()
+                self._slots.release()
+
+
 class ObjectStoragePath(ProxyUPath):
     """A path-like object for object storage."""
 
@@ -339,8 +390,19 @@ class ObjectStoragePath(ProxyUPath):
         """Size in bytes of the file at this path."""
         return self.fs.size(self.path)
 
-    def _cp_file(self, dst: ObjectStoragePath, **kwargs):
-        """Copy a single file from this path to another location by streaming the data."""
+    def _cp_file(
+        self,
+        dst: ObjectStoragePath,
+        size: int | None = None,
+        _range_reader: _RangeReader | None = None,
+        **kwargs,
+    ):
+        """
+        Copy a single file from this path to another location by streaming the data.
+
+        Files larger than a range are read in ranges concurrently, and written in order. The size of the
+        file is looked up unless it is given, e.g. from the listing of its directory.
+        """
         # create the directory or bucket if required
         if dst.key.endswith(self.sep) or not dst.key:
             dst.mkdir(exist_ok=True, parents=True)
@@ -348,10 +410,29 @@ class ObjectStoragePath(ProxyUPath):
         elif dst.is_dir():
             dst = dst / self.key
 
-        # streaming copy
-        with self.open("rb") as f1, dst.open("wb") as f2:
-            # make use of system dependent buffer size
-            shutil.copyfileobj(f1, f2, **kwargs)
+        if size is None and not kwargs:
+            size = self.size()
+        if not size or size <= _COPY_BLOCK_SIZE:
+            # streaming copy
+            with self.open("rb") as f1, dst.open("wb") as f2:
+                # make use of system dependent buffer size
+                shutil.copyfileobj(f1, f2, **kwargs)
+            return
+
+        from airflow.sdk.lineage import get_hook_lineage_collector
+
+        # ranges are not read through a tracked file object
+        get_hook_lineage_collector().add_input_asset(context=self, uri=str(self))
+        with contextlib.ExitStack() as stack:
+            if _range_reader is None:
+                executor = stack.enter_context(ThreadPoolExecutor(max_workers=_COPY_MAX_CONCURRENCY))
+                _range_reader = _RangeReader(executor, max_pending=_COPY_MAX_CONCURRENCY)
+            ranges = stack.enter_context(
+                contextlib.closing(_range_reader.iter_ranges(self, size, _COPY_BLOCK_SIZE))
+            )
+            with dst.open("wb") as f2:
+                for data in ranges:
+                    f2.write(data)
 
     def copy(self, dst: str | ObjectStoragePath, recursive: bool = False, **kwargs) -> None:  # type: ignore[override]
         """
@@ -400,25 +481,35 @@ class ObjectStoragePath(ProxyUPath):
 
             dst.mkdir(exist_ok=True, parents=True)
 
-            out = self.fs.expand_path(self.path, recursive=True, **kwargs)
-
-            for path in out:
-                # this check prevents one extra call to is_dir() as
-                # glob returns self as well
-                if path == self.path:
-                    continue
+            # the listing gives the size of each file, so that it does not have to be looked up file by file;
+            # directories are left out, empty directories will not be created
+            out = self.fs.find(self.path, withdirs=False, detail=True, **kwargs)
 
+            def _copy_file(path: str, info: dict[str, Any]) -> None:
                 src_obj = ObjectStoragePath(
                     path,
                     protocol=self.protocol,
                     conn_id=self.conn_id,
                 )
-
-                # skip directories, empty directories will not be created
-                if src_obj.is_dir():
-                    continue
-
-                src_obj._cp_file(dst)
+                src_obj._cp_file(dst, size=info.get("size") or 0, _range_reader=range_reader)
+
+            # files are copied concurrently, and the ranges of large files are read from a shared pool
+            with (
+                ThreadPoolExecutor(max_workers=_COPY_MAX_CONCURRENCY) as files_executor,
+                ThreadPoolExecutor(max_workers=_COPY_MAX_CONCURRENCY) as ranges_executor,
+            ):
+                range_reader = _RangeReader(ranges_executor, max_pending=_COPY_MAX_CONCURRENCY)
+                futures = [
+                    files_executor.submit(_copy_file, path, info)
+                    for path, info in out.items()
+                    if path != self.path
+                ]
+                try:
+                    for future in futures:
+                        future.result()
+                finally:
+                    for future in futures:
+                        future.cancel()
             return
 
         # remote file -> remote dir
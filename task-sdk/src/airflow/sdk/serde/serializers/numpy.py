@@ -38,6 +38,7 @@ serializers = [
     "numpy.complex64",
     "numpy.bool",
     "numpy.bool_",
+    "numpy.ndarray",
 ]
 
 if TYPE_CHECKING:
@@ -78,6 +79,18 @@ def serialize(o: object) -> tuple[U, str, int, bool]:
     if isinstance(o, (np.float16, np.float32, np.float64, np.complex64, np.complex128)):
         return float(o), *metadata
 
+    if isinstance(o, np.ndarray):
+        import base64
+        from io import BytesIO
+
+        buf = BytesIO()
+        try:
+            # Arrays of Python objects would need pickle, which is not allowed
+            np.lib.format.write_array(buf, o, allow_pickle=False)
+        except ValueError:
+            return "", "", 0, False
+        return base64.b64encode(buf.getbuffer()).decode("ascii"), *metadata
+
     return "", "", 0, False
 
 
@@ -85,4 +98,14 @@ def deserialize(cls: type, version: int, data: str) -> Any:
     if version > __version__:
         raise TypeError("serialized version is newer than class version")
 
+    import numpy as np
+
+    if cls is np.ndarray:
+        import base64
+        from io import BytesIO
+
+        if not isinstance(data, str):
+            raise TypeError(f"serialized {qualname(cls)} has wrong data type {type(data)}")
+        return np.lib.format.read_array(BytesIO(base64.b64decode(data)), allow_pickle=False)
+
     return cls(data)
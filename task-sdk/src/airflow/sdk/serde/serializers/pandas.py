@@ -32,10 +32,13 @@ if TYPE_CHECKING:
 
     from airflow.sdk.serde import U
 
-__version__ = 1
+# Version 1 encoded the Parquet data in hexadecimal, version 2 in base64
+__version__ = 2
 
 
 def serialize(o: object) -> tuple[U, str, int, bool]:
+    import base64
+
     import pandas as pd
     import pyarrow as pa
     from pyarrow import parquet as pq
@@ -50,7 +53,10 @@ def serialize(o: object) -> tuple[U, str, int, bool]:
     buf = pa.BufferOutputStream()
     pq.write_table(table, buf, compression="snappy")
 
-    return buf.getvalue().hex().decode("utf-8"), qualname(o), __version__, True
+    # XCom values travel as JSON through the Execution API and are stored in a JSON column, so the
+    # Parquet data is carried as text, in base64 rather than hexadecimal to keep it small.
+    # Arrow buffers expose the buffer protocol, so they are encoded without being copied to bytes first
+    return base64.b64encode(buf.getvalue()).decode("ascii"), qualname(o), __version__, True
 
 
 def deserialize(cls: type, version: int, data: object) -> pd.DataFrame:
@@ -65,11 +71,10 @@ def deserialize(cls: type, version: int, data: object) -> pd.DataFrame:
     if not isinstance(data, str):
         raise TypeError(f"serialized {qualname(cls)} has wrong data type {type(data)}")
 
-    from io import BytesIO
+    import base64
 
+    import pyarrow as pa
     from pyarrow import parquet as pq
 
-    with BytesIO(bytes.fromhex(data)) as buf:
-        df = pq.read_table(buf).to_pandas()
-
-    return df
+    raw = bytes.fromhex(data) if version < 2 else base64.b64decode(data)
+    return pq.read_table(pa.BufferReader(raw)).to_pandas()
@@ -46,6 +46,7 @@ from airflow.sdk.api.datamodels._generated import (
     HITLUser,
     TaskStoreResponse,
     TerminalTIState,
+    TIBulkHeartbeatItem,
     VariableResponse,
     XComResponse,
 )
@@ -441,6 +442,34 @@ class TestTaskInstanceOperations:
         client = make_client(transport=httpx.MockTransport(handle_request))
         client.task_instances.heartbeat(ti_id, 100)
 
+    def test_task_instance_bulk_heartbeat(self):
+        ti_ids = [uuid6.uuid7(), uuid6.uuid7()]
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/task-instances/heartbeats":
+                actual_body = json.loads(request.read())
+                assert [hb["token"] for hb in actual_body["heartbeats"]] == ["token-1", "token-2"]
+                return httpx.Response(
+                    status_code=200,
+                    json={
+                        "results": {
+                            str(ti_ids[0]): {"status_code": 204, "refreshed_token": "new-token"},
+                            str(ti_ids[1]): {"status_code": 409, "detail": {"reason": "not_running"}},
+                        }
+                    },
+                )
+            return httpx.Response(status_code=400, json={"detail": "Bad Request"})
+
+        client = make_client(transport=httpx.MockTransport(handle_request))
+        response = client.task_instances.heartbeats(
+            [
+                TIBulkHeartbeatItem(id=ti_id, hostname="host", pid=100 + i, token=f"token-{i + 1}")
+                for i, ti_id in enumerate(ti_ids)
+            ]
+        )
+        assert response.results[str(ti_ids[0])].refreshed_token == "new-token"
+        assert response.results[str(ti_ids[1])].status_code == 409
+
     @pytest.mark.parametrize("queues_enabled", [False, True])
     def test_task_instance_defer(self, queues_enabled: bool):
         # Simulate a successful response from the server that defers a task
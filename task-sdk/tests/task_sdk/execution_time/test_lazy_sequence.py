@@ -17,7 +17,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import Mock, call
+from unittest.mock import Mock
 
 import pytest
 
@@ -76,33 +76,53 @@ def test_len(mock_supervisor_comms, lazy_sequence):
 def test_iter(mock_supervisor_comms, lazy_sequence):
     it = iter(lazy_sequence)
 
+    mock_supervisor_comms.send.return_value = XComSequenceSliceResult(root=["f"])
+    assert list(it) == ["f"]
+    # A page shorter than requested is the last one, no request is needed to find out
+    mock_supervisor_comms.send.assert_called_once_with(
+        GetXComSequenceSlice(
+            key=BaseXCom.XCOM_RETURN_KEY,
+            dag_id="dag",
+            task_id="task",
+            run_id="run",
+            start=0,
+            stop=100,
+            step=None,
+        ),
+    )
+
+
+@conf_vars({("core", "xcom_sequence_page_size"): "2", ("core", "xcom_sequence_cache_size"): "3"})
+def test_iter_fetches_pages(mock_supervisor_comms, mock_xcom_arg, mock_ti):
+    lazy_sequence = LazyXComSequence(mock_xcom_arg, mock_ti)
+    mock_supervisor_comms.send.side_effect = [
+        XComSequenceSliceResult(root=["a", "b"]),
+        XComSequenceSliceResult(root=["c", "d"]),
+        XComSequenceSliceResult(root=["e"]),
+    ]
+    assert list(iter(lazy_sequence)) == ["a", "b", "c", "d", "e"]
+    assert [c.args[0].start for c in mock_supervisor_comms.send.call_args_list] == [0, 2, 4]
+
+    # The last values read are cached; the others are fetched again
+    mock_supervisor_comms.send.reset_mock()
+    assert lazy_sequence[4] == "e"
+    mock_supervisor_comms.send.assert_not_called()
+    mock_supervisor_comms.send.side_effect = [XComSequenceSliceResult(root=["a", "b"])]
+    assert next(iter(lazy_sequence)) == "a"
+    mock_supervisor_comms.send.assert_called_once()
+
+
+@conf_vars({("core", "xcom_sequence_page_size"): "1"})
+def test_iter_item_by_item(mock_supervisor_comms, lazy_sequence):
     mock_supervisor_comms.send.side_effect = [
         XComSequenceIndexResult(root="f"),
         ErrorResponse(error=ErrorType.XCOM_NOT_FOUND, detail={"oops": "sorry!"}),
     ]
-    assert list(it) == ["f"]
-    mock_supervisor_comms.send.assert_has_calls(
-        [
-            call(
-                msg=GetXComSequenceItem(
-                    key=BaseXCom.XCOM_RETURN_KEY,
-                    dag_id="dag",
-                    task_id="task",
-                    run_id="run",
-                    offset=0,
-                ),
-            ),
-            call(
-                msg=GetXComSequenceItem(
-                    key=BaseXCom.XCOM_RETURN_KEY,
-                    dag_id="dag",
-                    task_id="task",
-                    run_id="run",
-                    offset=1,
-                ),
-            ),
-        ]
-    )
+    assert list(iter(lazy_sequence)) == ["f"]
+    assert [type(c.args[0]) for c in mock_supervisor_comms.send.call_args_list] == [
+        GetXComSequenceItem,
+        GetXComSequenceItem,
+    ]
 
 
 def test_getitem_index(mock_supervisor_comms, lazy_sequence):
@@ -56,7 +56,7 @@ from uuid6 import uuid7
 from airflow.executors.workloads import BundleInfo
 from airflow.sdk import DAG, BaseOperator, timezone
 from airflow.sdk.api import client as sdk_client
-from airflow.sdk.api.client import ServerResponseError
+from airflow.sdk.api.client import BearerAuth, ServerResponseError
 from airflow.sdk.api.datamodels._generated import (
     AssetEventResponse,
     AssetProfile,
@@ -67,6 +67,7 @@ from airflow.sdk.api.datamodels._generated import (
     PreviousTIResponse,
     TaskInstance,
     TaskInstanceState,
+    TIBulkHeartbeatResponse,
 )
 from airflow.sdk.exceptions import AirflowRuntimeError, ErrorType, TaskAlreadyRunningError
 from airflow.sdk.execution_time import supervisor, task_runner
@@ -1122,6 +1123,83 @@ class TestWatchedSubprocess:
             "loc": mocker.ANY,
         } in captured_logs
 
+    def test_heartbeats_through_agent(self, monkeypatch, mocker):
+        """The heartbeats of supervisors in several workers go in one request, and each acts on its result."""
+        agent = supervisor.HeartbeatAgent(server="http://localhost", interval=1)
+        mock_kill = mocker.patch("airflow.sdk.execution_time.supervisor.WatchedSubprocess.kill")
+
+        procs = []
+        for pid, token in ((100, "token-1"), (101, "token-2")):
+            client = mocker.Mock()
+            client.auth = BearerAuth(token)
+            proc = ActivitySubprocess(
+                process_log=mocker.MagicMock(),
+                id=uuid7(),
+                pid=pid,
+                stdin=mocker.MagicMock(),
+                client=client,
+                process=mocker.Mock(pid=pid),
+            )
+            procs.append((proc, agent.connect()))
+        (running, running_channel), (finished, finished_channel) = procs
+
+        for proc, channel in procs:
+            monkeypatch.setattr(supervisor, "_HEARTBEAT_CHANNEL", channel)
+            proc._send_heartbeat_if_needed()
+            proc.client.task_instances.heartbeat.assert_not_called()
+
+        agent_client = mocker.Mock()
+        agent_client.task_instances.heartbeats.return_value = TIBulkHeartbeatResponse(
+            results={
+                str(running.id): {"status_code": 204, "refreshed_token": "refreshed-token"},
+                str(finished.id): {"status_code": 409, "detail": {"reason": "not_running"}},
+            }
+        )
+        agent.flush(agent_client)
+        (heartbeats,) = agent_client.task_instances.heartbeats.call_args.args
+        assert [(hb.id, hb.pid, hb.token) for hb in heartbeats] == [
+            (running.id, 100, "token-1"),
+            (finished.id, 101, "token-2"),
+        ]
+        assert agent_client.auth.token == "token-1"
+
+        for proc, channel in procs:
+            monkeypatch.setattr(supervisor, "_HEARTBEAT_CHANNEL", channel)
+            proc._send_heartbeat_if_needed()
+        assert running.failed_heartbeats == 0
+        assert running.client.auth.token == "refreshed-token"
+        assert running._terminal_state is None
+        assert finished._terminal_state == supervisor.SERVER_TERMINATED
+        mock_kill.assert_called_once_with(signal.SIGTERM, force=True)
+        agent.stop()
+
+    def test_heartbeat_agent_tries_the_next_token(self, mocker):
+        """The bulk request is authenticated with the token of the next heartbeat when one is rejected."""
+        agent = supervisor.HeartbeatAgent(server="http://localhost", interval=1)
+        channel = agent.connect()
+        ids = [uuid7(), uuid7()]
+        channel.submit(ids[0], 100, "expired-token")
+        channel.submit(ids[1], 101, "valid-token")
+
+        agent_client = mocker.Mock()
+        tokens = []
+
+        def heartbeats(heartbeats):
+            tokens.append(agent_client.auth.token)
+            if agent_client.auth.token == "expired-token":
+                raise ServerResponseError(
+                    message="Invalid auth token", request=mocker.Mock(), response=mocker.Mock(status_code=403)
+                )
+            return TIBulkHeartbeatResponse(results={str(id): {"status_code": 204} for id in ids})
+
+        agent_client.task_instances.heartbeats.side_effect = heartbeats
+        agent.flush(agent_client)
+
+        assert tokens == ["expired-token", "valid-token"]
+        assert channel.pop_result(ids[0]).status_code == 204
+        assert channel.pop_result(ids[1]).status_code == 204
+        agent.stop()
+
     @pytest.mark.parametrize(
         ("terminal_state", "task_end_time_monotonic", "overtime_threshold", "expected_kill"),
         [
@@ -503,6 +503,64 @@ class TestLocalPath:
         assert store == d
 
 
+class TestCrossStoreCopy:
+    @pytest.fixture(autouse=True)
+    def small_ranges(self):
+        with mock.patch("airflow.sdk.io.path._COPY_BLOCK_SIZE", 10):
+            yield
+
+    @pytest.fixture(autouse=True)
+    def stores(self):
+        cache = _STORE_CACHE.copy()
+        attach(protocol="ffs", fs=_FakeRemoteFileSystem())
+        attach(protocol="ffs2", fs=_FakeRemoteFileSystem())
+        yield
+        _STORE_CACHE.clear()
+        _STORE_CACHE.update(cache)
+        _FakeRemoteFileSystem.store.clear()
+        _FakeRemoteFileSystem.pseudo_dirs[:] = [""]
+
+    @pytest.fixture
+    def src(self):
+        return ObjectStoragePath(f"ffs://src-{uuid.uuid4()}")
+
+    @pytest.fixture
+    def dst(self):
+        return ObjectStoragePath(f"ffs2://dst-{uuid.uuid4()}/")
+
+    def test_copy_file_in_ranges(self, src, dst):
+        data = bytes(range(256)) * 4
+        src_file = src / "file"
+        src_file.write_bytes(data)
+
+        with mock.patch.object(src_file.fs, "cat_file", wraps=src_file.fs.cat_file) as cat_file:
+            src_file.copy(dst)
+
+        assert (dst / src_file.key).read_bytes() == data
+        assert cat_file.call_count == 103
+
+    def test_copy_dir(self, src, dst):
+        files = {"small": b"small", "large": b"large" * 100, "nested/large": b"nested" * 100, "empty": b""}
+        for key, data in files.items():
+            (src / key).write_bytes(data)
+
+        with mock.patch.object(src.fs, "size", wraps=src.fs.size) as size:
+            src.copy(dst, recursive=True)
+
+        assert {key: (dst / src.key / key).read_bytes() for key in files} == files
+        size.assert_not_called()
+
+    def test_copy_range_read_error(self, src, dst):
+        src_file = src / "file"
+        src_file.write_bytes(b"x" * 100)
+
+        with (
+            mock.patch.object(src_file.fs, "cat_file", side_effect=OSError("read failed")),
+            pytest.raises(OSError, match="read failed"),
+        ):
+            src.copy(dst, recursive=True)
+
+
 class TestBackwardsCompatibility:
     @pytest.fixture(autouse=True)
     def reset(self):
@@ -242,6 +242,23 @@ class TestSerializers:
         assert value == d
         assert type(value) is type(d)
 
+    @pytest.mark.parametrize(
+        "value",
+        [
+            np.array([1, 2, 3]),
+            np.arange(12, dtype=np.float32).reshape(3, 4),
+            np.array([[True, False]]),
+            np.array(["a", "bc"]),
+        ],
+    )
+    def test_numpy_array(self, value):
+        e = serialize(value)
+        assert isinstance(e, dict)
+        d = deserialize(e)
+        assert isinstance(d, np.ndarray)
+        assert d.dtype == value.dtype
+        np.testing.assert_array_equal(d, value)
+
     def test_numpy_serializers(self):
         from airflow.sdk.serde.serializers.numpy import serialize
 
@@ -253,7 +270,8 @@ class TestSerializers:
             assert serialize(np.float64(3.14)) == (float(np.float64(3.14)), "numpy.float64", 1, True)
         else:
             assert serialize(np.float32(3.14)) == (float(np.float32(3.14)), "numpy.float32", 1, True)
-        assert serialize(np.array([1, 2, 3])) == ("", "", 0, False)
+        assert serialize(np.array([1, 2, 3]))[1:] == ("numpy.ndarray", 1, True)
+        assert serialize(np.array([object()])) == ("", "", 0, False)
 
     @pytest.mark.parametrize(
         ("klass", "ver", "value", "msg"),
@@ -281,6 +299,18 @@ class TestSerializers:
         d = deserialize(e)
         assert i.equals(d)
 
+    def test_pandas_hex_encoded(self):
+        """Data frames serialized before base64 was used can still be deserialized."""
+        import pyarrow as pa
+        from pyarrow import parquet as pq
+
+        from airflow.sdk.serde.serializers.pandas import deserialize
+
+        i = pd.DataFrame(data={"col1": [1, 2], "col2": [3, 4]})
+        buf = pa.BufferOutputStream()
+        pq.write_table(pa.Table.from_pandas(i), buf, compression="snappy")
+        assert i.equals(deserialize(pd.DataFrame, 1, buf.getvalue().hex().decode("utf-8")))
+
     def test_pandas_serializers(self):
         from airflow.sdk.serde.serializers.pandas import serialize
 
@@ -289,7 +319,7 @@ class TestSerializers:
     @pytest.mark.parametrize(
         ("klass", "version", "data", "msg"),
         [
-            (pd.DataFrame, 999, "", r"serialized 999 of pandas.core.frame.DataFrame > 1"),  # version too new
+            (pd.DataFrame, 999, "", r"serialized 999 of pandas.core.frame.DataFrame > 2"),  # version too new
             (
                 pd.DataFrame,
                 1,